@@ -375,6 +375,27 @@ class Translator:
         translated_text = str(translation_result[0])
         return {"text": {source_language: text, target_language: translated_text}}
 
+    @method()
+    def translate_texts(
+        self, texts: list[str], source_language: str, target_language: str
+    ):
+        src_lang = self.get_seamless_lang_code(source_language)
+        tgt_lang = self.get_seamless_lang_code(target_language)
+        translations = []
+        # t2tt takes a single text: translate the batch one text at a time,
+        # holding the lock once for the whole batch
+        with self.lock:
+            for text in texts:
+                translation_result, _ = self.translator.predict(
+                    text,
+                    "t2tt",
+                    src_lang=src_lang,
+                    tgt_lang=tgt_lang,
+                    unit_generation_ngram_filtering=True,
+                )
+                translations.append(str(translation_result[0]))
+        return {"translations": translations}
+
 
 # -------------------------------------------------------------------
 # Web API
@@ -426,4 +447,22 @@ def web():
         result = func.get()
         return result
 
+    class TranslateBatchRequest(BaseModel):
+        texts: list[str]
+        source_language: str = "en"
+        target_language: str = "fr"
+
+    class TranslateBatchResponse(BaseModel):
+        translations: list[str]
+
+    @app.post("/translate/batch", dependencies=[Depends(apikey_auth)])
+    async def translate_batch(request: TranslateBatchRequest) -> TranslateBatchResponse:
+        func = translatorstub.translate_texts.spawn(
+            texts=request.texts,
+            source_language=request.source_language,
+            target_language=request.target_language,
+        )
+        result = func.get()
+        return result
+
     return app
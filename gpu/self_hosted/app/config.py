@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 SUPPORTED_FILE_EXTENSIONS = ["mp3", "mp4", "mpeg", "mpga", "m4a", "wav", "webm"]
@@ -8,5 +9,32 @@ VAD_CONFIG = {
     "window_size": 512,
 }
 
+# Windowed diarization: window and overlap in seconds (a window of 0
+# diarizes the whole file at once), and the max cosine distance between
+# speaker embeddings of two windows for them to be the same speaker
+DIARIZATION_CONFIG = {
+    "window": float(os.environ.get("DIARIZATION_WINDOW", "0")),
+    "overlap": float(os.environ.get("DIARIZATION_OVERLAP", "30")),
+    "stitch_threshold": 0.7,
+}
+
 # App-level paths
 UPLOADS_PATH = Path("/tmp/whisper-uploads")
+
+# Translation dynamic batching: texts per model call, and max seconds a text
+# waits for more texts of the same language pair
+TRANSLATION_BATCH_CONFIG = {
+    "max_batch_size": 32,
+    "max_wait": 0.02,
+}
+
+# Translation models cache: weights kept in memory across language pairs, and
+# pairs loaded at startup (e.g. "en-fr,fr-en")
+TRANSLATION_CACHE_MAX_BYTES = (
+    int(os.environ.get("TRANSLATION_CACHE_MAX_MB", "2048")) * 1024 * 1024
+)
+TRANSLATION_WARMUP_PAIRS = [
+    tuple(pair.strip().split("-", 1))
+    for pair in os.environ.get("TRANSLATION_WARMUP_PAIRS", "").split(",")
+    if pair.strip()
+]
@@ -2,9 +2,11 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from .config import TRANSLATION_WARMUP_PAIRS
 from .routers.diarization import router as diarization_router
 from .routers.transcription import router as transcription_router
 from .routers.translation import router as translation_router
+from .routers.translation import batcher, translator
 from .services.transcriber import WhisperService
 from .services.diarizer import PyannoteDiarizationService
 from .utils import ensure_dirs
@@ -19,7 +21,9 @@ async def lifespan(app: FastAPI):
     diarization_service = PyannoteDiarizationService()
     diarization_service.load()
     app.state.diarizer = diarization_service
+    translator.warmup(TRANSLATION_WARMUP_PAIRS)
     yield
+    await batcher.close()
 
 
 def create_app() -> FastAPI:
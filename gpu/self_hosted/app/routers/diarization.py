@@ -1,9 +1,10 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel
 
 from ..auth import apikey_auth
+from ..config import DIARIZATION_CONFIG
 from ..services.diarizer import PyannoteDiarizationService
 from ..utils import download_audio_file
 
@@ -23,8 +24,20 @@ class DiarizationResponse(BaseModel):
 @router.post(
     "/diarize", dependencies=[Depends(apikey_auth)], response_model=DiarizationResponse
 )
-def diarize(request: Request, audio_file_url: str, timestamp: float = 0.0):
+def diarize(
+    request: Request,
+    audio_file_url: str,
+    timestamp: float = 0.0,
+    window: float = DIARIZATION_CONFIG["window"],
+    overlap: float = DIARIZATION_CONFIG["overlap"],
+):
+    if window and not 0 <= overlap < window:
+        raise HTTPException(
+            status_code=400, detail="overlap must be at least 0 and below window"
+        )
     with download_audio_file(audio_file_url) as (file_path, _ext):
         file_path = str(file_path)
         diarizer: PyannoteDiarizationService = request.app.state.diarizer
-        return diarizer.diarize_file(file_path, timestamp=timestamp)
+        return diarizer.diarize_file(
+            file_path, timestamp=timestamp, window=window, overlap=overlap
+        )
@@ -1,4 +1,5 @@
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Union
 
 from fastapi import APIRouter, Body, Depends, Form, HTTPException, Request, UploadFile
@@ -71,19 +72,16 @@ def transcribe(
                 f.write(content)
             uploaded_paths.append(file_path)
 
-        if batch and len(upload_files) > 1:
-            results = []
-            for path in uploaded_paths:
-                result = service.transcribe_file(str(path), language=language)
-                result["filename"] = path.name
-                results.append(result)
-            return {"results": results}
-
-        results = []
-        for path in uploaded_paths:
+        def transcribe_path(path: Path) -> dict:
             result = service.transcribe_file(str(path), language=language)
             result["filename"] = path.name
-            results.append(result)
+            return result
+
+        # files wait for a model replica each, so they are transcribed in
+        # parallel up to the number of replicas
+        with service.admit():
+            with ThreadPoolExecutor(max_workers=service.num_workers) as executor:
+                results = list(executor.map(transcribe_path, uploaded_paths))
 
         return {"results": results} if len(results) > 1 else results[0]
 
@@ -101,9 +99,14 @@ def transcribe_from_url(
     timestamp_offset: float = Body(0.0),
 ):
     service = request.app.state.whisper
-    with download_audio_file(audio_file_url) as (file_path, _ext):
+    with service.admit(), download_audio_file(audio_file_url) as (file_path, _ext):
         file_path = str(file_path)
         result = service.transcribe_vad_url_segment(
             file_path=file_path, timestamp_offset=timestamp_offset, language=language
         )
         return result
+
+
+@router.get("/transcriptions/stats", dependencies=[Depends(apikey_auth)])
+def transcription_stats(request: Request):
+    return request.app.state.whisper.stats()
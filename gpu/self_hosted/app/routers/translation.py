@@ -1,28 +1,81 @@
 from typing import Dict
 
-from fastapi import APIRouter, Body, Depends
+from fastapi import APIRouter, Body, Depends, HTTPException
 from pydantic import BaseModel
 
 from ..auth import apikey_auth
-from ..services.translator import TextTranslatorService
+from ..config import TRANSLATION_BATCH_CONFIG
+from ..services.translator import TextTranslatorService, TranslationBatcher
 
 router = APIRouter(tags=["translation"])
 
 translator = TextTranslatorService()
+batcher = TranslationBatcher(translator, **TRANSLATION_BATCH_CONFIG)
+
+
+def check_language_pair(source_language: str, target_language: str):
+    if not translator.is_supported(source_language, target_language):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported language pair: {source_language}-{target_language}",
+        )
 
 
 class TranslationResponse(BaseModel):
     text: Dict[str, str]
 
 
+class TranslationCacheInfo(BaseModel):
+    hits: int
+    misses: int
+    evictions: int
+    pairs: list[str]
+    memory_bytes: int
+    max_bytes: int
+
+
+class TranslationBatchRequest(BaseModel):
+    texts: list[str]
+    source_language: str = "en"
+    target_language: str = "fr"
+
+
+class TranslationBatchResponse(BaseModel):
+    translations: list[str]
+
+
 @router.post(
     "/translate",
     dependencies=[Depends(apikey_auth)],
     response_model=TranslationResponse,
 )
-def translate(
+async def translate(
     text: str,
     source_language: str = Body("en"),
     target_language: str = Body("fr"),
 ):
-    return translator.translate(text, source_language, target_language)
+    check_language_pair(source_language, target_language)
+    [translated] = await batcher.translate([text], source_language, target_language)
+    return {"text": {source_language: text, target_language: translated}}
+
+
+@router.post(
+    "/translate/batch",
+    dependencies=[Depends(apikey_auth)],
+    response_model=TranslationBatchResponse,
+)
+async def translate_batch(request: TranslationBatchRequest):
+    check_language_pair(request.source_language, request.target_language)
+    translations = await batcher.translate(
+        request.texts, request.source_language, request.target_language
+    )
+    return {"translations": translations}
+
+
+@router.get(
+    "/translate/cache",
+    dependencies=[Depends(apikey_auth)],
+    response_model=TranslationCacheInfo,
+)
+def translate_cache():
+    return translator.cache_info()
@@ -5,11 +5,15 @@ import threading
 from pathlib import Path
 from urllib.request import urlopen
 
+import numpy as np
 import torch
 import torchaudio
 import yaml
 from pyannote.audio import Pipeline
 
+from ..config import DIARIZATION_CONFIG, SAMPLE_RATE
+from ..utils import stream_audio
+
 logger = logging.getLogger(__name__)
 
 S3_BUNDLE_URL = "https://reflector-public.s3.us-east-1.amazonaws.com/pyannote-speaker-diarization-3.1.tar.gz"
@@ -61,6 +65,75 @@ def _patch_config(model_dir: Path, cache_dir: Path) -> None:
     logger.info("Patched config.yaml with local model paths")
 
 
+class SpeakerStitcher:
+    """Map the speakers of each diarized window to speakers of the whole file.
+
+    A window speaker joins the closest known speaker by cosine distance of
+    their embeddings (each known speaker at most once per window), or becomes
+    a new one. Speakers without a usable embedding are matched by time
+    overlap with the previous window.
+    """
+
+    def __init__(self, threshold: float = DIARIZATION_CONFIG["stitch_threshold"]):
+        self.threshold = threshold
+        self.centroids: list[np.ndarray | None] = []
+
+    def assign(
+        self,
+        labels: list[str],
+        embeddings: np.ndarray,
+        tracks: list[tuple[float, float, str]],
+        previous: list[tuple[float, float, int]],
+    ) -> dict[str, int]:
+        mapping: dict[str, int] = {}
+        normalized = {}
+        for label, embedding in zip(labels, embeddings):
+            if not np.isnan(embedding).any():
+                normalized[label] = embedding / np.linalg.norm(embedding)
+
+        candidates = [
+            (1 - float(embedding @ centroid / np.linalg.norm(centroid)), label, index)
+            for label, embedding in normalized.items()
+            for index, centroid in enumerate(self.centroids)
+            if centroid is not None
+        ]
+        for distance, label, index in sorted(candidates, key=lambda c: c[0]):
+            if distance > self.threshold:
+                break
+            if label in mapping or index in mapping.values():
+                continue
+            mapping[label] = index
+            self.centroids[index] = self.centroids[index] + normalized[label]
+
+        for label in labels:
+            if label in mapping:
+                continue
+            if label not in normalized:
+                speaker = self._overlapping_speaker(label, tracks, previous)
+                if speaker is not None and speaker not in mapping.values():
+                    mapping[label] = speaker
+                    continue
+            self.centroids.append(normalized.get(label))
+            mapping[label] = len(self.centroids) - 1
+        return mapping
+
+    @staticmethod
+    def _overlapping_speaker(
+        label: str,
+        tracks: list[tuple[float, float, str]],
+        previous: list[tuple[float, float, int]],
+    ) -> int | None:
+        overlaps: dict[int, float] = {}
+        for start, end, track_label in tracks:
+            if track_label != label:
+                continue
+            for previous_start, previous_end, speaker in previous:
+                overlap = min(end, previous_end) - max(start, previous_start)
+                if overlap > 0:
+                    overlaps[speaker] = overlaps.get(speaker, 0.0) + overlap
+        return max(overlaps, key=overlaps.get) if overlaps else None
+
+
 class PyannoteDiarizationService:
     def __init__(self):
         self._pipeline = None
@@ -85,9 +158,17 @@ class PyannoteDiarizationService:
 
         self._pipeline.to(torch.device(self._device))
 
-    def diarize_file(self, file_path: str, timestamp: float = 0.0) -> dict:
+    def diarize_file(
+        self,
+        file_path: str,
+        timestamp: float = 0.0,
+        window: float = DIARIZATION_CONFIG["window"],
+        overlap: float = DIARIZATION_CONFIG["overlap"],
+    ) -> dict:
         if self._pipeline is None:
             self.load()
+        if window:
+            return self.diarize_file_windowed(file_path, timestamp, window, overlap)
         waveform, sample_rate = torchaudio.load(file_path)
         with self._lock:
             diarization = self._pipeline(
@@ -105,3 +186,85 @@ class PyannoteDiarizationService:
                 }
             )
         return {"diarization": words}
+
+    def diarize_file_windowed(
+        self, file_path: str, timestamp: float, window: float, overlap: float
+    ) -> dict:
+        """Diarize `window` seconds at a time, each window overlapping the
+        previous one by `overlap` seconds, while the file is being decoded.
+
+        Only one window of audio is held in memory, and the lock is taken per
+        window so concurrent requests interleave instead of queueing. Each
+        window contributes the segments in its middle part (the overlaps are
+        split in half), speakers are stitched across windows by embedding.
+        """
+        window_size = int(window * SAMPLE_RATE)
+        overlap_size = int(overlap * SAMPLE_RATE)
+        step = window_size - overlap_size
+        stitcher = SpeakerStitcher()
+        segments: list[tuple[float, float, int]] = []
+        previous: list[tuple[float, float, int]] = []
+
+        def diarize_window(audio: np.ndarray, offset: int, last: bool):
+            nonlocal previous
+            waveform = torch.from_numpy(audio).unsqueeze(0)
+            with self._lock:
+                diarization, embeddings = self._pipeline(
+                    {"waveform": waveform, "sample_rate": SAMPLE_RATE},
+                    return_embeddings=True,
+                )
+            start_time = offset / SAMPLE_RATE
+            tracks = [
+                (start_time + segment.start, start_time + segment.end, label)
+                for segment, _, label in diarization.itertracks(yield_label=True)
+            ]
+            labels = diarization.labels()
+            if embeddings is None or len(embeddings) < len(labels):
+                embeddings = np.full((len(labels), 1), np.nan)
+            mapping = stitcher.assign(labels, embeddings, tracks, previous)
+            previous = [(start, end, mapping[label]) for start, end, label in tracks]
+
+            core_start = (offset + overlap_size / 2 if offset else 0) / SAMPLE_RATE
+            core_end = (
+                float("inf")
+                if last
+                else (offset + window_size - overlap_size / 2) / SAMPLE_RATE
+            )
+            for start, end, speaker in previous:
+                start, end = max(start, core_start), min(end, core_end)
+                if end > start:
+                    segments.append((start, end, speaker))
+
+        buffer = np.zeros(0, dtype=np.float32)
+        buffer_start = 0
+        for block in stream_audio(file_path, SAMPLE_RATE, SAMPLE_RATE * 10):
+            buffer = np.concatenate([buffer, block])
+            while len(buffer) > window_size:
+                diarize_window(buffer[:window_size], buffer_start, last=False)
+                buffer = buffer[step:]
+                buffer_start += step
+        # the tail, unless the previous window already covered all of it
+        if buffer_start == 0 or len(buffer) > overlap_size / 2:
+            diarize_window(buffer, buffer_start, last=True)
+
+        # join the segments of a speaker split at window boundaries
+        merged: list[tuple[float, float, int]] = []
+        last_by_speaker: dict[int, int] = {}
+        for start, end, speaker in sorted(segments):
+            index = last_by_speaker.get(speaker)
+            if index is not None and start - merged[index][1] < 1e-3:
+                merged[index] = (merged[index][0], max(end, merged[index][1]), speaker)
+                continue
+            last_by_speaker[speaker] = len(merged)
+            merged.append((start, end, speaker))
+
+        return {
+            "diarization": [
+                {
+                    "start": round(timestamp + start, 3),
+                    "end": round(timestamp + end, 3),
+                    "speaker": speaker,
+                }
+                for start, end, speaker in merged
+            ]
+        }
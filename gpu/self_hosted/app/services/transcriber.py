@@ -1,8 +1,9 @@
 import os
-import shutil
-import subprocess
+import queue
 import threading
-from typing import Generator
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 
 import faster_whisper
 import librosa
@@ -17,29 +18,118 @@ from ..config import SAMPLE_RATE, VAD_CONFIG
 MODEL_NAME = "large-v2"
 # None delegates compute type to runtime: float16 on CUDA, int8 on CPU
 MODEL_COMPUTE_TYPE = None
-MODEL_NUM_WORKERS = 1
+# Model replicas transcribing concurrently; 0 picks 2 on CUDA, one per 4
+# cores on CPU
+MODEL_NUM_WORKERS = int(os.environ.get("WHISPER_NUM_WORKERS", "0"))
+MODEL_CPU_THREADS = 4
+# Requests allowed to wait for a replica before new ones are refused with 503
+MAX_QUEUED_REQUESTS = int(os.environ.get("WHISPER_MAX_QUEUED_REQUESTS", "16"))
 CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "reflector-whisper")
-from ..utils import NoStdStreams
+from ..utils import LatencyHistogram, NoStdStreams, stream_audio
 
 
 class WhisperService:
     def __init__(self):
         self.model = None
         self.device = "cpu"
-        self.lock = threading.Lock()
+        self.num_workers = 1
+        self.slots = threading.BoundedSemaphore(self.num_workers)
+        self._queued = 0
+        self._queued_lock = threading.Lock()
+        self.latency = {
+            "queue": LatencyHistogram(),
+            "inference": LatencyHistogram(),
+            "request": LatencyHistogram(),
+        }
+        self.rejected = 0
+        self._vad_models: queue.SimpleQueue = queue.SimpleQueue()
 
     def load(self):
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
         compute_type = MODEL_COMPUTE_TYPE or (
             "float16" if self.device == "cuda" else "int8"
         )
+        self.num_workers = MODEL_NUM_WORKERS or (
+            2 if self.device == "cuda" else max(1, (os.cpu_count() or 1) // 4)
+        )
+        self.slots = threading.BoundedSemaphore(self.num_workers)
         self.model = faster_whisper.WhisperModel(
             MODEL_NAME,
             device=self.device,
             compute_type=compute_type,
-            num_workers=MODEL_NUM_WORKERS,
+            cpu_threads=MODEL_CPU_THREADS,
+            num_workers=self.num_workers,
             download_root=CACHE_PATH,
         )
+        self._vad_models.put(load_silero_vad(onnx=False))
+
+    @contextmanager
+    def vad_model(self):
+        """Borrow a resident VAD model, loading another one only when all
+        are in use; the model is stateful so requests cannot share one."""
+        try:
+            model = self._vad_models.get_nowait()
+        except queue.Empty:
+            model = load_silero_vad(onnx=False)
+        try:
+            yield model
+        finally:
+            model.reset_states()
+            self._vad_models.put(model)
+
+    @contextmanager
+    def admit(self):
+        """Admit a request, or refuse it with 503 when too many are waiting"""
+        with self._queued_lock:
+            if self._queued >= self.num_workers + MAX_QUEUED_REQUESTS:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=503,
+                    detail="Transcription queue is full",
+                    headers={"Retry-After": "5"},
+                )
+            self._queued += 1
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.latency["request"].observe(time.monotonic() - started)
+            with self._queued_lock:
+                self._queued -= 1
+
+    def _transcribe(self, audio, language: str) -> list:
+        """Run the model on one of the replicas, waiting for a free one"""
+        queued = time.monotonic()
+        with self.slots:
+            started = time.monotonic()
+            self.latency["queue"].observe(started - queued)
+            try:
+                with NoStdStreams():
+                    segments, _ = self.model.transcribe(
+                        audio,
+                        language=language,
+                        beam_size=5,
+                        word_timestamps=True,
+                        vad_filter=True,
+                        vad_parameters={"min_silence_duration_ms": 500},
+                    )
+                    # segments are decoded lazily, while iterating
+                    return list(segments)
+            finally:
+                self.latency["inference"].observe(time.monotonic() - started)
+
+    def stats(self) -> dict:
+        with self._queued_lock:
+            queued = self._queued
+        return {
+            "workers": self.num_workers,
+            "in_flight": queued,
+            "max_queued": MAX_QUEUED_REQUESTS,
+            "rejected": self.rejected,
+            "latency": {
+                name: histogram.snapshot() for name, histogram in self.latency.items()
+            },
+        }
 
     def pad_audio(self, audio_array, sample_rate: int = SAMPLE_RATE):
         audio_duration = len(audio_array) / sample_rate
@@ -73,18 +163,7 @@ class WhisperService:
         except Exception:
             pass
 
-        with self.lock:
-            with NoStdStreams():
-                segments, _ = self.model.transcribe(
-                    input_for_model,
-                    language=language,
-                    beam_size=5,
-                    word_timestamps=True,
-                    vad_filter=True,
-                    vad_parameters={"min_silence_duration_ms": 500},
-                )
-
-        segments = list(segments)
+        segments = self._transcribe(input_for_model, language)
         text = "".join(segment.text for segment in segments).strip()
         words = [
             {
@@ -101,104 +180,109 @@ class WhisperService:
     def transcribe_vad_url_segment(
         self, file_path: str, timestamp_offset: float = 0.0, language: str = "en"
     ) -> dict:
-        def load_audio_via_ffmpeg(input_path: str, sample_rate: int) -> np.ndarray:
-            ffmpeg_bin = shutil.which("ffmpeg") or "ffmpeg"
-            cmd = [
-                ffmpeg_bin,
-                "-nostdin",
-                "-threads",
-                "1",
-                "-i",
-                input_path,
-                "-f",
-                "f32le",
-                "-acodec",
-                "pcm_f32le",
-                "-ac",
-                "1",
-                "-ar",
-                str(sample_rate),
-                "pipe:1",
-            ]
-            try:
-                proc = subprocess.run(
-                    cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
-                )
-            except Exception as e:
-                raise HTTPException(status_code=400, detail=f"ffmpeg failed: {e}")
-            audio = np.frombuffer(proc.stdout, dtype=np.float32)
-            return audio
-
         # IMPORTANT: This VAD segment logic is duplicated in multiple files for deployment isolation.
-        # If you modify this function, you MUST update all copies:
+        # If you modify the segmentation or batching rules, you MUST update all copies:
         #   - gpu/modal_deployments/reflector_transcriber.py
         #   - gpu/modal_deployments/reflector_transcriber_parakeet.py
         #   - gpu/self_hosted/app/services/transcriber.py (this file)
-        def vad_segments(
-            audio_array,
-            sample_rate: int = SAMPLE_RATE,
-            window_size: int = VAD_CONFIG["window_size"],
-        ) -> Generator[tuple[float, float], None, None]:
-            vad_model = load_silero_vad(onnx=False)
-            iterator = VADIterator(vad_model, sampling_rate=sample_rate)
-            start = None
-            for i in range(0, len(audio_array), window_size):
-                chunk = audio_array[i : i + window_size]
-                if len(chunk) < window_size:
-                    chunk = np.pad(
-                        chunk, (0, window_size - len(chunk)), mode="constant"
-                    )
-                speech = iterator(chunk)
-                if not speech:
-                    continue
-                if "start" in speech:
-                    start = speech["start"]
-                    continue
-                if "end" in speech and start is not None:
-                    end = speech["end"]
-                    yield (start / float(SAMPLE_RATE), end / float(SAMPLE_RATE))
-                    start = None
-            # Handle case where audio ends while speech is still active
-            if start is not None:
-                audio_duration = len(audio_array) / float(sample_rate)
-                yield (start / float(SAMPLE_RATE), audio_duration)
-            iterator.reset_states()
-
-        audio_array = load_audio_via_ffmpeg(file_path, SAMPLE_RATE)
+        # This copy runs on audio streamed from ffmpeg: a batch is sent to the
+        # model as soon as no later segment can join it, and only the audio
+        # from the current batch start is kept.
+        window_size = VAD_CONFIG["window_size"]
+        max_duration = VAD_CONFIG["batch_max_duration"]
+        # a speech start is reported slightly before the window it is found in
+        start_margin = SAMPLE_RATE
 
-        merged_batches: list[tuple[float, float]] = []
-        batch_start = None
+        buffer = np.zeros(0, dtype=np.float32)
+        buffer_start = 0  # sample index of buffer[0]
+        position = 0  # samples seen by the VAD
+        speech_start = None  # samples, while speech is active
+        batch_start = None  # seconds
         batch_end = None
-        max_duration = VAD_CONFIG["batch_max_duration"]
-        for seg_start, seg_end in vad_segments(audio_array):
+        batches: list[tuple[float, Future]] = []
+        executor = ThreadPoolExecutor(max_workers=self.num_workers)
+
+        def submit_batch():
+            s_idx = int(batch_start * SAMPLE_RATE) - buffer_start
+            e_idx = int(batch_end * SAMPLE_RATE) - buffer_start
+            segment = self.pad_audio(buffer[s_idx:e_idx].copy(), SAMPLE_RATE)
+            future = executor.submit(self._transcribe, segment, language)
+            batches.append((batch_start, future))
+
+        def add_segment(seg_start: float, seg_end: float):
+            nonlocal batch_start, batch_end
             if batch_start is None:
                 batch_start, batch_end = seg_start, seg_end
-                continue
-            if seg_end - batch_start <= max_duration:
+            elif seg_end - batch_start <= max_duration:
                 batch_end = seg_end
             else:
-                merged_batches.append((batch_start, batch_end))
+                submit_batch()
                 batch_start, batch_end = seg_start, seg_end
-        if batch_start is not None and batch_end is not None:
-            merged_batches.append((batch_start, batch_end))
+
+        def detect(iterator: VADIterator, chunk):
+            nonlocal speech_start
+            speech = iterator(chunk)
+            if not speech:
+                return
+            if "start" in speech:
+                speech_start = speech["start"]
+                return
+            if "end" in speech and speech_start is not None:
+                add_segment(
+                    speech_start / float(SAMPLE_RATE),
+                    speech["end"] / float(SAMPLE_RATE),
+                )
+                speech_start = None
+
+        with self.vad_model() as vad_model, executor:
+            iterator = VADIterator(vad_model, sampling_rate=SAMPLE_RATE)
+            for block in stream_audio(file_path, SAMPLE_RATE, window_size * 64):
+                buffer = np.concatenate([buffer, block])
+                while position + window_size <= buffer_start + len(buffer):
+                    offset = position - buffer_start
+                    detect(iterator, buffer[offset : offset + window_size])
+                    position += window_size
+
+                # no later segment can join a batch once it would end past
+                # the batch max duration, so send it while decoding goes on
+                if (
+                    batch_start is not None
+                    and speech_start is None
+                    and (position - start_margin) / SAMPLE_RATE
+                    > batch_start + max_duration
+                ):
+                    submit_batch()
+                    batch_start = batch_end = None
+
+                if batch_start is not None:
+                    keep_from = int(batch_start * SAMPLE_RATE)
+                elif speech_start is not None:
+                    keep_from = speech_start
+                else:
+                    keep_from = position - start_margin
+                if keep_from > buffer_start:
+                    buffer = buffer[keep_from - buffer_start :]
+                    buffer_start = keep_from
+
+            audio_end = buffer_start + len(buffer)
+            if position < audio_end:
+                chunk = buffer[position - buffer_start :]
+                chunk = np.pad(chunk, (0, window_size - len(chunk)), mode="constant")
+                detect(iterator, chunk)
+            # Handle case where audio ends while speech is still active
+            if speech_start is not None:
+                add_segment(
+                    speech_start / float(SAMPLE_RATE),
+                    audio_end / float(SAMPLE_RATE),
+                )
+            if batch_start is not None:
+                submit_batch()
+            iterator.reset_states()
 
         all_text = []
         all_words = []
-        for start_time, end_time in merged_batches:
-            s_idx = int(start_time * SAMPLE_RATE)
-            e_idx = int(end_time * SAMPLE_RATE)
-            segment = audio_array[s_idx:e_idx]
-            segment = self.pad_audio(segment, SAMPLE_RATE)
-            with self.lock:
-                segments, _ = self.model.transcribe(
-                    segment,
-                    language=language,
-                    beam_size=5,
-                    word_timestamps=True,
-                    vad_filter=True,
-                    vad_parameters={"min_silence_duration_ms": 500},
-                )
-            segments = list(segments)
+        for start_time, future in batches:
+            segments = future.result()
             text = "".join(seg.text for seg in segments).strip()
             words = [
                 {
@@ -1,44 +1,199 @@
+import asyncio
+import logging
 import threading
+from collections import OrderedDict
 
 from transformers import MarianMTModel, MarianTokenizer, pipeline
 
+from ..config import TRANSLATION_CACHE_MAX_BYTES
+
+logger = logging.getLogger(__name__)
+
+# MarianMT models per (source, target) language pair
+MODELS = {
+    ("en", "fr"): "Helsinki-NLP/opus-mt-en-fr",
+    ("fr", "en"): "Helsinki-NLP/opus-mt-fr-en",
+    ("en", "es"): "Helsinki-NLP/opus-mt-en-es",
+    ("es", "en"): "Helsinki-NLP/opus-mt-es-en",
+    ("en", "de"): "Helsinki-NLP/opus-mt-en-de",
+    ("de", "en"): "Helsinki-NLP/opus-mt-de-en",
+}
+
 
 class TextTranslatorService:
     """Simple text-to-text translator using HuggingFace MarianMT models.
 
     This mirrors the modal translator API shape but uses text translation only.
+    One pipeline is kept per language pair, least recently used pipelines are
+    evicted once their weights exceed `max_bytes`.
     """
 
-    def __init__(self):
-        self._pipeline = None
+    def __init__(self, max_bytes: int = TRANSLATION_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._pipelines: OrderedDict[tuple[str, str], tuple] = OrderedDict()
+        self._load_locks: dict[tuple[str, str], threading.Lock] = {}
         self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def is_supported(self, source_language: str, target_language: str) -> bool:
+        return (source_language.lower(), target_language.lower()) in MODELS
 
     def load(self, source_language: str = "en", target_language: str = "fr"):
-        # Pick a default MarianMT model pair if available; fall back to Helsinki-NLP en->fr
-        model_name = self._resolve_model_name(source_language, target_language)
-        tokenizer = MarianTokenizer.from_pretrained(model_name)
-        model = MarianMTModel.from_pretrained(model_name)
-        self._pipeline = pipeline("translation", model=model, tokenizer=tokenizer)
+        """Return the pipeline for the pair, loading it if not cached"""
+        pair = (source_language.lower(), target_language.lower())
+        model_name = self._resolve_model_name(*pair)
+        with self._lock:
+            entry = self._pipelines.get(pair)
+            if entry is not None:
+                self._pipelines.move_to_end(pair)
+                self.stats["hits"] += 1
+                return entry
+            load_lock = self._load_locks.setdefault(pair, threading.Lock())
 
-    def _resolve_model_name(self, src: str, tgt: str) -> str:
-        # Minimal mapping; extend as needed
-        pair = (src.lower(), tgt.lower())
-        mapping = {
-            ("en", "fr"): "Helsinki-NLP/opus-mt-en-fr",
-            ("fr", "en"): "Helsinki-NLP/opus-mt-fr-en",
-            ("en", "es"): "Helsinki-NLP/opus-mt-en-es",
-            ("es", "en"): "Helsinki-NLP/opus-mt-es-en",
-            ("en", "de"): "Helsinki-NLP/opus-mt-en-de",
-            ("de", "en"): "Helsinki-NLP/opus-mt-de-en",
-        }
-        return mapping.get(pair, "Helsinki-NLP/opus-mt-en-fr")
+        # load outside of the cache lock so other pairs keep translating
+        with load_lock:
+            with self._lock:
+                entry = self._pipelines.get(pair)
+                if entry is not None:
+                    self.stats["hits"] += 1
+                    return entry
+                self.stats["misses"] += 1
 
-    def translate(self, text: str, source_language: str, target_language: str) -> dict:
-        if self._pipeline is None:
+            logger.info("Loading translation model %s", model_name)
+            try:
+                tokenizer = MarianTokenizer.from_pretrained(model_name)
+                model = MarianMTModel.from_pretrained(model_name)
+            except Exception:
+                with self._lock:
+                    self._load_locks.pop(pair, None)
+                raise
+            size = sum(
+                tensor.numel() * tensor.element_size()
+                for tensor in (*model.parameters(), *model.buffers())
+            )
+            translation_pipeline = pipeline(
+                "translation", model=model, tokenizer=tokenizer
+            )
+            entry = (translation_pipeline, threading.Lock(), size)
+
+            with self._lock:
+                self._pipelines[pair] = entry
+                self._evict()
+        return entry
+
+    def warmup(self, pairs: list[tuple[str, str]]):
+        for source_language, target_language in pairs:
             self.load(source_language, target_language)
+
+    def _evict(self):
+        # the most recent pipeline stays even if it alone exceeds the budget
+        while len(self._pipelines) > 1 and self.memory_bytes > self.max_bytes:
+            pair, _ = self._pipelines.popitem(last=False)
+            self.stats["evictions"] += 1
+            logger.info("Evicted translation model for %s-%s", *pair)
+
+    @property
+    def memory_bytes(self) -> int:
+        return sum(size for _, _, size in self._pipelines.values())
+
+    def cache_info(self) -> dict:
         with self._lock:
-            results = self._pipeline(
-                text, src_lang=source_language, tgt_lang=target_language
-            )
-        translated = results[0]["translation_text"] if results else ""
+            return {
+                **self.stats,
+                "pairs": ["-".join(pair) for pair in self._pipelines],
+                "memory_bytes": self.memory_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _resolve_model_name(self, src: str, tgt: str) -> str:
+        try:
+            return MODELS[(src, tgt)]
+        except KeyError:
+            raise ValueError(f"Unsupported language pair: {src}-{tgt}") from None
+
+    def translate(self, text: str, source_language: str, target_language: str) -> dict:
+        translated = self.translate_batch([text], source_language, target_language)[0]
         return {"text": {source_language: text, target_language: translated}}
+
+    def translate_batch(
+        self, texts: list[str], source_language: str, target_language: str
+    ) -> list[str]:
+        """Translate texts with a single padded forward pass"""
+        translation_pipeline, lock, _ = self.load(source_language, target_language)
+        with lock:
+            results = translation_pipeline(
+                texts,
+                src_lang=source_language,
+                tgt_lang=target_language,
+                batch_size=len(texts),
+            )
+        return [result["translation_text"] for result in results]
+
+
+class TranslationBatcher:
+    """Merge concurrent requests into batches per language pair.
+
+    A batch runs when it holds `max_batch_size` texts or after `max_wait`
+    seconds, in a worker thread so the event loop keeps accepting requests.
+    """
+
+    def __init__(
+        self,
+        service: TextTranslatorService,
+        max_batch_size: int = 32,
+        max_wait: float = 0.02,
+    ):
+        self.service = service
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._pending: dict[tuple[str, str], list] = {}
+        self._timers: dict[tuple[str, str], asyncio.TimerHandle] = {}
+        # the loop only keeps weak references to tasks
+        self._tasks: set[asyncio.Task] = set()
+
+    async def translate(
+        self, texts: list[str], source_language: str, target_language: str
+    ) -> list[str]:
+        loop = asyncio.get_running_loop()
+        key = (source_language, target_language)
+        futures = []
+        for text in texts:
+            future = loop.create_future()
+            futures.append(future)
+            batch = self._pending.setdefault(key, [])
+            batch.append((text, future))
+            if len(batch) >= self.max_batch_size:
+                self._run(key)
+        if self._pending.get(key) and key not in self._timers:
+            self._timers[key] = loop.call_later(self.max_wait, self._run, key)
+        return list(await asyncio.gather(*futures))
+
+    def _run(self, key: tuple[str, str]):
+        timer = self._timers.pop(key, None)
+        if timer:
+            timer.cancel()
+        batch = self._pending.pop(key, [])
+        if batch:
+            task = asyncio.create_task(self._translate(key, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def close(self):
+        """Run the pending batches and wait for all of them"""
+        for key in list(self._pending):
+            self._run(key)
+        await asyncio.gather(*self._tasks)
+
+    async def _translate(self, key: tuple[str, str], batch: list):
+        try:
+            translations = await asyncio.to_thread(
+                self.service.translate_batch, [text for text, _ in batch], *key
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), translation in zip(batch, translations):
+            if not future.done():
+                future.set_result(translation)
@@ -1,12 +1,17 @@
+import bisect
 import logging
 import os
+import shutil
+import subprocess
 import sys
+import threading
 import uuid
 from contextlib import contextmanager
-from typing import Mapping
+from typing import Generator, Mapping
 from urllib.parse import urlparse
 from pathlib import Path
 
+import numpy as np
 import requests
 from fastapi import HTTPException
 
@@ -16,18 +21,99 @@ logger = logging.getLogger(__name__)
 
 
 class NoStdStreams:
-    def __init__(self):
-        self.devnull = open(os.devnull, "w")
+    """Silence stdout/stderr; concurrent users share one redirection, which
+    is undone when the last of them exits."""
+
+    _lock = threading.Lock()
+    _depth = 0
+    _saved = None
 
     def __enter__(self):
-        self._stdout, self._stderr = sys.stdout, sys.stderr
-        self._stdout.flush()
-        self._stderr.flush()
-        sys.stdout, sys.stderr = self.devnull, self.devnull
+        cls = type(self)
+        with cls._lock:
+            if cls._depth == 0:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                devnull = open(os.devnull, "w")
+                cls._saved = (sys.stdout, sys.stderr, devnull)
+                sys.stdout, sys.stderr = devnull, devnull
+            cls._depth += 1
 
     def __exit__(self, exc_type, exc_value, traceback):
-        sys.stdout, sys.stderr = self._stdout, self._stderr
-        self.devnull.close()
+        cls = type(self)
+        with cls._lock:
+            cls._depth -= 1
+            if cls._depth == 0:
+                sys.stdout, sys.stderr, devnull = cls._saved
+                cls._saved = None
+                devnull.close()
+
+
+class LatencyHistogram:
+    """Cumulative latency histogram, in seconds, safe to share across threads"""
+
+    BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+    def __init__(self, buckets: tuple[float, ...] = BUCKETS):
+        self.buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        with self._lock:
+            self._counts[bisect.bisect_left(self.buckets, seconds)] += 1
+            self._sum += seconds
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        buckets, cumulative = {}, 0
+        for bound, count in zip((*self.buckets, "+Inf"), counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        return {"buckets": buckets, "count": cumulative, "sum": round(total, 3)}
+
+
+def stream_audio(
+    input_path: str, sample_rate: int, block_size: int
+) -> Generator[np.ndarray, None, None]:
+    """Decode audio to mono float32 with ffmpeg, yielding blocks of
+    `block_size` samples as they are decoded (the last one may be shorter)."""
+    ffmpeg_bin = shutil.which("ffmpeg") or "ffmpeg"
+    cmd = [
+        ffmpeg_bin,
+        "-nostdin",
+        "-threads",
+        "1",
+        "-i",
+        input_path,
+        "-f",
+        "f32le",
+        "-acodec",
+        "pcm_f32le",
+        "-ac",
+        "1",
+        "-ar",
+        str(sample_rate),
+        "pipe:1",
+    ]
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"ffmpeg failed: {e}")
+    try:
+        while data := proc.stdout.read(block_size * 4):
+            yield np.frombuffer(data[: len(data) // 4 * 4], dtype=np.float32)
+        if returncode := proc.wait():
+            raise HTTPException(
+                status_code=400, detail=f"ffmpeg failed with exit status {returncode}"
+            )
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
 
 
 def ensure_dirs():
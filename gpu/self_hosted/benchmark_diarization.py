@@ -0,0 +1,111 @@
+"""
+Benchmark whole-file and windowed diarization on a synthetic recording.
+
+Writes a multi-hour 16kHz wav of alternating synthetic voices, then
+diarizes it in a separate process per mode and reports the wall time and
+the peak RSS of that process.
+
+Usage:
+    uv run python benchmark_diarization.py --hours 2 --window 600 --overlap 30
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+
+
+def make_recording(path: str, hours: float, speakers: int = 3):
+    """Turns of 2-20s by `speakers` harmonic voices, separated by pauses"""
+    rng = np.random.default_rng(0)
+    pitches = rng.uniform(90, 250, size=speakers)
+    total = int(hours * 3600 * SAMPLE_RATE)
+    written = 0
+    with wave.open(path, "wb") as out:
+        out.setnchannels(1)
+        out.setsampwidth(2)
+        out.setframerate(SAMPLE_RATE)
+        while written < total:
+            duration = int(rng.uniform(2, 20) * SAMPLE_RATE)
+            t = np.arange(duration) / SAMPLE_RATE
+            pitch = pitches[rng.integers(speakers)]
+            # syllable-like amplitude modulation over a few harmonics
+            envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 4 * t)
+            voice = sum(np.sin(2 * np.pi * pitch * k * t) / k for k in range(1, 6))
+            voice = voice * envelope + rng.normal(0, 0.05, duration)
+            pause = np.zeros(int(rng.uniform(0.2, 1.5) * SAMPLE_RATE))
+            chunk = np.concatenate([voice, pause])[: total - written]
+            out.writeframes((chunk / 3 * 32767).astype(np.int16).tobytes())
+            written += len(chunk)
+
+
+def run_mode(path: str, window: float, overlap: float):
+    from app.services.diarizer import PyannoteDiarizationService
+
+    service = PyannoteDiarizationService()
+    service.load()
+    started = time.perf_counter()
+    result = service.diarize_file(path, window=window, overlap=overlap)
+    elapsed = time.perf_counter() - started
+    segments = result["diarization"]
+    print(
+        json.dumps(
+            {
+                "seconds": elapsed,
+                "segments": len(segments),
+                "speakers": len({segment["speaker"] for segment in segments}),
+                # kilobytes on Linux
+                "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                / 1024,
+            }
+        )
+    )
+
+
+def run(hours: float, window: float, overlap: float, input_path: str | None):
+    with tempfile.NamedTemporaryFile(suffix=".wav") as recording:
+        path = input_path
+        if path is None:
+            path = recording.name
+            make_recording(path, hours)
+
+        print(
+            f"{'mode':>16} {'seconds':>9} {'segments':>9} {'speakers':>9} "
+            f"{'peak RSS MB':>12}"
+        )
+        modes = (("whole file", 0), (f"window {window:g}s", window))
+        for label, mode_window in modes:
+            output = subprocess.run(
+                [sys.executable, __file__, "--run", path]
+                + [str(mode_window), str(overlap)],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            stats = json.loads(output.strip().splitlines()[-1])
+            print(
+                f"{label:>16} {stats['seconds']:>9.1f} {stats['segments']:>9} "
+                f"{stats['speakers']:>9} {stats['peak_rss_mb']:>12.0f}"
+            )
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--run"]:
+        run_mode(sys.argv[2], float(sys.argv[3]), float(sys.argv[4]))
+        sys.exit()
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--hours", type=float, default=2)
+    parser.add_argument("--window", type=float, default=600)
+    parser.add_argument("--overlap", type=float, default=30)
+    parser.add_argument("--input", help="diarize this file instead of a synthetic one")
+    args = parser.parse_args()
+    run(args.hours, args.window, args.overlap, args.input)
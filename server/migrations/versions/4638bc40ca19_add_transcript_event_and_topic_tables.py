@@ -0,0 +1,114 @@
+"""add transcript_event and transcript_topic tables
+
+Revision ID: 4638bc40ca19
+Revises: 623af934249a
+Create Date: 2026-10-16 10:12:41.502113
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4638bc40ca19"
+down_revision: Union[str, None] = "623af934249a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "transcript_event",
+        sa.Column("id", sa.BigInteger(), nullable=False),
+        sa.Column("transcript_id", sa.String(), nullable=False),
+        sa.Column("event", sa.String(), nullable=False),
+        sa.Column("data", sa.JSON(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "idx_transcript_event_transcript_id",
+        "transcript_event",
+        ["transcript_id", "id"],
+    )
+
+    op.execute("CREATE SEQUENCE IF NOT EXISTS transcript_topic_seq;")
+    op.create_table(
+        "transcript_topic",
+        sa.Column("transcript_id", sa.String(), nullable=False),
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column(
+            "position",
+            sa.BigInteger(),
+            server_default=sa.text("nextval('transcript_topic_seq')"),
+            nullable=False,
+        ),
+        sa.Column("data", sa.JSON(), nullable=False),
+        sa.PrimaryKeyConstraint("transcript_id", "id"),
+    )
+    op.create_index(
+        "idx_transcript_topic_transcript_id_position",
+        "transcript_topic",
+        ["transcript_id", "position"],
+    )
+
+    # Backfill from the JSON columns, keeping array order
+    op.execute("""
+        INSERT INTO transcript_event (transcript_id, event, data)
+        SELECT t.id, e.value->>'event', COALESCE(e.value->'data', '{}'::json)
+        FROM transcript t,
+             json_array_elements(t.events) WITH ORDINALITY AS e(value, idx)
+        WHERE json_typeof(t.events) = 'array'
+        ORDER BY t.id, e.idx;
+    """)
+    op.execute("""
+        INSERT INTO transcript_topic (transcript_id, id, data)
+        SELECT t.id, e.value->>'id', e.value
+        FROM transcript t,
+             json_array_elements(t.topics) WITH ORDINALITY AS e(value, idx)
+        WHERE json_typeof(t.topics) = 'array' AND e.value->>'id' IS NOT NULL
+        ORDER BY t.id, e.idx
+        ON CONFLICT (transcript_id, id) DO NOTHING;
+    """)
+
+    # Empty the legacy columns without bumping change_seq: the content
+    # exposed by the API is unchanged
+    op.execute("ALTER TABLE transcript DISABLE TRIGGER trigger_transcript_change_seq;")
+    op.execute("""
+        UPDATE transcript SET events = '[]'::json, topics = '[]'::json
+        WHERE json_typeof(events) = 'array' OR json_typeof(topics) = 'array';
+    """)
+    op.execute("ALTER TABLE transcript ENABLE TRIGGER trigger_transcript_change_seq;")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE transcript DISABLE TRIGGER trigger_transcript_change_seq;")
+    op.execute("""
+        UPDATE transcript t SET events = (
+            COALESCE(t.events::jsonb, '[]'::jsonb) || (
+                SELECT jsonb_agg(
+                    jsonb_build_object('event', e.event, 'data', e.data::jsonb)
+                    ORDER BY e.id
+                )
+                FROM transcript_event e WHERE e.transcript_id = t.id
+            )
+        )::json
+        WHERE EXISTS (SELECT 1 FROM transcript_event e WHERE e.transcript_id = t.id);
+    """)
+    op.execute("""
+        UPDATE transcript t SET topics = (
+            SELECT json_agg(tt.data ORDER BY tt.position)
+            FROM transcript_topic tt WHERE tt.transcript_id = t.id
+        )
+        WHERE EXISTS (SELECT 1 FROM transcript_topic tt WHERE tt.transcript_id = t.id);
+    """)
+    op.execute("ALTER TABLE transcript ENABLE TRIGGER trigger_transcript_change_seq;")
+
+    op.drop_index(
+        "idx_transcript_topic_transcript_id_position", table_name="transcript_topic"
+    )
+    op.drop_table("transcript_topic")
+    op.execute("DROP SEQUENCE IF EXISTS transcript_topic_seq;")
+    op.drop_index("idx_transcript_event_transcript_id", table_name="transcript_event")
+    op.drop_table("transcript_event")
@@ -0,0 +1,37 @@
+"""add transcript keyset and title trigram indexes
+
+Revision ID: 5b8e1f0c3d27
+Revises: 9d1c5e7a2b40
+Create Date: 2026-10-16 23:41:05.127384
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b8e1f0c3d27"
+down_revision: Union[str, None] = "9d1c5e7a2b40"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # keyset pagination over (created_at, id)
+    op.create_index("idx_transcript_created_at_id", "transcript", ["created_at", "id"])
+
+    # title search with ilike '%term%'
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "idx_transcript_title_trgm",
+        "transcript",
+        ["title"],
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_transcript_title_trgm", table_name="transcript")
+    op.drop_index("idx_transcript_created_at_id", table_name="transcript")
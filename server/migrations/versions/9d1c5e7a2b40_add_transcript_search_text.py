@@ -0,0 +1,34 @@
+"""add transcript search_text
+
+Revision ID: 9d1c5e7a2b40
+Revises: 4638bc40ca19
+Create Date: 2026-10-16 14:02:18.310446
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9d1c5e7a2b40"
+down_revision: Union[str, None] = "4638bc40ca19"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Plain text of the WebVTT: header, cue timings and voice tags removed
+    op.execute(r"""
+        ALTER TABLE transcript ADD COLUMN search_text text
+        GENERATED ALWAYS AS (
+            btrim(regexp_replace(regexp_replace(
+                coalesce(webvtt, ''),
+                '^WEBVTT[^\n]*|[0-9:.]+ --> [0-9:.]+[^\n]*|<[^>]*>', '', 'g'),
+                '\s+', ' ', 'g'))
+        ) STORED
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column("transcript", "search_text")
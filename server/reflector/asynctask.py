@@ -6,6 +6,8 @@ from celery import current_task
 
 from reflector.db import _database_context, get_database
 from reflector.llm import llm_session_id
+from reflector.processors.http_client import http_client_pool
+from reflector.storage import Storage
 from reflector.ws_manager import reset_ws_manager
 
 
@@ -20,6 +22,9 @@ def asynctask(f):
             try:
                 return await f(*args, **kwargs)
             finally:
+                # pooled clients are bound to this loop, release them with it
+                await Storage.close_clients()
+                await http_client_pool.close()
                 await database.disconnect()
                 _database_context.set(None)
 
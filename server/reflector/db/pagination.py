@@ -0,0 +1,88 @@
+"""Keyset pagination and row count estimates."""
+
+import base64
+import json
+from datetime import datetime
+from typing import Literal
+
+import sqlalchemy
+from pydantic import BaseModel
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.expression import ColumnElement
+
+from reflector.db import get_database
+
+CountMode = Literal["exact", "approximate", "none"]
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+class KeysetCursor(BaseModel):
+    """
+    Sort key of the last row of a page, the next page starts after it.
+
+    `id` breaks ties between rows sharing the other values.
+    """
+
+    id: str
+    created_at: datetime | None = None
+    change_seq: int | None = None
+    rank: float | None = None
+
+    def encode(self) -> str:
+        data = self.model_dump_json(exclude_none=True).encode()
+        return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str) -> "KeysetCursor":
+        """Raises InvalidCursor for a cursor that was not made by encode"""
+        try:
+            data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            return cls.model_validate_json(data)
+        except ValueError as e:
+            # binascii.Error and ValidationError are ValueErrors too
+            raise InvalidCursor("Invalid cursor") from e
+
+    def values(self, columns: list[ColumnElement]) -> list:
+        return [getattr(self, column.name) for column in columns]
+
+
+def keyset_after(
+    columns: list[ColumnElement], cursor: KeysetCursor, descending: bool
+) -> ColumnElement:
+    """
+    Rows after the cursor in the (columns) order, as a row comparison so
+    PostgreSQL can seek an index on the same columns
+    """
+    values = cursor.values(columns)
+    if any(value is None for value in values):
+        raise InvalidCursor("Cursor does not match the sort order")
+    left = sqlalchemy.tuple_(*columns)
+    right = sqlalchemy.tuple_(*values)
+    return left < right if descending else left > right
+
+
+async def count_rows(query, mode: CountMode) -> int | None:
+    """
+    Count the rows of `query`, exactly or from the planner estimate,
+    which reads no rows but is only as good as the table statistics
+    """
+    if mode == "none":
+        return None
+    if mode == "exact":
+        return await get_database().fetch_val(
+            sqlalchemy.select([sqlalchemy.func.count()]).select_from(
+                query.alias("counted")
+            )
+        )
+
+    compiled = query.compile(dialect=postgresql.dialect(paramstyle="named"))
+    explain = sqlalchemy.text(f"EXPLAIN (FORMAT JSON) {compiled}").bindparams(
+        **compiled.params
+    )
+    plan = await get_database().fetch_val(explain)
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
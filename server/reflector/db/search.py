@@ -20,8 +20,10 @@ from pydantic import (
     constr,
     field_serializer,
 )
+from sqlalchemy.sql.expression import ColumnElement
 
 from reflector.db import get_database
+from reflector.db.pagination import KeysetCursor, keyset_after
 from reflector.db.rooms import rooms
 from reflector.db.transcripts import SourceKind, TranscriptStatus, transcripts
 from reflector.db.utils import is_postgresql
@@ -34,6 +36,9 @@ SNIPPET_CONTEXT_LENGTH = 50  # Characters before/after match to include
 DEFAULT_SNIPPET_MAX_LENGTH = NonNegativeInt(150)
 DEFAULT_MAX_SNIPPETS = NonNegativeInt(3)
 LONG_SUMMARY_MAX_SNIPPETS = 2
+HEADLINE_MAX_WORDS = 25
+HEADLINE_MIN_WORDS = 10
+HEADLINE_FRAGMENT_DELIMITER = " ||| "
 
 SearchQueryBase = constr(min_length=1, strip_whitespace=True)
 SearchLimitBase = Annotated[int, Field(ge=1, le=100)]
@@ -133,6 +138,8 @@ class SearchParameters(BaseModel):
     query_text: SearchQuery | None = None
     limit: SearchLimit = DEFAULT_SEARCH_LIMIT
     offset: SearchOffset = 0
+    # keyset pagination, the page starts after this cursor instead of offset
+    cursor: KeysetCursor | None = None
     user_id: str | None = None
     room_id: str | None = None
     source_kind: SourceKind | None = None
@@ -302,17 +309,31 @@ class SnippetGenerator:
             summary is not None or webvtt is not None
         ), "At least one source must be present"
 
-        webvtt_matches = 0
-        summary_matches = 0
-
-        if webvtt:
-            webvtt_text = WebVTTProcessor.extract_text(webvtt)
-            webvtt_matches = SnippetGenerator.count_matches(webvtt_text, query)
+        return SnippetGenerator.combine_texts(
+            summary,
+            WebVTTProcessor.extract_text(webvtt) if webvtt else None,
+            query,
+            max_total,
+        )
 
-        if summary:
-            summary_matches = SnippetGenerator.count_matches(summary, query)
+    @staticmethod
+    def combine_texts(
+        summary: str | None,
+        transcript_text: str | None,
+        query: SearchQuery,
+        max_total: NonNegativeInt = DEFAULT_MAX_SNIPPETS,
+    ) -> tuple[list[str], NonNegativeInt]:
+        """Same as combine_sources, over the already extracted transcript text."""
 
-        total_matches = NonNegativeInt(webvtt_matches + summary_matches)
+        transcript_matches = (
+            SnippetGenerator.count_matches(transcript_text, query)
+            if transcript_text
+            else 0
+        )
+        summary_matches = (
+            SnippetGenerator.count_matches(summary, query) if summary else 0
+        )
+        total_matches = NonNegativeInt(transcript_matches + summary_matches)
 
         summary_snippets = (
             SnippetGenerator.from_summary(summary, query) if summary else []
@@ -322,13 +343,78 @@ class SnippetGenerator:
             return summary_snippets[:max_total], total_matches
 
         remaining = max_total - len(summary_snippets)
-        webvtt_snippets = (
-            WebVTTProcessor.generate_snippets(webvtt, query, remaining)
-            if webvtt
+        transcript_snippets = (
+            SnippetGenerator.generate(transcript_text, query, max_snippets=remaining)
+            if transcript_text
             else []
         )
 
-        return summary_snippets + webvtt_snippets, total_matches
+        return summary_snippets + transcript_snippets, total_matches
+
+
+class DatabaseSnippets:
+    """Snippets and match counts computed by PostgreSQL.
+
+    Snippets come from `ts_headline` and counts from the length of the text
+    with the query removed, so only the page of results travels to the
+    application, whatever the length of the transcripts.
+    """
+
+    @staticmethod
+    def headline(
+        text: ColumnElement,
+        search_query: ColumnElement,
+        max_snippets: NonNegativeInt,
+    ) -> ColumnElement:
+        """Non-overlapping fragments around matches, or NULL without match."""
+        options = (
+            f"MaxFragments={max_snippets}, "
+            f"MaxWords={HEADLINE_MAX_WORDS}, MinWords={HEADLINE_MIN_WORDS}, "
+            f'StartSel="", StopSel="", '
+            f'FragmentDelimiter="{HEADLINE_FRAGMENT_DELIMITER}"'
+        )
+        return sqlalchemy.case(
+            (
+                sqlalchemy.func.to_tsvector("english", text).op("@@")(search_query),
+                sqlalchemy.func.ts_headline("english", text, search_query, options),
+            ),
+            else_=None,
+        )
+
+    @staticmethod
+    def count_matches(text: ColumnElement, query: SearchQuery) -> ColumnElement:
+        """Same count as SnippetGenerator.count_matches, in SQL."""
+        lowered = sqlalchemy.func.lower(sqlalchemy.func.coalesce(text, ""))
+        query_lower = query.lower()
+        return (
+            sqlalchemy.func.char_length(lowered)
+            - sqlalchemy.func.char_length(
+                sqlalchemy.func.replace(lowered, query_lower, "")
+            )
+        ) / len(query_lower)
+
+    @staticmethod
+    def split(headline: str | None) -> list[str]:
+        if not headline:
+            return []
+        return [
+            fragment.strip()
+            for fragment in headline.split(HEADLINE_FRAGMENT_DELIMITER)
+            if fragment.strip()
+        ]
+
+    @staticmethod
+    def combine(
+        summary_headline: str | None,
+        transcript_headline: str | None,
+        max_total: NonNegativeInt = DEFAULT_MAX_SNIPPETS,
+    ) -> list[str]:
+        """Summary snippets first, then transcript ones, like combine_sources."""
+        snippets = DatabaseSnippets.split(summary_headline)[:max_total]
+        remaining = max_total - len(snippets)
+        if remaining > 0:
+            snippets += DatabaseSnippets.split(transcript_headline)[:remaining]
+        return snippets
 
 
 class SearchController:
@@ -342,12 +428,36 @@ class SearchController:
         Full-text search for transcripts using PostgreSQL tsvector.
         Returns (results, total_count).
         """
+        results, total, _ = await cls.search_transcripts_page(params)
+        return results, total
+
+    @classmethod
+    async def search_transcripts_page(
+        cls, params: SearchParameters
+    ) -> tuple[list[SearchResult], int, KeysetCursor | None]:
+        """
+        Full-text search for transcripts using PostgreSQL tsvector.
+        Returns (results, total_count, cursor of the next page or None).
+
+        The page and the total count come from a single query. Snippets are
+        built from the pre-extracted `search_text` column, either in Python
+        or by PostgreSQL (SEARCH_SNIPPETS_BACKEND=database).
+
+        Results are ordered by rank (with a query), then created_at and id,
+        which is also the key of the cursor.
+        """
 
         if not is_postgresql():
             logger.warning(
                 "Full-text search requires PostgreSQL. Returning empty results."
             )
-            return [], 0
+            return [], 0, None
+
+        database_snippets = (
+            params.query_text is not None
+            and settings.SEARCH_SNIPPETS_BACKEND == "database"
+        )
+        text_columns = [transcripts.c.search_text, transcripts.c.long_summary]
 
         base_columns = [
             transcripts.c.id,
@@ -359,8 +469,6 @@ class SearchController:
             transcripts.c.room_id,
             transcripts.c.source_kind,
             transcripts.c.change_seq,
-            transcripts.c.webvtt,
-            transcripts.c.long_summary,
             sqlalchemy.case(
                 (
                     transcripts.c.room_id.isnot(None) & rooms.c.id.is_(None),
@@ -382,7 +490,7 @@ class SearchController:
         else:
             rank_column = sqlalchemy.cast(1.0, sqlalchemy.Float).label("rank")
 
-        columns = base_columns + [rank_column]
+        columns = base_columns + [rank_column] + text_columns
         base_query = sqlalchemy.select(columns).select_from(
             transcripts.join(rooms, transcripts.c.room_id == rooms.c.id, isouter=True)
         )
@@ -417,45 +525,125 @@ class SearchController:
                 transcripts.c.created_at <= params.to_datetime
             )
 
+        sort_key = ["created_at", "id"]
         if params.query_text is not None:
-            order_by = sqlalchemy.desc(sqlalchemy.text("rank"))
+            sort_key.insert(0, "rank")
+
+        def descending(columns) -> list[ColumnElement]:
+            return [columns[name].desc() for name in sort_key]
+
+        # one more row than the page tells whether there is a next page
+        if params.cursor is None:
+            query = (
+                base_query.add_columns(sqlalchemy.func.count().over().label("total"))
+                .order_by(*descending({c.name: c for c in columns}))
+                .limit(params.limit + 1)
+                .offset(params.offset)
+            )
         else:
-            order_by = sqlalchemy.desc(transcripts.c.created_at)
+            # the total counts all the matches, not only the ones after the
+            # cursor, so it is computed over the matches before the seek
+            matches = base_query.cte("matches")
+            query = (
+                sqlalchemy.select(
+                    list(matches.c)
+                    + [
+                        sqlalchemy.select([sqlalchemy.func.count()])
+                        .select_from(matches)
+                        .scalar_subquery()
+                        .label("total")
+                    ]
+                )
+                .where(
+                    keyset_after(
+                        [matches.c[name] for name in sort_key],
+                        params.cursor,
+                        descending=True,
+                    )
+                )
+                .order_by(*descending(matches.c))
+                .limit(params.limit + 1)
+            )
 
-        query = base_query.order_by(order_by).limit(params.limit).offset(params.offset)
+        if database_snippets:
+            assert search_query is not None
+            # headlines are computed on the page only, not on every match
+            page = query.subquery("page")
+            query = sqlalchemy.select(
+                [c for c in page.c if c.name not in ("search_text", "long_summary")]
+                + [
+                    DatabaseSnippets.headline(
+                        page.c.long_summary, search_query, LONG_SUMMARY_MAX_SNIPPETS
+                    ).label("summary_headline"),
+                    DatabaseSnippets.headline(
+                        page.c.search_text, search_query, DEFAULT_MAX_SNIPPETS
+                    ).label("transcript_headline"),
+                    (
+                        DatabaseSnippets.count_matches(
+                            page.c.long_summary, params.query_text
+                        )
+                        + DatabaseSnippets.count_matches(
+                            page.c.search_text, params.query_text
+                        )
+                    ).label("total_match_count"),
+                ]
+            ).order_by(*descending(page.c))
 
         rs = await get_database().fetch_all(query)
 
-        count_query = sqlalchemy.select([sqlalchemy.func.count()]).select_from(
-            base_query.alias("search_results")
-        )
-        total = await get_database().fetch_val(count_query)
+        next_cursor = None
+        if len(rs) > params.limit:
+            rs = rs[: params.limit]
+            next_cursor = KeysetCursor(**{name: rs[-1][name] for name in sort_key})
+
+        if rs:
+            total = rs[0]["total"]
+        elif params.offset > 0 or params.cursor is not None:
+            # past the last page, the window count has no row to live on
+            count_query = sqlalchemy.select([sqlalchemy.func.count()]).select_from(
+                base_query.alias("search_results")
+            )
+            total = await get_database().fetch_val(count_query)
+        else:
+            total = 0
 
         def _process_result(r: DbRecord) -> SearchResult:
             r_dict: Dict[str, Any] = dict(r)
+            r_dict.pop("total", None)
+            room_name: str | None = r_dict.pop("room_name", None)
 
-            webvtt_raw: str | None = r_dict.pop("webvtt", None)
-            webvtt: WebVTTContent | None
-            if webvtt_raw:
-                webvtt = WebVTTProcessor.parse(webvtt_raw)
+            if database_snippets:
+                snippets = DatabaseSnippets.combine(
+                    r_dict.pop("summary_headline", None),
+                    r_dict.pop("transcript_headline", None),
+                    DEFAULT_MAX_SNIPPETS,
+                )
+                total_match_count = r_dict.pop("total_match_count", None) or 0
             else:
-                webvtt = None
+                search_text: NonEmptyString | None = try_parse_non_empty_string(
+                    r_dict.pop("search_text", None)
+                )
+                long_summary_r: str | None = r_dict.pop("long_summary", None)
+                long_summary: NonEmptyString = try_parse_non_empty_string(
+                    long_summary_r
+                )
+                at_least_one_source = (
+                    search_text is not None or long_summary is not None
+                )
+                has_query = params.query_text is not None
+                snippets, total_match_count = (
+                    SnippetGenerator.combine_texts(
+                        long_summary,
+                        search_text,
+                        params.query_text,
+                        DEFAULT_MAX_SNIPPETS,
+                    )
+                    if has_query and at_least_one_source
+                    else ([], 0)
+                )
 
-            long_summary_r: str | None = r_dict.pop("long_summary", None)
-            long_summary: NonEmptyString = try_parse_non_empty_string(long_summary_r)
-            room_name: str | None = r_dict.pop("room_name", None)
             db_result = SearchResultDB.model_validate(r_dict)
 
-            at_least_one_source = webvtt is not None or long_summary is not None
-            has_query = params.query_text is not None
-            snippets, total_match_count = (
-                SnippetGenerator.combine_sources(
-                    long_summary, webvtt, params.query_text, DEFAULT_MAX_SNIPPETS
-                )
-                if has_query and at_least_one_source
-                else ([], 0)
-            )
-
             return SearchResult(
                 **db_result.model_dump(),
                 room_name=room_name,
@@ -474,7 +662,7 @@ class SearchController:
             logger.error(f"Error processing search results: {e}", exc_info=True)
             raise
 
-        return results, total
+        return results, total, next_cursor
 
 
 search_controller = SearchController()
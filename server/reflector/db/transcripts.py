@@ -2,10 +2,12 @@ import enum
 import json
 import os
 import shutil
+import time
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal, Sequence
+from typing import TYPE_CHECKING, Any, Literal, Sequence, TypeVar
 
 if TYPE_CHECKING:
     from reflector.ws_events import TranscriptEventName
@@ -14,10 +16,11 @@ import sqlalchemy
 from fastapi import HTTPException
 from pydantic import BaseModel, ConfigDict, Field, field_serializer
 from sqlalchemy import Enum
-from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.dialects.postgresql import TSVECTOR, insert
 from sqlalchemy.sql import false, or_
 
 from reflector.db import get_database, metadata
+from reflector.db.pagination import CountMode, KeysetCursor, count_rows, keyset_after
 from reflector.db.recordings import recordings_controller
 from reflector.db.rooms import rooms
 from reflector.db.utils import is_postgresql
@@ -26,7 +29,7 @@ from reflector.processors.types import Word as ProcessorWord
 from reflector.settings import settings
 from reflector.storage import get_transcripts_storage
 from reflector.utils import generate_uuid4
-from reflector.utils.webvtt import topics_to_webvtt
+from reflector.utils.webvtt import append_topic_webvtt, topics_to_webvtt
 
 
 class SourceKind(enum.StrEnum):
@@ -100,6 +103,8 @@ transcripts = sqlalchemy.Table(
     sqlalchemy.Index("idx_transcript_recording_id", "recording_id"),
     sqlalchemy.Index("idx_transcript_user_id", "user_id"),
     sqlalchemy.Index("idx_transcript_created_at", "created_at"),
+    # keyset pagination over (created_at, id)
+    sqlalchemy.Index("idx_transcript_created_at_id", "created_at", "id"),
     sqlalchemy.Index("idx_transcript_user_id_recording_id", "user_id", "recording_id"),
     sqlalchemy.Index("idx_transcript_room_id", "room_id"),
     sqlalchemy.Index("idx_transcript_source_kind", "source_kind"),
@@ -121,6 +126,22 @@ if is_postgresql():
             ),
         )
     )
+    # Plain text of the WebVTT (no header, cue timings or voice tags), used to
+    # build search snippets without parsing WebVTT for every hit
+    # This matches the migration in migrations/versions/9d1c5e7a2b40_add_transcript_search_text.py
+    transcripts.append_column(
+        sqlalchemy.Column(
+            "search_text",
+            sqlalchemy.Text,
+            sqlalchemy.Computed(
+                "btrim(regexp_replace(regexp_replace("
+                "coalesce(webvtt, ''), "
+                "'^WEBVTT[^\\n]*|[0-9:.]+ --> [0-9:.]+[^\\n]*|<[^>]*>', '', 'g'), "
+                "'\\s+', ' ', 'g'))",
+                persisted=True,
+            ),
+        )
+    )
     # Add GIN index for the search vector
     transcripts.append_constraint(
         sqlalchemy.Index(
@@ -129,6 +150,57 @@ if is_postgresql():
             postgresql_using="gin",
         )
     )
+    # Trigram index for the title search (ilike '%term%')
+    # This matches the migration in migrations/versions/5b8e1f0c3d27_add_transcript_keyset_indexes.py
+    sqlalchemy.event.listen(
+        metadata,
+        "before_create",
+        sqlalchemy.DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+    )
+    transcripts.append_constraint(
+        sqlalchemy.Index(
+            "idx_transcript_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        )
+    )
+
+
+# Events and topics are stored one row each, so live writes are a single
+# insert/upsert instead of rewriting the whole JSON array on the transcript.
+# The legacy `events`/`topics` JSON columns are still read as a base for rows
+# written before the split, and are emptied when a full list is replaced.
+transcript_events = sqlalchemy.Table(
+    "transcript_event",
+    metadata,
+    sqlalchemy.Column("id", sqlalchemy.BigInteger, primary_key=True),
+    sqlalchemy.Column("transcript_id", sqlalchemy.String, nullable=False),
+    sqlalchemy.Column("event", sqlalchemy.String, nullable=False),
+    sqlalchemy.Column("data", sqlalchemy.JSON, nullable=False),
+    sqlalchemy.Index("idx_transcript_event_transcript_id", "transcript_id", "id"),
+)
+
+transcript_topic_seq = sqlalchemy.Sequence("transcript_topic_seq", metadata=metadata)
+
+transcript_topics = sqlalchemy.Table(
+    "transcript_topic",
+    metadata,
+    sqlalchemy.Column("transcript_id", sqlalchemy.String, primary_key=True),
+    sqlalchemy.Column("id", sqlalchemy.String, primary_key=True),
+    # insertion order, kept when a topic is updated in place
+    sqlalchemy.Column(
+        "position",
+        sqlalchemy.BigInteger,
+        transcript_topic_seq,
+        server_default=transcript_topic_seq.next_value(),
+        nullable=False,
+    ),
+    sqlalchemy.Column("data", sqlalchemy.JSON, nullable=False),
+    sqlalchemy.Index(
+        "idx_transcript_topic_transcript_id_position", "transcript_id", "position"
+    ),
+)
 
 
 def generate_transcript_name() -> str:
@@ -207,8 +279,11 @@ class TranscriptParticipant(BaseModel):
     user_id: str | None = None
 
 
-class Transcript(BaseModel):
-    """Full transcript model with all fields."""
+class TranscriptHeader(BaseModel):
+    """
+    Transcript columns without the topics, events, participants, summaries
+    and WebVTT, for status, ownership and audio checks.
+    """
 
     id: str = Field(default_factory=generate_uuid4)
     user_id: str | None = None
@@ -220,12 +295,6 @@ class Transcript(BaseModel):
     source_kind: SourceKind
     room_id: str | None = None
     locked: bool = False
-    short_summary: str | None = None
-    long_summary: str | None = None
-    action_items: dict | None = None
-    topics: list[TranscriptTopic] = []
-    events: list[TranscriptEvent] = []
-    participants: list[TranscriptParticipant] | None = []
     source_language: str = "en"
     target_language: str = "en"
     share_mode: Literal["private", "semi-private", "public"] = "private"
@@ -235,7 +304,6 @@ class Transcript(BaseModel):
     recording_id: str | None = None
     zulip_message_id: int | None = None
     audio_deleted: bool | None = None
-    webvtt: str | None = None
     workflow_run_id: str | None = None  # Hatchet workflow run ID for resumption
     change_seq: int | None = None
 
@@ -245,51 +313,6 @@ class Transcript(BaseModel):
             dt = dt.replace(tzinfo=timezone.utc)
         return dt.isoformat()
 
-    def add_event(
-        self, event: "TranscriptEventName", data: BaseModel
-    ) -> TranscriptEvent:
-        ev = TranscriptEvent(event=event, data=data.model_dump())
-        self.events.append(ev)
-        return ev
-
-    def upsert_topic(self, topic: TranscriptTopic):
-        index = next((i for i, t in enumerate(self.topics) if t.id == topic.id), None)
-        if index is not None:
-            self.topics[index] = topic
-        else:
-            self.topics.append(topic)
-
-    def upsert_participant(self, participant: TranscriptParticipant):
-        if self.participants:
-            index = next(
-                (i for i, p in enumerate(self.participants) if p.id == participant.id),
-                None,
-            )
-            if index is not None:
-                self.participants[index] = participant
-            else:
-                self.participants.append(participant)
-        else:
-            self.participants = [participant]
-        return participant
-
-    def delete_participant(self, participant_id: str):
-        index = next(
-            (i for i, p in enumerate(self.participants) if p.id == participant_id),
-            None,
-        )
-        if index is not None:
-            del self.participants[index]
-
-    def events_dump(self, mode="json"):
-        return [event.model_dump(mode=mode) for event in self.events]
-
-    def topics_dump(self, mode="json"):
-        return [topic.model_dump(mode=mode) for topic in self.topics]
-
-    def participants_dump(self, mode="json"):
-        return [participant.model_dump(mode=mode) for participant in self.participants]
-
     def unlink(self):
         if os.path.exists(self.data_path) and os.path.isdir(self.data_path):
             shutil.rmtree(self.data_path)
@@ -362,6 +385,63 @@ class Transcript(BaseModel):
             url += f"?token={token}"
         return url
 
+
+class Transcript(TranscriptHeader):
+    """Full transcript model with all fields."""
+
+    short_summary: str | None = None
+    long_summary: str | None = None
+    action_items: dict | None = None
+    topics: list[TranscriptTopic] = []
+    events: list[TranscriptEvent] = []
+    participants: list[TranscriptParticipant] | None = []
+    webvtt: str | None = None
+
+    def add_event(
+        self, event: "TranscriptEventName", data: BaseModel
+    ) -> TranscriptEvent:
+        ev = TranscriptEvent(event=event, data=data.model_dump())
+        self.events.append(ev)
+        return ev
+
+    def upsert_topic(self, topic: TranscriptTopic):
+        index = next((i for i, t in enumerate(self.topics) if t.id == topic.id), None)
+        if index is not None:
+            self.topics[index] = topic
+        else:
+            self.topics.append(topic)
+
+    def upsert_participant(self, participant: TranscriptParticipant):
+        if self.participants:
+            index = next(
+                (i for i, p in enumerate(self.participants) if p.id == participant.id),
+                None,
+            )
+            if index is not None:
+                self.participants[index] = participant
+            else:
+                self.participants.append(participant)
+        else:
+            self.participants = [participant]
+        return participant
+
+    def delete_participant(self, participant_id: str):
+        index = next(
+            (i for i, p in enumerate(self.participants) if p.id == participant_id),
+            None,
+        )
+        if index is not None:
+            del self.participants[index]
+
+    def events_dump(self, mode="json"):
+        return [event.model_dump(mode=mode) for event in self.events]
+
+    def topics_dump(self, mode="json"):
+        return [topic.model_dump(mode=mode) for topic in self.topics]
+
+    def participants_dump(self, mode="json"):
+        return [participant.model_dump(mode=mode) for participant in self.participants]
+
     def find_empty_speaker(self) -> int:
         """
         Find an empty speaker seat
@@ -380,7 +460,44 @@ class Transcript(BaseModel):
         raise Exception("No empty speaker found")
 
 
+TranscriptView = TypeVar("TranscriptView", bound=TranscriptHeader)
+
+
+class TranscriptOwnerCache:
+    """
+    Owner (user_id) of recently seen transcripts, used to route websocket
+    events to the owner's room without reading the transcript back.
+
+    Entries expire after `ttl` seconds so ownership changed by another
+    process is picked up; changes made through this process replace the
+    entry right away.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, str | None]] = OrderedDict()
+
+    def get(self, transcript_id: str) -> tuple[bool, str | None]:
+        entry = self._entries.get(transcript_id)
+        if entry is None or entry[0] < time.monotonic():
+            return False, None
+        self._entries.move_to_end(transcript_id)
+        return True, entry[1]
+
+    def set(self, transcript_id: str, user_id: str | None):
+        self._entries[transcript_id] = (time.monotonic() + self.ttl, user_id)
+        self._entries.move_to_end(transcript_id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, transcript_id: str):
+        self._entries.pop(transcript_id, None)
+
+
 class TranscriptController:
+    owners = TranscriptOwnerCache()
+
     async def get_all(
         self,
         user_id: str | None = None,
@@ -397,6 +514,7 @@ class TranscriptController:
             "events",
             "participants",
             "action_items",
+            "search_text",
         ],
     ) -> list[Transcript]:
         """
@@ -470,17 +588,98 @@ class TranscriptController:
         results = await get_database().fetch_all(query)
         return results
 
-    async def get_by_id(self, transcript_id: str, **kwargs) -> Transcript | None:
+    async def get_page(
+        self,
+        limit: int,
+        order_by: str = "-created_at",
+        after: KeysetCursor | None = None,
+        count: CountMode = "none",
+        **kwargs,
+    ) -> tuple[list, KeysetCursor | None, int | None]:
+        """
+        Get a page of transcripts with keyset pagination
+
+        Filters are the ones of `get_all`. The page starts after the `after`
+        cursor, so its cost does not grow with the number of pages before it.
+
+        Returns (rows, cursor of the next page or None, total count in the
+        `count` mode or None).
+        """
+        query = await self.get_all(return_query=True, **kwargs)
+        total = await count_rows(query, count)
+
+        descending = order_by.startswith("-")
+        field = getattr(transcripts.c, order_by.lstrip("-"))
+        # change_seq is unique, other fields need the id to break ties
+        keys = (
+            [field] if field is transcripts.c.change_seq else [field, transcripts.c.id]
+        )
+        if after is not None:
+            query = query.where(keyset_after(keys, after, descending))
+        query = query.order_by(
+            *[key.desc() if descending else key for key in keys]
+        ).limit(limit + 1)
+
+        rows = await get_database().fetch_all(query)
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = KeysetCursor(**{key.name: rows[-1][key.name] for key in keys})
+        return rows, next_cursor, total
+
+    async def get_by_id(
+        self,
+        transcript_id: str,
+        fields: type[TranscriptView] = Transcript,
+        **kwargs,
+    ) -> TranscriptView | None:
         """
         Get a transcript by id
+
+        `fields` is the model to load, e.g. TranscriptHeader to select only
+        its columns and skip the topics and events.
         """
-        query = transcripts.select().where(transcripts.c.id == transcript_id)
+        query = self._select(fields).where(transcripts.c.id == transcript_id)
         if "user_id" in kwargs:
             query = query.where(transcripts.c.user_id == kwargs["user_id"])
         result = await get_database().fetch_one(query)
         if not result:
             return None
-        return Transcript(**result)
+        self.owners.set(result["id"], result["user_id"])
+        return await self._build_view(result, fields)
+
+    @staticmethod
+    def _select(fields: type[TranscriptHeader]):
+        """
+        Select the columns of the `fields` model
+        """
+        if issubclass(fields, Transcript):
+            # search_text is only read by the search
+            return sqlalchemy.select(
+                *[col for col in transcripts.c if col.name != "search_text"]
+            )
+        return sqlalchemy.select(*[transcripts.c[name] for name in fields.model_fields])
+
+    async def _build_view(self, row, fields: type[TranscriptView]) -> TranscriptView:
+        if issubclass(fields, Transcript):
+            return await self._build_transcript(row)
+        return fields(**dict(row))
+
+    async def get_owner(self, transcript_id: str) -> str | None:
+        """
+        Get the user_id of a transcript, from the cache of recently seen
+        transcripts when possible
+        """
+        found, user_id = self.owners.get(transcript_id)
+        if found:
+            return user_id
+        user_id = await get_database().fetch_val(
+            sqlalchemy.select(transcripts.c.user_id).where(
+                transcripts.c.id == transcript_id
+            )
+        )
+        self.owners.set(transcript_id, user_id)
+        return user_id
 
     async def get_by_recording_id(
         self, recording_id: str, **kwargs
@@ -494,7 +693,7 @@ class TranscriptController:
         result = await get_database().fetch_one(query)
         if not result:
             return None
-        return Transcript(**result)
+        return await self._build_transcript(result)
 
     async def get_by_room_id(self, room_id: str, **kwargs) -> list[Transcript]:
         """
@@ -510,13 +709,58 @@ class TranscriptController:
                 field = field.desc()
             query = query.order_by(field)
         results = await get_database().fetch_all(query)
-        return [Transcript(**result) for result in results]
+        return await self._build_transcripts(results)
+
+    async def _build_transcript(self, row) -> Transcript:
+        return (await self._build_transcripts([row]))[0]
+
+    async def _build_transcripts(self, rows) -> list[Transcript]:
+        """
+        Build transcripts from rows, merging events and topics stored in
+        `transcript_event` / `transcript_topic` over the legacy JSON columns
+        """
+        if not rows:
+            return []
+
+        ids = [row["id"] for row in rows]
+        events: dict[str, list[dict]] = {tid: [] for tid in ids}
+        topics: dict[str, list[dict]] = {tid: [] for tid in ids}
+
+        query = (
+            transcript_events.select()
+            .where(transcript_events.c.transcript_id.in_(ids))
+            .order_by(transcript_events.c.id)
+        )
+        for event in await get_database().fetch_all(query):
+            events[event["transcript_id"]].append(
+                {"event": event["event"], "data": event["data"]}
+            )
+
+        query = (
+            transcript_topics.select()
+            .where(transcript_topics.c.transcript_id.in_(ids))
+            .order_by(transcript_topics.c.position)
+        )
+        for topic in await get_database().fetch_all(query):
+            topics[topic["transcript_id"]].append(topic["data"])
+
+        transcripts_list = []
+        for row in rows:
+            values = dict(row)
+            values["events"] = (values.get("events") or []) + events[row["id"]]
+            merged_topics = {topic["id"]: topic for topic in values.get("topics") or []}
+            for topic in topics[row["id"]]:
+                merged_topics[topic["id"]] = topic
+            values["topics"] = list(merged_topics.values())
+            transcripts_list.append(Transcript(**values))
+        return transcripts_list
 
     async def get_by_id_for_http(
         self,
         transcript_id: str,
         user_id: str | None,
-    ) -> Transcript:
+        fields: type[TranscriptView] = Transcript,
+    ) -> TranscriptView:
         """
         Get a transcript by ID for HTTP request.
 
@@ -526,13 +770,13 @@ class TranscriptController:
         This method checks the share mode of the transcript and the user_id
         to determine if the user can access the transcript.
         """
-        query = transcripts.select().where(transcripts.c.id == transcript_id)
+        query = self._select(fields).where(transcripts.c.id == transcript_id)
         result = await get_database().fetch_one(query)
         if not result:
             raise HTTPException(status_code=404, detail="Transcript not found")
 
         # if the transcript is anonymous, share mode is not checked
-        transcript = Transcript(**result)
+        transcript = await self._build_view(result, fields)
         if transcript.user_id is None:
             return transcript
 
@@ -579,27 +823,45 @@ class TranscriptController:
             meeting_id=meeting_id,
             room_id=room_id,
         )
-        query = transcripts.insert().values(**transcript.model_dump())
+        query = transcripts.insert().values(
+            **transcript.model_dump(exclude={"events", "topics"}),
+            events=[],
+            topics=[],
+        )
         await get_database().execute(query)
+        self.owners.set(transcript.id, user_id)
         return transcript
 
     # TODO investigate why mutate= is used. it's used in one place currently, maybe because of ORM field updates.
     # using mutate=True is discouraged
     async def update(
-        self, transcript: Transcript, values: dict, mutate=False
-    ) -> Transcript:
+        self, transcript: TranscriptView, values: dict, mutate=False
+    ) -> TranscriptView:
         """
         Update a transcript fields with key/values in values.
         Returns a copy of the transcript with updated values.
         """
         values = TranscriptController._handle_topics_update(values)
 
-        query = (
-            transcripts.update()
-            .where(transcripts.c.id == transcript.id)
-            .values(**values)
-        )
-        await get_database().execute(query)
+        # full lists replace the normalized rows; the legacy JSON columns
+        # are emptied so they no longer contribute on read
+        row_values = dict(values)
+        async with get_database().transaction():
+            if "events" in values:
+                await self._replace_events(transcript.id, values["events"] or [])
+                row_values["events"] = []
+            if "topics" in values:
+                await self._replace_topics(transcript.id, values["topics"] or [])
+                row_values["topics"] = []
+
+            query = (
+                transcripts.update()
+                .where(transcripts.c.id == transcript.id)
+                .values(**row_values)
+            )
+            await get_database().execute(query)
+        if "user_id" in values:
+            self.owners.set(transcript.id, values["user_id"])
         if mutate:
             for key, value in values.items():
                 setattr(transcript, key, value)
@@ -607,6 +869,39 @@ class TranscriptController:
         updated_transcript = transcript.model_copy(update=values)
         return updated_transcript
 
+    async def _replace_events(self, transcript_id: str, events: list[dict]):
+        await get_database().execute(
+            transcript_events.delete().where(
+                transcript_events.c.transcript_id == transcript_id
+            )
+        )
+        if events:
+            await get_database().execute_many(
+                transcript_events.insert(),
+                [
+                    {
+                        "transcript_id": transcript_id,
+                        "event": event["event"],
+                        "data": event["data"],
+                    }
+                    for event in events
+                ],
+            )
+
+    async def _replace_topics(self, transcript_id: str, topics: list[dict]):
+        await get_database().execute(
+            transcript_topics.delete().where(
+                transcript_topics.c.transcript_id == transcript_id
+            )
+        )
+        # one statement per topic so positions follow the list order
+        for topic in topics:
+            await get_database().execute(
+                transcript_topics.insert().values(
+                    transcript_id=transcript_id, id=topic["id"], data=topic
+                )
+            )
+
     @staticmethod
     def _handle_topics_update(values: dict) -> dict:
         """Auto-update WebVTT when topics are updated."""
@@ -634,7 +929,7 @@ class TranscriptController:
         """
         Remove a transcript by id
         """
-        transcript = await self.get_by_id(transcript_id)
+        transcript = await self.get_by_id(transcript_id, fields=TranscriptHeader)
         if not transcript:
             return
         if user_id is not None and transcript.user_id != user_id:
@@ -674,18 +969,36 @@ class TranscriptController:
                     exc_info=e,
                     recording_id=transcript.recording_id,
                 )
-        query = transcripts.delete().where(transcripts.c.id == transcript_id)
-        await get_database().execute(query)
+        await self._remove_rows([transcript_id])
 
     async def remove_by_recording_id(self, recording_id: str):
         """
         Remove a transcript by recording_id
         """
-        query = transcripts.delete().where(transcripts.c.recording_id == recording_id)
-        await get_database().execute(query)
+        query = transcripts.select().where(transcripts.c.recording_id == recording_id)
+        query = query.with_only_columns([transcripts.c.id])
+        results = await get_database().fetch_all(query)
+        await self._remove_rows([result["id"] for result in results])
+
+    async def _remove_rows(self, transcript_ids: list[str]):
+        """
+        Delete transcript rows along with their events and topics
+        """
+        if not transcript_ids:
+            return
+        for transcript_id in transcript_ids:
+            self.owners.invalidate(transcript_id)
+        async with get_database().transaction():
+            for table in (transcript_events, transcript_topics):
+                await get_database().execute(
+                    table.delete().where(table.c.transcript_id.in_(transcript_ids))
+                )
+            await get_database().execute(
+                transcripts.delete().where(transcripts.c.id.in_(transcript_ids))
+            )
 
     @staticmethod
-    def user_can_mutate(transcript: Transcript, user_id: str | None) -> bool:
+    def user_can_mutate(transcript: TranscriptHeader, user_id: str | None) -> bool:
         """
         Returns True if the given user is allowed to modify the transcript.
 
@@ -707,27 +1020,86 @@ class TranscriptController:
 
     async def append_event(
         self,
-        transcript: Transcript,
+        transcript: TranscriptHeader,
         event: "TranscriptEventName",
         data: Any,
     ) -> TranscriptEvent:
         """
         Append an event to a transcript
         """
-        resp = transcript.add_event(event=event, data=data)
-        await self.update(transcript, {"events": transcript.events_dump()})
+        if isinstance(transcript, Transcript):
+            resp = transcript.add_event(event=event, data=data)
+        else:
+            resp = TranscriptEvent(event=event, data=data.model_dump())
+        query = transcript_events.insert().values(
+            transcript_id=transcript.id,
+            **resp.model_dump(mode="json"),
+        )
+        async with get_database().transaction():
+            await get_database().execute(query)
+            await self._update_row(transcript)
         return resp
 
     async def upsert_topic(
         self,
         transcript: Transcript,
         topic: TranscriptTopic,
+        update_webvtt: bool = True,
     ) -> TranscriptEvent:
         """
         Upsert topics to a transcript
+
+        A new topic extends the WebVTT with its cues only, a replaced one
+        renders it again. With update_webvtt=False the WebVTT is left for
+        a later rebuild_webvtt, for callers replacing many topics.
         """
+        previous_topics = list(transcript.topics)
+        appended = all(previous.id != topic.id for previous in previous_topics)
         transcript.upsert_topic(topic)
-        await self.update(transcript, {"topics": transcript.topics_dump()})
+        query = insert(transcript_topics).values(
+            transcript_id=transcript.id,
+            id=topic.id,
+            data=topic.model_dump(mode="json"),
+        )
+        query = query.on_conflict_do_update(
+            index_elements=["transcript_id", "id"],
+            set_={"data": query.excluded.data},
+        )
+        async with get_database().transaction():
+            await get_database().execute(query)
+            values = {}
+            if update_webvtt:
+                if appended:
+                    transcript.webvtt = append_topic_webvtt(
+                        transcript.webvtt, previous_topics, topic
+                    )
+                else:
+                    transcript.webvtt = topics_to_webvtt(transcript.topics)
+                values["webvtt"] = transcript.webvtt
+            # bumps change_seq even when the WebVTT is left for later
+            await self._update_row(transcript, values)
+
+    async def rebuild_webvtt(self, transcript: Transcript):
+        """
+        Render the WebVTT again from all the topics
+        """
+        transcript.webvtt = topics_to_webvtt(transcript.topics)
+        await self._update_row(transcript, {"webvtt": transcript.webvtt})
+
+    async def _update_row(
+        self, transcript: TranscriptHeader, values: dict | None = None
+    ):
+        """
+        Update the transcript row and advance its change_seq, so pollers see
+        the events and topics stored in their own tables too
+        """
+        query = (
+            transcripts.update()
+            .where(transcripts.c.id == transcript.id)
+            .values(change_seq=transcript_change_seq.next_value(), **(values or {}))
+            .returning(transcripts.c.change_seq)
+        )
+        transcript.change_seq = await get_database().fetch_val(query)
 
     async def move_mp3_to_storage(self, transcript: Transcript):
         """
@@ -746,9 +1118,9 @@ class TranscriptController:
                     f"Audio file not found: {transcript.audio_mp3_filename}"
                 )
 
-            await get_transcripts_storage().put_file(
+            await get_transcripts_storage().put_file_stream(
                 transcript.storage_audio_path,
-                transcript.audio_mp3_filename.read_bytes(),
+                transcript.audio_mp3_filename,
             )
 
             # indicate on the transcript that the audio is now on storage
@@ -802,7 +1174,7 @@ class TranscriptController:
         Will add an event STATUS + update the status field of transcript
         """
         async with self.transaction():
-            transcript = await self.get_by_id(transcript_id)
+            transcript = await self.get_by_id(transcript_id, fields=TranscriptHeader)
             if not transcript:
                 raise Exception(f"Transcript {transcript_id} not found")
             if transcript.status == status:
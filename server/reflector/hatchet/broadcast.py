@@ -10,7 +10,11 @@ from typing import Any
 
 import structlog
 
-from reflector.db.transcripts import Transcript, TranscriptEvent, transcripts_controller
+from reflector.db.transcripts import (
+    TranscriptEvent,
+    TranscriptHeader,
+    transcripts_controller,
+)
 from reflector.utils.string import NonEmptyString
 from reflector.ws_events import TranscriptEventName
 from reflector.ws_manager import get_ws_manager
@@ -23,9 +27,13 @@ async def broadcast_event(
     transcript_id: NonEmptyString,
     event: TranscriptEvent,
     logger: structlog.BoundLogger,
+    user_id: str | None = None,
 ) -> None:
     """Broadcast a TranscriptEvent to WebSocket subscribers.
 
+    The owner's room is routed with `user_id` when the caller has the
+    transcript at hand, otherwise with the cached owner of the transcript.
+
     Fire-and-forget: errors are logged but don't interrupt workflow execution.
     """
     logger.info(
@@ -47,10 +55,11 @@ async def broadcast_event(
         )
 
         if event.event in USER_ROOM_EVENTS:
-            transcript = await transcripts_controller.get_by_id(transcript_id)
-            if transcript and transcript.user_id:
+            if user_id is None:
+                user_id = await transcripts_controller.get_owner(transcript_id)
+            if user_id:
                 await ws_manager.send_json(
-                    room_id=f"user:{transcript.user_id}",
+                    room_id=f"user:{user_id}",
                     message={
                         "event": f"TRANSCRIPT_{event.event}",
                         "data": {"id": transcript_id, **event.data},
@@ -81,7 +90,7 @@ async def set_status_and_broadcast(
 
 async def append_event_and_broadcast(
     transcript_id: NonEmptyString,
-    transcript: Transcript,
+    transcript: TranscriptHeader,
     event_name: TranscriptEventName,
     data: Any,
     logger: structlog.BoundLogger,
@@ -95,5 +104,7 @@ async def append_event_and_broadcast(
         event=event_name,
         data=data,
     )
-    await broadcast_event(transcript_id, event, logger=logger)
+    await broadcast_event(
+        transcript_id, event, logger=logger, user_id=transcript.user_id
+    )
     return event
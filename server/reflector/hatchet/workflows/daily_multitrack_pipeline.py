@@ -178,6 +178,9 @@ def _spawn_storage():
         aws_access_key_id=settings.TRANSCRIPT_STORAGE_AWS_ACCESS_KEY_ID,
         aws_secret_access_key=settings.TRANSCRIPT_STORAGE_AWS_SECRET_ACCESS_KEY,
         aws_endpoint_url=settings.TRANSCRIPT_STORAGE_AWS_ENDPOINT_URL,
+        aws_max_pool_connections=settings.TRANSCRIPT_STORAGE_AWS_MAX_POOL_CONNECTIONS,
+        aws_multipart_part_size=settings.TRANSCRIPT_STORAGE_AWS_MULTIPART_PART_SIZE,
+        aws_multipart_concurrency=settings.TRANSCRIPT_STORAGE_AWS_MULTIPART_CONCURRENCY,
     )
 
 
@@ -274,10 +277,15 @@ async def get_recording(input: PipelineInput, ctx: Context) -> RecordingResult:
     # Set transcript status to "processing" at workflow start (broadcasts to WebSocket)
     ctx.log("get_recording: establishing DB connection...")
     async with fresh_db_connection():
-        from reflector.db.transcripts import transcripts_controller  # noqa: PLC0415
+        from reflector.db.transcripts import (  # noqa: PLC0415
+            TranscriptHeader,
+            transcripts_controller,
+        )
 
         ctx.log("get_recording: DB connection established, fetching transcript...")
-        transcript = await transcripts_controller.get_by_id(input.transcript_id)
+        transcript = await transcripts_controller.get_by_id(
+            input.transcript_id, fields=TranscriptHeader
+        )
         ctx.log(f"get_recording: transcript exists={transcript is not None}")
         if transcript:
             ctx.log(
@@ -564,21 +572,26 @@ async def mixdown_tracks(input: PipelineInput, ctx: Context) -> MixdownResult:
         logger=logger,
         progress_callback=make_audio_progress_logger(ctx, TaskName.MIXDOWN_TRACKS),
         expected_duration_sec=recording_duration if recording_duration > 0 else None,
+        max_workers=settings.MIXDOWN_DECODE_WORKERS,
     )
     await writer.flush()
 
     file_size = Path(output_path).stat().st_size
     storage_path = f"{input.transcript_id}/audio.mp3"
 
-    with open(output_path, "rb") as mixed_file:
-        await storage.put_file(storage_path, mixed_file)
+    await storage.put_file_stream(storage_path, output_path)
 
     Path(output_path).unlink(missing_ok=True)
 
     async with fresh_db_connection():
-        from reflector.db.transcripts import transcripts_controller  # noqa: PLC0415
+        from reflector.db.transcripts import (  # noqa: PLC0415
+            TranscriptHeader,
+            transcripts_controller,
+        )
 
-        transcript = await transcripts_controller.get_by_id(input.transcript_id)
+        transcript = await transcripts_controller.get_by_id(
+            input.transcript_id, fields=TranscriptHeader
+        )
         if transcript:
             await transcripts_controller.update(
                 transcript, {"audio_location": "storage"}
@@ -604,6 +617,7 @@ async def generate_waveform(input: PipelineInput, ctx: Context) -> WaveformResul
     ctx.log(f"generate_waveform: transcript_id={input.transcript_id}")
 
     from reflector.db.transcripts import (  # noqa: PLC0415
+        TranscriptHeader,
         TranscriptWaveform,
         transcripts_controller,
     )
@@ -634,7 +648,9 @@ async def generate_waveform(input: PipelineInput, ctx: Context) -> WaveformResul
         )
 
         async with fresh_db_connection():
-            transcript = await transcripts_controller.get_by_id(input.transcript_id)
+            transcript = await transcripts_controller.get_by_id(
+                input.transcript_id, fields=TranscriptHeader
+            )
             if transcript:
                 # Write waveform to file (same as Celery AudioWaveformProcessor)
                 transcript.data_path.mkdir(parents=True, exist_ok=True)
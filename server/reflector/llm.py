@@ -18,6 +18,7 @@ from llama_index.llms.openai_like import OpenAILike
 from pydantic import BaseModel, ValidationError
 from workflows.errors import WorkflowTimeoutError
 
+from reflector.llm_cache import get_llm_cache, make_cache_key
 from reflector.utils.retry import retry
 
 T = TypeVar("T", bound=BaseModel)
@@ -212,6 +213,7 @@ class LLM:
         self.context_window = settings.LLM_CONTEXT_WINDOW
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.cache = get_llm_cache(settings)
 
         self._configure_llamaindex()
 
@@ -231,13 +233,36 @@ class LLM:
             additional_kwargs={"extra_body": {"litellm_session_id": session_id}},
         )
 
+    def _cache_key(self, kind: str, **parts) -> str:
+        return make_cache_key(
+            kind=kind,
+            url=self.url,
+            model=self.model_name,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            **parts,
+        )
+
     async def get_response(
         self, prompt: str, texts: list[str], tone_name: str | None = None
     ) -> str:
         """Get a text response using TreeSummarize for non-function-calling models"""
+        cache_key = None
+        if self.cache:
+            cache_key = self._cache_key(
+                "response", prompt=prompt, texts=texts, tone_name=tone_name
+            )
+            cached = await self.cache.get(cache_key, kind="response")
+            if cached is not None:
+                return cached
+
         summarizer = TreeSummarize(verbose=False)
         response = await summarizer.aget_response(prompt, texts, tone_name=tone_name)
-        return str(response).strip()
+        result = str(response).strip()
+
+        if cache_key:
+            await self.cache.set(cache_key, result)
+        return result
 
     async def get_structured_response(
         self,
@@ -251,6 +276,24 @@ class LLM:
         if timeout is None:
             timeout = self.settings_obj.LLM_STRUCTURED_RESPONSE_TIMEOUT
 
+        cache_key = None
+        if self.cache:
+            cache_key = self._cache_key(
+                "structured",
+                prompt=prompt,
+                texts=texts,
+                tone_name=tone_name,
+                schema=output_cls.model_json_schema(),
+            )
+            cached = await self.cache.get(cache_key, kind="structured")
+            if cached is not None:
+                try:
+                    return output_cls.model_validate_json(cached)
+                except ValidationError:
+                    logger.warning(
+                        f"Ignoring stale cached {output_cls.__name__} response"
+                    )
+
         async def run_workflow():
             workflow = StructuredOutputWorkflow(
                 output_cls=output_cls,
@@ -274,9 +317,13 @@ class LLM:
 
             return result["success"]
 
-        return await retry(run_workflow)(
+        result = await retry(run_workflow)(
             retry_attempts=3,
             retry_backoff_interval=1.0,
             retry_backoff_max=30.0,
             retry_ignore_exc_types=(WorkflowTimeoutError,),
         )
+
+        if cache_key:
+            await self.cache.set(cache_key, result.model_dump_json())
+        return result
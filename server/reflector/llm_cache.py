@@ -0,0 +1,160 @@
+"""
+Content-addressed cache for LLM responses.
+
+Responses are keyed on a hash of everything that shapes the model output:
+backend URL, model, prompt, texts, tone, output schema, temperature and max
+tokens. A reprocess of an unchanged transcript then gets its summaries,
+titles and topics back without calling the model again.
+
+Backends:
+- redis: shared between workers, stored in `REDIS_CACHE_DB`
+- disk: one JSON file per entry under `LLM_CACHE_DIR`
+
+Cache failures are logged and never surface to the caller: a broken cache
+only means the model is called.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import structlog
+from prometheus_client import Counter
+
+from reflector.redis_cache import get_async_redis_client
+
+logger = structlog.get_logger(__name__)
+
+m_cache_hit = Counter(
+    "llm_cache_hit",
+    "Number of LLM responses served from the cache",
+    ["backend", "kind"],
+)
+m_cache_miss = Counter(
+    "llm_cache_miss",
+    "Number of LLM responses not found in the cache",
+    ["backend", "kind"],
+)
+
+
+def make_cache_key(**parts) -> str:
+    """Return a stable hash of the request parts"""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    name: str = "base"
+
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+
+    async def get(self, key: str, kind: str) -> str | None:
+        try:
+            value = await self._get(key)
+        except Exception:
+            logger.exception("LLM cache read failed", backend=self.name)
+            value = None
+
+        if value is None:
+            m_cache_miss.labels(self.name, kind).inc()
+        else:
+            m_cache_hit.labels(self.name, kind).inc()
+        return value
+
+    async def set(self, key: str, value: str):
+        try:
+            await self._set(key, value)
+        except Exception:
+            logger.exception("LLM cache write failed", backend=self.name)
+
+    async def _get(self, key: str) -> str | None:
+        raise NotImplementedError
+
+    async def _set(self, key: str, value: str):
+        raise NotImplementedError
+
+
+class RedisLLMCache(LLMCache):
+    name = "redis"
+
+    def __init__(self, ttl: int, db: int, prefix: str = "llm_cache"):
+        super().__init__(ttl)
+        self.db = db
+        self.prefix = prefix
+        self._client = None
+        self._client_loop = None
+
+    async def _get_client(self):
+        # the connection pool is bound to the loop that created it
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = await get_async_redis_client(self.db)
+            self._client_loop = loop
+        return self._client
+
+    async def _get(self, key: str) -> str | None:
+        client = await self._get_client()
+        value = await client.get(f"{self.prefix}:{key}")
+        return value.decode("utf-8") if value is not None else None
+
+    async def _set(self, key: str, value: str):
+        client = await self._get_client()
+        await client.set(f"{self.prefix}:{key}", value, ex=self.ttl)
+
+
+class DiskLLMCache(LLMCache):
+    name = "disk"
+
+    def __init__(self, ttl: int, path: str | Path):
+        super().__init__(ttl)
+        self.path = Path(path)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.path / key[:2] / f"{key}.json"
+
+    async def _get(self, key: str) -> str | None:
+        return await asyncio.to_thread(self._read, self._entry_path(key))
+
+    async def _set(self, key: str, value: str):
+        await asyncio.to_thread(self._write, self._entry_path(key), value)
+
+    def _read(self, path: Path) -> str | None:
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+
+        if entry["expires_at"] < time.time():
+            path.unlink(missing_ok=True)
+            return None
+        return entry["value"]
+
+    def _write(self, path: Path, value: str):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {"expires_at": time.time() + self.ttl, "value": value}
+        # write to a temporary file first so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def get_llm_cache(settings) -> LLMCache | None:
+    """Build the cache configured in settings, or None when disabled"""
+    backend = settings.LLM_CACHE_BACKEND
+    if not backend:
+        return None
+    if backend == "redis":
+        return RedisLLMCache(ttl=settings.LLM_CACHE_TTL, db=settings.REDIS_CACHE_DB)
+    if backend == "disk":
+        return DiskLLMCache(ttl=settings.LLM_CACHE_TTL, path=settings.LLM_CACHE_DIR)
+    raise ValueError(f"Unknown LLM cache backend: {backend}")
@@ -0,0 +1,45 @@
+"""
+Concurrency and rate limit for LLM calls.
+
+Shared by the callers that fan LLM calls out, so a transcript cannot open
+more requests at once, or per second, than the LLM backend accepts.
+"""
+
+import asyncio
+import time
+
+
+class LLMCallLimiter:
+    """
+    Bound concurrent LLM calls, used as `async with limiter:` around each call.
+
+    At most `concurrency` calls run at once, and when `rate_limit` is set,
+    calls start at most `rate_limit` times per second.
+    """
+
+    def __init__(self, concurrency: int, rate_limit: float = 0) -> None:
+        self.semaphore = asyncio.Semaphore(max(1, concurrency))
+        self.interval = 1.0 / rate_limit if rate_limit > 0 else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        await self.semaphore.acquire()
+        if self.interval:
+            try:
+                await self._wait_turn()
+            except BaseException:
+                self.semaphore.release()
+                raise
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.semaphore.release()
+
+    async def _wait_turn(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
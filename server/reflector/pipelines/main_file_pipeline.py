@@ -19,6 +19,7 @@ from reflector.db.rooms import rooms_controller
 from reflector.db.transcripts import (
     SourceKind,
     Transcript,
+    TranscriptHeader,
     TranscriptStatus,
     transcripts_controller,
 )
@@ -157,11 +158,8 @@ class PipelineMainFile(PipelineMainBase):
 
         self.logger.info("Uploading audio to storage")
 
-        with open(audio_path, "rb") as f:
-            audio_data = f.read()
-
         storage_path = f"file_pipeline/{transcript.id}/audio.mp3"
-        await storage.put_file(storage_path, audio_data)
+        await storage.put_file_stream(storage_path, audio_path)
 
         audio_url = await storage.get_file_url(storage_path)
 
@@ -312,7 +310,9 @@ class PipelineMainFile(PipelineMainBase):
 @asynctask
 async def task_send_webhook_if_needed(*, transcript_id: str):
     """Send webhook if this is a room recording with webhook configured"""
-    transcript = await transcripts_controller.get_by_id(transcript_id)
+    transcript = await transcripts_controller.get_by_id(
+        transcript_id, fields=TranscriptHeader
+    )
     if not transcript:
         return
 
@@ -334,7 +334,9 @@ async def task_send_webhook_if_needed(*, transcript_id: str):
 @asynctask
 async def task_pipeline_file_process(*, transcript_id: str):
     """Celery task for file pipeline processing"""
-    transcript = await transcripts_controller.get_by_id(transcript_id)
+    transcript = await transcripts_controller.get_by_id(
+        transcript_id, fields=TranscriptHeader
+    )
     if not transcript:
         raise Exception(f"Transcript {transcript_id} not found")
 
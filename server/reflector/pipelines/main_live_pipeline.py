@@ -87,18 +87,19 @@ def broadcast_to_sockets(func):
             message=resp.model_dump(mode="json"),
         )
 
-        transcript = await transcripts_controller.get_by_id(self.transcript_id)
-        if transcript and transcript.user_id:
-            # Emit only relevant events to the user room to avoid noisy updates.
-            # Allowed: STATUS, FINAL_TITLE, DURATION. All are prefixed with TRANSCRIPT_
-            allowed_user_events: set[TranscriptEventName] = {
-                "STATUS",
-                "FINAL_TITLE",
-                "DURATION",
-            }
-            if resp.event in allowed_user_events:
+        # Emit only relevant events to the user room to avoid noisy updates.
+        # Allowed: STATUS, FINAL_TITLE, DURATION. All are prefixed with TRANSCRIPT_
+        allowed_user_events: set[TranscriptEventName] = {
+            "STATUS",
+            "FINAL_TITLE",
+            "DURATION",
+        }
+        if resp.event in allowed_user_events:
+            # the owner is cached since the pipeline loaded the transcript
+            user_id = await transcripts_controller.get_owner(self.transcript_id)
+            if user_id:
                 await self.ws_manager.send_json(
-                    room_id=f"user:{transcript.user_id}",
+                    room_id=f"user:{user_id}",
                     message={
                         "event": f"TRANSCRIPT_{resp.event}",
                         "data": {"id": self.transcript_id, **resp.data},
@@ -146,6 +147,10 @@ class StrValue(BaseModel):
 
 
 class PipelineMainBase(PipelineRunner[PipelineMessage], Generic[PipelineMessage]):
+    # leave the WebVTT out of topic upserts, rebuilt once when the pipeline
+    # ends or fails
+    defer_webvtt = False
+
     def __init__(self, transcript_id: str):
         super().__init__()
         self._lock = asyncio.Lock()
@@ -253,7 +258,9 @@ class PipelineMainBase(PipelineRunner[PipelineMessage], Generic[PipelineMessage]
         get_topic = GetTranscriptTopic.from_transcript_topic(topic)
         async with self.transaction():
             transcript = await self.get_transcript()
-            await transcripts_controller.upsert_topic(transcript, topic)
+            await transcripts_controller.upsert_topic(
+                transcript, topic, update_webvtt=not self.defer_webvtt
+            )
             return await transcripts_controller.append_event(
                 transcript=transcript,
                 event="TOPIC",
@@ -378,9 +385,14 @@ class PipelineMainLive(PipelineMainBase):
             AudioDownscaleProcessor(),
             AudioChunkerAutoProcessor(),
             AudioMergeProcessor(),
-            AudioTranscriptAutoProcessor.as_threaded(),
+            AudioTranscriptAutoProcessor.as_pool(
+                max_workers=settings.TRANSCRIPT_LIVE_WORKERS
+            ),
             TranscriptLinerProcessor(),
-            TranscriptTranslatorAutoProcessor.as_threaded(callback=self.on_transcript),
+            TranscriptTranslatorAutoProcessor.as_pool(
+                max_workers=settings.TRANSLATE_BATCH_MAX_SIZE,
+                callback=self.on_transcript,
+            ),
             TranscriptTopicDetectorProcessor.as_threaded(callback=self.on_topic),
         ]
         pipeline = Pipeline(*processors)
@@ -405,6 +417,9 @@ class PipelineMainDiarization(PipelineMainBase[AudioDiarizationInput]):
     Diarize the audio and update topics
     """
 
+    # every topic is replaced with its diarized words
+    defer_webvtt = True
+
     async def create(self) -> Pipeline:
         # create a context for the whole rtc transaction
         # add a customised logger to the context
@@ -438,6 +453,20 @@ class PipelineMainDiarization(PipelineMainBase[AudioDiarizationInput]):
 
         return pipeline
 
+    async def on_status(self, status):
+        await super().on_status(status)
+        if status == "error":
+            # topics diarized before the failure are stored already
+            await self.rebuild_webvtt()
+
+    async def on_ended(self):
+        await self.rebuild_webvtt()
+
+    async def rebuild_webvtt(self):
+        async with self.transaction():
+            transcript = await self.get_transcript()
+            await transcripts_controller.rebuild_webvtt(transcript)
+
 
 class PipelineMainFromTopics(PipelineMainBase[TitleSummaryWithIdProcessorType]):
     """
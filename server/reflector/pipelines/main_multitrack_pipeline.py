@@ -28,6 +28,7 @@ from reflector.processors import AudioFileWriterProcessor
 from reflector.processors.audio_waveform_processor import AudioWaveformProcessor
 from reflector.processors.types import TitleSummary
 from reflector.processors.types import Transcript as TranscriptType
+from reflector.settings import settings
 from reflector.storage import Storage, get_transcripts_storage
 from reflector.utils.audio_constants import PRESIGNED_URL_EXPIRATION_SECONDS
 from reflector.utils.audio_mixdown import (
@@ -155,9 +156,7 @@ class PipelineMainMultitrack(PipelineMainBase):
                         f"file_pipeline/{transcript.id}/tracks/padded_{track_idx}.webm"
                     )
 
-                    # Upload using file handle for streaming
-                    with open(temp_path, "rb") as padded_file:
-                        await storage.put_file(storage_path, padded_file)
+                    await storage.put_file_stream(storage_path, temp_path)
                 finally:
                     Path(temp_path).unlink(missing_ok=True)
 
@@ -208,6 +207,7 @@ class PipelineMainMultitrack(PipelineMainBase):
             target_sample_rate,
             offsets_seconds=offsets_seconds,
             logger=self.logger,
+            max_workers=settings.MIXDOWN_DECODE_WORKERS,
         )
 
     @broadcast_to_sockets
@@ -365,10 +365,10 @@ class PipelineMainMultitrack(PipelineMainBase):
             )
 
         storage_path = f"{transcript.id}/audio.mp3"
-        # Use file handle streaming to avoid loading entire MP3 into memory
         mp3_size = transcript.audio_mp3_filename.stat().st_size
-        with open(transcript.audio_mp3_filename, "rb") as mp3_file:
-            await transcript_storage.put_file(storage_path, mp3_file)
+        await transcript_storage.put_file_stream(
+            storage_path, transcript.audio_mp3_filename
+        )
         mp3_url = await transcript_storage.get_file_url(storage_path)
 
         await transcripts_controller.update(transcript, {"audio_location": "storage"})
@@ -6,11 +6,13 @@ Shared topic detection, title generation, and summarization logic
 used across file and multitrack pipelines.
 """
 
+import asyncio
 from typing import Callable
 
 import structlog
 
 from reflector.db.transcripts import Transcript
+from reflector.llm_limiter import LLMCallLimiter
 from reflector.processors import (
     TranscriptFinalSummaryProcessor,
     TranscriptFinalTitleProcessor,
@@ -18,6 +20,7 @@ from reflector.processors import (
 )
 from reflector.processors.types import TitleSummary
 from reflector.processors.types import Transcript as TranscriptType
+from reflector.settings import settings
 from reflector.utils.transcript_constants import TOPIC_CHUNK_WORD_COUNT
 
 
@@ -32,35 +35,88 @@ class EmptyPipeline:
         pass
 
 
+def group_topic_chunks(
+    transcript: TranscriptType, min_transcript_length: int
+) -> list[TranscriptType]:
+    """
+    Split the transcript the way a single topic detector would consume it:
+    chunks of TOPIC_CHUNK_WORD_COUNT words, joined until their text is longer
+    than `min_transcript_length`. Each group is one topic.
+    """
+    groups: list[TranscriptType] = []
+    words = []
+    text_length = 0
+    for i in range(0, len(transcript.words), TOPIC_CHUNK_WORD_COUNT):
+        chunk_words = transcript.words[i : i + TOPIC_CHUNK_WORD_COUNT]
+        words.extend(chunk_words)
+        text_length += sum(len(word.text) for word in chunk_words)
+        if text_length > min_transcript_length:
+            groups.append(
+                TranscriptType(words=words, translation=transcript.translation)
+            )
+            words = []
+            text_length = 0
+    if words:
+        groups.append(TranscriptType(words=words, translation=transcript.translation))
+    return groups
+
+
 async def detect_topics(
     transcript: TranscriptType,
     target_language: str,
     *,
     on_topic_callback: Callable,
     empty_pipeline: EmptyPipeline,
+    concurrency: int | None = None,
+    rate_limit: float | None = None,
 ) -> list[TitleSummary]:
-    chunk_size = TOPIC_CHUNK_WORD_COUNT
+    """
+    Detect the topics of each group of chunks with its own detector, up to
+    `concurrency` at once. Topics are reported in timestamp order, as soon
+    as every earlier group is done.
+    """
+    groups = group_topic_chunks(transcript, int(settings.MIN_TRANSCRIPT_LENGTH))
+    limiter = LLMCallLimiter(
+        concurrency=concurrency or settings.TOPIC_DETECTION_CONCURRENCY,
+        rate_limit=(
+            settings.TOPIC_DETECTION_RATE_LIMIT if rate_limit is None else rate_limit
+        ),
+    )
     topics: list[TitleSummary] = []
-
-    async def on_topic(topic: TitleSummary):
-        topics.append(topic)
-        return await on_topic_callback(topic)
-
-    topic_detector = TranscriptTopicDetectorProcessor(callback=on_topic)
-    topic_detector.set_pipeline(empty_pipeline)
-
-    for i in range(0, len(transcript.words), chunk_size):
-        chunk_words = transcript.words[i : i + chunk_size]
-        if not chunk_words:
-            continue
-
-        chunk_transcript = TranscriptType(
-            words=chunk_words, translation=transcript.translation
-        )
-
-        await topic_detector.push(chunk_transcript)
-
-    await topic_detector.flush()
+    done: dict[int, list[TitleSummary]] = {}
+    next_index = 0
+    emit_lock = asyncio.Lock()
+
+    async def detect(index: int, group: TranscriptType):
+        nonlocal next_index
+        group_topics: list[TitleSummary] = []
+
+        async def on_topic(topic: TitleSummary):
+            group_topics.append(topic)
+
+        topic_detector = TranscriptTopicDetectorProcessor(callback=on_topic)
+        topic_detector.set_pipeline(empty_pipeline)
+        async with limiter:
+            await topic_detector.push(group)
+            await topic_detector.flush()
+
+        async with emit_lock:
+            done[index] = group_topics
+            while next_index in done:
+                for topic in done.pop(next_index):
+                    topics.append(topic)
+                    await on_topic_callback(topic)
+                next_index += 1
+
+    tasks = [
+        asyncio.create_task(detect(index, group)) for index, group in enumerate(groups)
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
     return topics
 
 
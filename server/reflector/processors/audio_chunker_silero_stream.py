@@ -0,0 +1,211 @@
+from typing import Optional
+
+import av
+import numpy as np
+
+from reflector.processors.audio_chunker_auto import AudioChunkerAutoProcessor
+from reflector.processors.audio_chunker_silero import AudioChunkerSileroProcessor
+
+
+class SileroVADStream:
+    """
+    Incremental speech boundary detection over a continuous 16kHz mono stream.
+
+    Samples can be pushed in pieces of any size. Every complete window is fed
+    once to the VAD iterator, which keeps the model recurrent state between
+    pushes; leftover samples wait in a fixed-size window buffer. The boundary
+    rule is the same as `AudioChunkerSileroProcessor._find_speech_segment_end`:
+    a segment ends `min_silence_windows` windows after the last speech event,
+    at the start of the first silent window.
+    """
+
+    def __init__(self, vad_iterator, window_size=512, min_silence_windows=3):
+        self.vad_iterator = vad_iterator
+        self.window_size = window_size
+        self.min_silence_windows = min_silence_windows
+        self._window = np.zeros(window_size, dtype=np.float32)
+        self._window_fill = 0
+        self._position = 0
+        self._in_speech = False
+        self._silence_count = 0
+
+    @property
+    def in_speech(self) -> bool:
+        return self._in_speech
+
+    @property
+    def position(self) -> int:
+        """Absolute sample index of the next window to be analysed"""
+        return self._position
+
+    def push(self, samples: np.ndarray) -> list[int]:
+        """
+        Feed samples and return the absolute sample positions of every speech
+        segment end detected within them
+        """
+        ends = []
+        offset = 0
+        total = len(samples)
+        while offset < total:
+            take = min(self.window_size - self._window_fill, total - offset)
+            self._window[self._window_fill : self._window_fill + take] = samples[
+                offset : offset + take
+            ]
+            self._window_fill += take
+            offset += take
+            if self._window_fill < self.window_size:
+                break
+            self._window_fill = 0
+            end = self._process_window()
+            if end is not None:
+                ends.append(end)
+        return ends
+
+    def reset(self):
+        if hasattr(self.vad_iterator, "reset_states"):
+            self.vad_iterator.reset_states()
+        self._window_fill = 0
+        self._position = 0
+        self._in_speech = False
+        self._silence_count = 0
+
+    def _process_window(self) -> Optional[int]:
+        start = self._position
+        self._position += self.window_size
+
+        speech_dict = self.vad_iterator(self._window, return_seconds=True)
+        if speech_dict:
+            self._in_speech = True
+            self._silence_count = 0
+            return None
+
+        if not self._in_speech:
+            return None
+
+        self._silence_count += 1
+        if self._silence_count < self.min_silence_windows:
+            return None
+
+        self._in_speech = False
+        self._silence_count = 0
+        return start - (self.min_silence_windows - 1) * self.window_size
+
+
+class AudioChunkerSileroStreamProcessor(AudioChunkerSileroProcessor):
+    """
+    Silero VAD chunker that analyses each frame once as it arrives.
+
+    Unlike the `silero` backend, the buffer is never re-scanned: the VAD state
+    is kept in a `SileroVADStream`, so the cost per frame stays constant
+    whatever the buffer length. Chunk boundaries follow the same rules.
+    """
+
+    def __init__(self, silence_frames=768, keep_frames=256, **kwargs):
+        super().__init__(**kwargs)
+        self.silence_frames = silence_frames
+        self.keep_frames = keep_frames
+        self.frames_start = 0
+        self.vad_stream = (
+            SileroVADStream(self.vad_iterator) if self.vad_iterator else None
+        )
+
+    async def _chunk(self, data: av.AudioFrame) -> Optional[list[av.AudioFrame]]:
+        """Process audio frame and return chunk when ready"""
+        self.frames.append(data)
+
+        ends = []
+        if self.vad_stream is not None:
+            try:
+                ends = self.vad_stream.push(self._frame_to_numpy(data))
+            except Exception as e:
+                self.logger.error(f"Error in VAD processing: {e}")
+                return self._fallback_chunk(self.block_frames, "exception-fallback")
+
+        if ends:
+            frames_to_emit = self._split_at(ends[-1])
+            if frames_to_emit is not None:
+                return self._filter_min_frames(frames_to_emit, "")
+
+        # Safety fallback - emit if we hit max frames
+        if len(self.frames) >= self.max_frames:
+            self.logger.warning(
+                f"AudioChunkerSileroStreamProcessor: Reached max frames ({self.max_frames}), "
+                f"emitting first {self.max_frames // 2} frames"
+            )
+            return self._fallback_chunk(self.max_frames // 2, "fallback")
+
+        # Long stretch without speech, discard old frames
+        in_speech = self.vad_stream is not None and self.vad_stream.in_speech
+        if not in_speech and len(self.frames) > self.silence_frames:
+            self.logger.debug(
+                f"Discarding {len(self.frames) - self.keep_frames} old frames (likely silence)"
+            )
+            self._take(len(self.frames) - self.keep_frames)
+
+        return None
+
+    def _frame_to_numpy(self, frame: av.AudioFrame) -> np.ndarray:
+        """Convert a single frame to float32 samples"""
+        frame_array = frame.to_ndarray().reshape(-1)
+        if frame_array.dtype == np.int16:
+            return frame_array.astype(np.float32) / 32768.0
+        return frame_array.astype(np.float32, copy=False)
+
+    def _take(self, count: int) -> list[av.AudioFrame]:
+        """Remove the first `count` frames from the buffer, keeping positions"""
+        taken = self.frames[:count]
+        self.frames = self.frames[count:]
+        self.frames_start += sum(f.samples for f in taken)
+        return taken
+
+    def _split_at(self, speech_end: int) -> Optional[list[av.AudioFrame]]:
+        """Return the frames that end before `speech_end`"""
+        frame_index = 0
+        position = self.frames_start
+        for frame in self.frames:
+            position += frame.samples
+            if position > speech_end:
+                break
+            frame_index += 1
+
+        if frame_index <= 0:
+            return None
+
+        buffer_before = len(self.frames)
+        frames_to_emit = self._take(frame_index)
+        total_samples = sum(f.samples for f in frames_to_emit)
+        sample_rate = frames_to_emit[0].sample_rate
+        self.logger.info(
+            "Speech segment found",
+            frames=frame_index,
+            duration=round(total_samples / sample_rate, 2) if sample_rate else 0,
+            buffer_before=buffer_before,
+            remaining=len(self.frames),
+        )
+        return frames_to_emit
+
+    def _fallback_chunk(self, count: int, reason: str) -> Optional[list[av.AudioFrame]]:
+        if len(self.frames) < count:
+            return None
+        return self._filter_min_frames(self._take(count), reason)
+
+    def _filter_min_frames(
+        self, frames: list[av.AudioFrame], reason: str
+    ) -> Optional[list[av.AudioFrame]]:
+        if len(frames) >= self.min_frames:
+            return frames
+        prefix = f"{reason} " if reason else ""
+        self.logger.debug(
+            f"Ignoring {prefix}segment with {len(frames)} frames "
+            f"(< {self.min_frames} minimum)"
+        )
+        return None
+
+    async def _flush(self):
+        await super()._flush()
+        self.frames_start = 0
+        if self.vad_stream is not None:
+            self.vad_stream.reset()
+
+
+AudioChunkerAutoProcessor.register("silero_stream", AudioChunkerSileroStreamProcessor)
@@ -1,3 +1,5 @@
+from bisect import bisect_left, bisect_right
+
 from reflector.processors.base import Processor
 from reflector.processors.types import (
     AudioDiarizationInput,
@@ -75,21 +77,22 @@ class AudioDiarizationProcessor(Processor):
 
         Warning: this function mutate the diarization list
         """
-        # remove overlap by keeping the longest segment
-        diarization_idx = 0
-        while diarization_idx < len(diarization) - 1:
-            d = diarization[diarization_idx]
-            dnext = diarization[diarization_idx + 1]
-            if d["end"] > dnext["start"]:
-                # remove the shortest segment
-                if d["end"] - d["start"] > dnext["end"] - dnext["start"]:
-                    # remove next segment
-                    diarization.pop(diarization_idx + 1)
-                else:
-                    # remove current segment
-                    diarization.pop(diarization_idx)
+        if not diarization:
+            return
+
+        # single pass: `current` is compared to the next segment until one of
+        # them is kept, removing the shortest one on overlap
+        kept = []
+        current = diarization[0]
+        for dnext in diarization[1:]:
+            if current["end"] > dnext["start"]:
+                if current["end"] - current["start"] <= dnext["end"] - dnext["start"]:
+                    current = dnext
             else:
-                diarization_idx += 1
+                kept.append(current)
+                current = dnext
+        kept.append(current)
+        diarization[:] = kept
 
     @staticmethod
     def _diarization_remove_segment_without_words(
@@ -98,29 +101,25 @@ class AudioDiarizationProcessor(Processor):
         """
         Remove diarization segments without words
 
+        A segment has words when a word starts in [start, end) or ends in
+        (start, end]. Both are answered with a binary search over the sorted
+        word starts and ends, in O((W + S) log W).
+
         Warning: this function mutate the diarization list
         """
-        # count the number of words for each diarization segment
-        diarization_count = []
-        for d in diarization:
+        starts = sorted(word.start for word in words)
+        ends = sorted(word.end for word in words)
+
+        def has_words(d: DiarizationSegment) -> bool:
             start = d["start"]
             end = d["end"]
-            count = 0
-            for word in words:
-                if start <= word.start < end:
-                    count += 1
-                elif start < word.end <= end:
-                    count += 1
-            diarization_count.append(count)
-
-        # remove diarization segments with no words
-        diarization_idx = 0
-        while diarization_idx < len(diarization):
-            if diarization_count[diarization_idx] == 0:
-                diarization.pop(diarization_idx)
-                diarization_count.pop(diarization_idx)
-            else:
-                diarization_idx += 1
+            i = bisect_left(starts, start)
+            if i < len(starts) and starts[i] < end:
+                return True
+            i = bisect_right(ends, start)
+            return i < len(ends) and ends[i] <= end
+
+        diarization[:] = [d for d in diarization if has_words(d)]
 
     @staticmethod
     def _diarization_merge_same_speaker(diarization: list[DiarizationSegment]):
@@ -129,16 +128,13 @@ class AudioDiarizationProcessor(Processor):
 
         Warning: this function mutate the diarization list
         """
-        # merge segment with same speaker
-        diarization_idx = 0
-        while diarization_idx < len(diarization) - 1:
-            d = diarization[diarization_idx]
-            dnext = diarization[diarization_idx + 1]
-            if d["speaker"] == dnext["speaker"]:
-                diarization[diarization_idx]["end"] = dnext["end"]
-                diarization.pop(diarization_idx + 1)
+        merged = []
+        for d in diarization:
+            if merged and merged[-1]["speaker"] == d["speaker"]:
+                merged[-1]["end"] = d["end"]
             else:
-                diarization_idx += 1
+                merged.append(d)
+        diarization[:] = merged
 
     @classmethod
     def _diarization_assign_speaker(
@@ -147,9 +143,13 @@ class AudioDiarizationProcessor(Processor):
         """
         Assign speaker to words based on diarization
 
+        Words and segments are walked together in a single sweep, each word
+        being visited once or twice.
+
         Warning: this function mutate the words list
         """
 
+        word_count = len(words)
         word_idx = 0
         last_speaker = 0
         for d in diarization:
@@ -159,33 +159,34 @@ class AudioDiarizationProcessor(Processor):
 
             # diarization may start after the first set of words
             # in this case, we assign the last speaker
-            for word in words[word_idx:]:
-                if word.start < start:
-                    # speaker change, but what make sense for assigning the word ?
-                    # If it's a new sentence, assign with the new speaker
-                    # If it's a continuation, assign with the last speaker
-                    is_continuation = False
-                    if word_idx > 0 and word_idx < len(words) - 1:
-                        is_continuation = cls.is_word_continuation(
-                            *words[word_idx - 1 : word_idx + 1]
-                        )
-                    if is_continuation:
-                        word.speaker = last_speaker
-                    else:
-                        word.speaker = speaker
-                        last_speaker = speaker
-                    word_idx += 1
+            while word_idx < word_count and words[word_idx].start < start:
+                word = words[word_idx]
+                # speaker change, but what make sense for assigning the word ?
+                # If it's a new sentence, assign with the new speaker
+                # If it's a continuation, assign with the last speaker
+                is_continuation = False
+                if word_idx > 0 and word_idx < word_count - 1:
+                    is_continuation = cls.is_word_continuation(
+                        words[word_idx - 1], word
+                    )
+                if is_continuation:
+                    word.speaker = last_speaker
                 else:
-                    break
+                    word.speaker = speaker
+                    last_speaker = speaker
+                word_idx += 1
 
             # now continue to assign speaker until the word starts after the end
-            for word in words[word_idx:]:
+            scan_idx = word_idx
+            while scan_idx < word_count:
+                word = words[scan_idx]
                 if start <= word.start < end:
                     last_speaker = speaker
                     word.speaker = speaker
                     word_idx += 1
                 elif word.start > end:
                     break
+                scan_idx += 1
 
         # no more diarization available,
         # assign last speaker to all words without speaker
@@ -1,7 +1,6 @@
-import httpx
-
 from reflector.processors.audio_diarization import AudioDiarizationProcessor
 from reflector.processors.audio_diarization_auto import AudioDiarizationAutoProcessor
+from reflector.processors.http_client import get_http_client
 from reflector.processors.types import AudioDiarizationInput, TitleSummary
 from reflector.settings import settings
 
@@ -28,16 +27,16 @@ class AudioDiarizationModalProcessor(AudioDiarizationProcessor):
             "audio_file_url": data.audio_url,
             "timestamp": 0,
         }
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.diarization_url,
-                headers=self.headers,
-                params=params,
-                timeout=None,
-                follow_redirects=True,
-            )
-            response.raise_for_status()
-            return response.json()["diarization"]
+        client = get_http_client(self.diarization_url)
+        response = await client.post(
+            self.diarization_url,
+            headers=self.headers,
+            params=params,
+            timeout=None,
+            follow_redirects=True,
+        )
+        response.raise_for_status()
+        return response.json()["diarization"]
 
 
 AudioDiarizationAutoProcessor.register("modal", AudioDiarizationModalProcessor)
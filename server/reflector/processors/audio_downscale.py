@@ -7,6 +7,7 @@ from reflector.processors.base import Processor
 
 
 def copy_frame(frame: av.AudioFrame) -> av.AudioFrame:
+    """Copy a frame into a new buffer, keeping its timing"""
     frame_copy = frame.from_ndarray(
         frame.to_ndarray(),
         format=frame.format.name,
@@ -32,6 +33,8 @@ class AudioDownscaleProcessor(Processor):
         self.target_layout = target_layout
         self.resampler: Optional[AudioResampler] = None
         self.needs_resampling: Optional[bool] = None
+        # frames are resampled in place until the resampler refuses one
+        self.copy_frames = False
 
     async def _push(self, data: av.AudioFrame):
         if self.needs_resampling is None:
@@ -49,10 +52,20 @@ class AudioDownscaleProcessor(Processor):
             await self.emit(data)
             return
 
-        resampled_frames = self.resampler.resample(copy_frame(data))
-        for resampled_frame in resampled_frames:
+        for resampled_frame in self._resample(data):
             await self.emit(resampled_frame)
 
+    def _resample(self, data: av.AudioFrame) -> list[av.AudioFrame]:
+        if not self.copy_frames:
+            try:
+                return self.resampler.resample(data)
+            except ValueError as e:
+                self.logger.warning(
+                    f"Resampler refused frame ({e}), copying frames from now on"
+                )
+                self.copy_frames = True
+        return self.resampler.resample(copy_frame(data))
+
     async def _flush(self):
         if self.needs_resampling and self.resampler:
             final_frames = self.resampler.resample(None)
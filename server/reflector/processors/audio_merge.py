@@ -1,8 +1,11 @@
-import io
+import tempfile
+import wave
+from pathlib import Path
 from time import monotonic_ns
 from uuid import uuid4
 
 import av
+from av.audio.resampler import AudioResampler
 
 from reflector.processors.base import Processor
 from reflector.processors.types import AudioFile
@@ -27,32 +30,35 @@ class AudioMergeProcessor(Processor):
         frame = data[0]
         output_channels = len(frame.layout.channels)
         output_sample_rate = frame.sample_rate
-        output_sample_width = frame.format.bytes
+        output_sample_width = 2
 
-        # create audio file
-        uu = uuid4().hex
-        fd = io.BytesIO()
-
-        # Use PyAV to write frames
-        out_container = av.open(fd, "w", format="wav")
-        out_stream = out_container.add_stream("pcm_s16le", rate=output_sample_rate)
-        out_stream.layout = frame.layout.name
-
-        for frame in data:
-            for packet in out_stream.encode(frame):
-                out_container.mux(packet)
+        # the WAV holds packed s16: frames already in that format (see
+        # AudioDownscaleProcessor) are written as is, others converted
+        resampler = None
+        if frame.format.name != "s16":
+            resampler = AudioResampler(
+                format="s16", layout=frame.layout.name, rate=output_sample_rate
+            )
 
-        # Flush the encoder
-        for packet in out_stream.encode(None):
-            out_container.mux(packet)
-        out_container.close()
-
-        fd.seek(0)
+        uu = uuid4().hex
+        name = f"{monotonic_ns()}-{uu}.wav"
+        path = Path(tempfile.gettempdir()) / name
+        with wave.open(str(path), "wb") as wav:
+            wav.setnchannels(output_channels)
+            wav.setsampwidth(output_sample_width)
+            wav.setframerate(output_sample_rate)
+            for frame in data:
+                frames = resampler.resample(frame) if resampler else [frame]
+                for packed in frames:
+                    wav.writeframes(packed.to_ndarray().tobytes())
+            if resampler:
+                for packed in resampler.resample(None):
+                    wav.writeframes(packed.to_ndarray().tobytes())
 
         # emit audio file
-        audiofile = AudioFile(
-            name=f"{monotonic_ns()}-{uu}.wav",
-            fd=fd,
+        audiofile = AudioFile.from_temporary_path(
+            path,
+            name=name,
             sample_rate=output_sample_rate,
             channels=output_channels,
             sample_width=output_sample_width,
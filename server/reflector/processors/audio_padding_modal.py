@@ -10,6 +10,7 @@ from pydantic import BaseModel
 
 from reflector.hatchet.constants import TIMEOUT_AUDIO
 from reflector.logger import logger
+from reflector.processors.http_client import get_http_client
 
 
 class PaddingResponse(BaseModel):
@@ -64,29 +65,30 @@ class AudioPaddingModalProcessor:
             headers["Authorization"] = f"Bearer {self.modal_api_key}"
 
         try:
-            async with httpx.AsyncClient(timeout=TIMEOUT_AUDIO) as client:
-                response = await client.post(
-                    url,
-                    headers=headers,
-                    json={
-                        "track_url": track_url,
-                        "output_url": output_url,
-                        "start_time_seconds": start_time_seconds,
-                        "track_index": track_index,
-                    },
-                    follow_redirects=True,
-                )
+            client = get_http_client(url)
+            response = await client.post(
+                url,
+                headers=headers,
+                json={
+                    "track_url": track_url,
+                    "output_url": output_url,
+                    "start_time_seconds": start_time_seconds,
+                    "track_index": track_index,
+                },
+                timeout=TIMEOUT_AUDIO,
+                follow_redirects=True,
+            )
 
-                if response.status_code != 200:
-                    error_body = response.text
-                    log.error(
-                        "Modal padding API error",
-                        status_code=response.status_code,
-                        error_body=error_body,
-                    )
+            if response.status_code != 200:
+                error_body = response.text
+                log.error(
+                    "Modal padding API error",
+                    status_code=response.status_code,
+                    error_body=error_body,
+                )
 
-                response.raise_for_status()
-                result = response.json()
+            response.raise_for_status()
+            result = response.json()
 
             # Check if work was cancelled
             if result.get("cancelled"):
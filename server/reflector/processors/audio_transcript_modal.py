@@ -16,6 +16,7 @@ from openai import AsyncOpenAI
 
 from reflector.processors.audio_transcript import AudioTranscriptProcessor
 from reflector.processors.audio_transcript_auto import AudioTranscriptAutoProcessor
+from reflector.processors.http_client import get_http_client
 from reflector.processors.types import AudioFile, Transcript, Word
 from reflector.settings import settings
 
@@ -36,14 +37,16 @@ class AudioTranscriptModalProcessor(AudioTranscriptProcessor):
         self.modal_api_key = modal_api_key
 
     async def _transcript(self, data: AudioFile):
-        async with AsyncOpenAI(
+        # not closed on purpose: closing it would close the shared http client
+        client = AsyncOpenAI(
             base_url=self.transcript_url,
             api_key=self.modal_api_key,
             timeout=self.timeout,
-        ) as client:
-            self.logger.debug(f"Try to transcribe audio {data.name}")
+            http_client=get_http_client(self.transcript_url),
+        )
+        self.logger.debug(f"Try to transcribe audio {data.name}")
 
-            audio_file = open(data.path, "rb")
+        with data.path.open("rb") as audio_file:
             transcription = await client.audio.transcriptions.create(
                 file=audio_file,
                 model="whisper-1",
@@ -51,18 +54,18 @@ class AudioTranscriptModalProcessor(AudioTranscriptProcessor):
                 language=self.get_pref("audio:source_language", "en"),
                 timestamp_granularities=["word"],
             )
-            self.logger.debug(f"Transcription: {transcription}")
-            transcript = Transcript(
-                words=[
-                    Word(
-                        text=word.word,
-                        start=word.start,
-                        end=word.end,
-                    )
-                    for word in transcription.words
-                ],
-            )
-            transcript.add_offset(data.timestamp)
+        self.logger.debug(f"Transcription: {transcription}")
+        transcript = Transcript(
+            words=[
+                Word(
+                    text=word.word,
+                    start=word.start,
+                    end=word.end,
+                )
+                for word in transcription.words
+            ],
+        )
+        transcript.add_offset(data.timestamp)
 
         return transcript
 
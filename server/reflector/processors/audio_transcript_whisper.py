@@ -12,9 +12,9 @@ class AudioTranscriptWhisperProcessor(AudioTranscriptProcessor):
             "tiny", device="cpu", compute_type="float32", num_workers=12
         )
 
-    async def _transcript(self, data: AudioFile):
+    def _transcribe(self, path: str) -> list:
         segments, _ = self.model.transcribe(
-            data.path.as_posix(),
+            path,
             language="en",
             beam_size=5,
             # condition_on_previous_text=True,
@@ -22,12 +22,16 @@ class AudioTranscriptWhisperProcessor(AudioTranscriptProcessor):
             vad_filter=True,
             vad_parameters={"min_silence_duration_ms": 500},
         )
+        # segments are decoded lazily, consume them off the event loop
+        return list(segments)
+
+    async def _transcript(self, data: AudioFile):
+        segments = await self.run_in_executor(self._transcribe, data.path.as_posix())
 
         if not segments:
             return
 
         transcript = Transcript(words=[])
-        segments = list(segments)
         ts = data.timestamp
 
         for segment in segments:
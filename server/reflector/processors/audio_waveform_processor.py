@@ -25,7 +25,7 @@ class AudioWaveformProcessor(Processor):
     async def _flush(self):
         self.waveform_path.parent.mkdir(parents=True, exist_ok=True)
         self.logger.info("Waveform Processing Started")
-        waveform = get_audio_waveform(path=self.audio_path, segments_count=255)
+        waveform = await self.run_in_executor(get_audio_waveform, self.audio_path, 255)
 
         with open(self.waveform_path, "w") as fd:
             json.dump(waveform, fd)
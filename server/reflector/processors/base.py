@@ -1,5 +1,6 @@
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import contextvars
+from concurrent.futures import Executor, ThreadPoolExecutor
 from typing import Any, Union
 from uuid import uuid4
 
@@ -8,6 +9,11 @@ from pydantic import BaseModel
 
 from reflector.logger import logger
 
+# (ThreadedProcessor, sequence number) of the push a worker is running
+_current_seq: contextvars.ContextVar[tuple["ThreadedProcessor", int] | None] = (
+    contextvars.ContextVar("processor_seq", default=None)
+)
+
 
 class PipelineEvent(BaseModel):
     processor: str
@@ -53,6 +59,8 @@ class Emitter:
 class Processor(Emitter):
     INPUT_TYPE: type = None
     OUTPUT_TYPE: type = None
+    # where run_in_executor runs, None for the event loop default executor
+    executor: Executor | None = None
 
     m_processor = Histogram(
         "processor",
@@ -202,6 +210,13 @@ class Processor(Emitter):
     async def _flush(self):
         pass
 
+    async def run_in_executor(self, func, *args):
+        """
+        Run a blocking function without blocking the event loop
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
     @classmethod
     def as_threaded(cls, *args, **kwargs):
         """
@@ -210,10 +225,26 @@ class Processor(Emitter):
         """
         return ThreadedProcessor(cls(*args, **kwargs), max_workers=1)
 
+    @classmethod
+    def as_pool(cls, *args, max_workers: int, executor="thread", **kwargs):
+        """
+        Return a processor running up to `max_workers` pushes at once, where
+        output is still emitted in order. Only for processors whose pushes
+        do not depend on each other.
+        """
+        return ThreadedProcessor(
+            cls(*args, **kwargs), max_workers=max_workers, executor=executor
+        )
+
 
 class ThreadedProcessor(Processor):
     """
-    A processor that runs in a separate thread
+    A processor that runs its wrapped processor in background workers
+
+    With more than one worker, pushes run concurrently; what the wrapped
+    processor emits is buffered per push and released in push order.
+    `executor` ("thread" or an Executor) is where the wrapped processor
+    offloads its blocking work with `run_in_executor`.
     """
 
     m_processor_queue = Gauge(
@@ -226,23 +257,47 @@ class ThreadedProcessor(Processor):
         "Number of items in the processor queue in progress (global)",
         ["processor"],
     )
+    m_processor_reorder_pending = Gauge(
+        "processor_reorder_pending",
+        "Number of finished items waiting for an earlier one before emitting",
+        ["processor", "processor_uid"],
+    )
 
-    def __init__(self, processor: Processor, max_workers=1):
+    def __init__(
+        self,
+        processor: Processor,
+        max_workers=1,
+        executor: str | Executor = "thread",
+    ):
         super().__init__()
-        # FIXME: This is a hack to make sure that the processor is single threaded
-        # but if it is more than 1, then we need to make sure that the processor
-        # is emiting data in order
-        assert max_workers == 1
         self.m_processor_queue = self.m_processor_queue.labels(processor.name, self.uid)
         self.m_processor_queue_in_progress = self.m_processor_queue_in_progress.labels(
             processor.name
         )
+        self.m_processor_reorder_pending = self.m_processor_reorder_pending.labels(
+            processor.name, self.uid
+        )
         self.processor = processor
         self.INPUT_TYPE = processor.INPUT_TYPE
         self.OUTPUT_TYPE = processor.OUTPUT_TYPE
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.max_workers = max_workers
+        if executor == "thread":
+            self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        else:
+            self.executor = executor
+        processor.executor = self.executor
         self.queue = asyncio.Queue(maxsize=50)
-        self.task: asyncio.Task | None = None
+        self.tasks: list[asyncio.Task] = []
+
+        # ordered emit: sequence numbers are given at push, outputs of a push
+        # are held until every earlier push is done
+        self._seq_in = 0
+        self._seq_out = 0
+        self._outputs: dict[int, list[tuple[Any, str]]] = {}
+        self._done: set[int] = set()
+        self._emit_lock = asyncio.Lock()
+        self._emit = processor.emit
+        processor.emit = self._emit_in_order
 
     def set_pipeline(self, pipeline: "Pipeline"):
         super().set_pipeline(pipeline)
@@ -251,13 +306,11 @@ class ThreadedProcessor(Processor):
     async def loop(self):
         try:
             while True:
-                data = await self.queue.get()
+                seq, data = await self.queue.get()
                 self.m_processor_queue.set(self.queue.qsize())
                 with self.m_processor_queue_in_progress.track_inprogress():
                     try:
-                        if data is None:
-                            await self.processor.flush()
-                            break
+                        token = _current_seq.set((self, seq))
                         try:
                             await self.processor.push(data)
                         except Exception:
@@ -265,14 +318,39 @@ class ThreadedProcessor(Processor):
                                 f"Error in push {self.processor.__class__.__name__}"
                                 ", continue"
                             )
+                        finally:
+                            _current_seq.reset(token)
+                        await self._release(seq)
                     finally:
                         self.queue.task_done()
         except Exception as e:
             logger.error(f"Crash in {self.__class__.__name__}: {e}", exc_info=e)
 
+    async def _emit_in_order(self, data, name="default"):
+        current = _current_seq.get()
+        if current is None or current[0] is not self or self.max_workers == 1:
+            # flush, or a single worker: already in order
+            await self._emit(data, name=name)
+            return
+        self._outputs.setdefault(current[1], []).append((data, name))
+
+    async def _release(self, seq: int):
+        self._done.add(seq)
+        self.m_processor_reorder_pending.inc()
+        async with self._emit_lock:
+            while self._seq_out in self._done:
+                self._done.remove(self._seq_out)
+                self.m_processor_reorder_pending.dec()
+                for data, name in self._outputs.pop(self._seq_out, []):
+                    await self._emit(data, name=name)
+                self._seq_out += 1
+
     async def _ensure_task(self):
-        if self.task is None:
-            self.task = asyncio.get_running_loop().create_task(self.loop())
+        if not self.tasks:
+            loop = asyncio.get_running_loop()
+            self.tasks = [
+                loop.create_task(self.loop()) for _ in range(self.max_workers)
+            ]
 
         # XXX not doing a sleep here make the whole pipeline prior the thread
         # to be running without having a chance to work on the task here.
@@ -280,11 +358,17 @@ class ThreadedProcessor(Processor):
 
     async def _push(self, data):
         await self._ensure_task()
-        await self.queue.put(data)
+        seq = self._seq_in
+        self._seq_in += 1
+        await self.queue.put((seq, data))
+        self.m_processor_queue.set(self.queue.qsize())
 
     async def _flush(self):
-        await self.queue.put(None)
         await self.queue.join()
+        for task in self.tasks:
+            task.cancel()
+        self.tasks = []
+        await self.processor.flush()
 
     def connect(self, processor: Processor):
         self.processor.connect(processor)
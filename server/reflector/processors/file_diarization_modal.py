@@ -9,14 +9,13 @@ Authorization: Bearer <modal_api_key>
 ```
 """
 
-import httpx
-
 from reflector.processors.file_diarization import (
     FileDiarizationInput,
     FileDiarizationOutput,
     FileDiarizationProcessor,
 )
 from reflector.processors.file_diarization_auto import FileDiarizationAutoProcessor
+from reflector.processors.http_client import get_http_client
 from reflector.settings import settings
 
 
@@ -39,18 +38,19 @@ class FileDiarizationModalProcessor(FileDiarizationProcessor):
         if self.modal_api_key:
             headers["Authorization"] = f"Bearer {self.modal_api_key}"
 
-        async with httpx.AsyncClient(timeout=self.file_timeout) as client:
-            response = await client.post(
-                self.diarization_url,
-                headers=headers,
-                params={
-                    "audio_file_url": data.audio_url,
-                    "timestamp": 0,
-                },
-                follow_redirects=True,
-            )
-            response.raise_for_status()
-            diarization_data = response.json()["diarization"]
+        client = get_http_client(self.diarization_url)
+        response = await client.post(
+            self.diarization_url,
+            headers=headers,
+            params={
+                "audio_file_url": data.audio_url,
+                "timestamp": 0,
+            },
+            timeout=self.file_timeout,
+            follow_redirects=True,
+        )
+        response.raise_for_status()
+        diarization_data = response.json()["diarization"]
 
         return FileDiarizationOutput(diarization=diarization_data)
 
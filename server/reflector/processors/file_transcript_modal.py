@@ -13,13 +13,12 @@ API will be a POST request to TRANSCRIPT_URL:
 ```
 """
 
-import httpx
-
 from reflector.processors.file_transcript import (
     FileTranscriptInput,
     FileTranscriptProcessor,
 )
 from reflector.processors.file_transcript_auto import FileTranscriptAutoProcessor
+from reflector.processors.http_client import get_http_client
 from reflector.processors.types import Transcript, Word
 from reflector.settings import settings
 
@@ -45,29 +44,30 @@ class FileTranscriptModalProcessor(FileTranscriptProcessor):
         if self.modal_api_key:
             headers["Authorization"] = f"Bearer {self.modal_api_key}"
 
-        async with httpx.AsyncClient(timeout=self.file_timeout) as client:
-            response = await client.post(
-                url,
-                headers=headers,
-                json={
-                    "audio_file_url": data.audio_url,
-                    "language": data.language,
-                    "batch": True,
-                },
-                follow_redirects=True,
+        client = get_http_client(url)
+        response = await client.post(
+            url,
+            headers=headers,
+            json={
+                "audio_file_url": data.audio_url,
+                "language": data.language,
+                "batch": True,
+            },
+            timeout=self.file_timeout,
+            follow_redirects=True,
+        )
+
+        if response.status_code != 200:
+            error_body = response.text
+            self.logger.error(
+                "Modal API error",
+                audio_url=data.audio_url,
+                status_code=response.status_code,
+                error_body=error_body,
             )
 
-            if response.status_code != 200:
-                error_body = response.text
-                self.logger.error(
-                    "Modal API error",
-                    audio_url=data.audio_url,
-                    status_code=response.status_code,
-                    error_body=error_body,
-                )
-
-            response.raise_for_status()
-            result = response.json()
+        response.raise_for_status()
+        result = response.json()
 
         words = [
             Word(
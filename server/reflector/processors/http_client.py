@@ -0,0 +1,100 @@
+"""
+Shared HTTP clients for model backends
+======================================
+
+Processors talking to model services (transcription, diarization,
+translation, padding) get their `httpx.AsyncClient` from here instead of
+opening one per call, so TCP/TLS connections are kept alive and reused
+across chunks, lines and files.
+
+Clients are kept per event loop and per base URL, since an httpx connection
+pool is bound to the loop that created it. Timeouts are set per request by
+each backend.
+"""
+
+import asyncio
+import weakref
+from urllib.parse import urlsplit
+
+import httpx
+from prometheus_client import Counter
+
+from reflector.events import subscribers_shutdown
+from reflector.logger import logger
+from reflector.settings import settings
+
+m_http_requests = Counter(
+    "model_http_requests",
+    "Number of HTTP requests sent to model backends",
+    ["host"],
+)
+m_http_connections = Counter(
+    "model_http_connections",
+    "Number of connections opened to model backends, the rest of the "
+    "requests reused a kept-alive connection",
+    ["host"],
+)
+
+
+def _base_url(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+class HttpClientPool:
+    """Keep-alive httpx clients shared by every model backend processor."""
+
+    def __init__(self):
+        self._clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def get(self, url: str) -> httpx.AsyncClient:
+        """Return the client for the scheme and host of `url`"""
+        base_url = _base_url(url)
+        clients = self._clients.setdefault(asyncio.get_running_loop(), {})
+        client = clients.get(base_url)
+        if client is None or client.is_closed:
+            client = clients[base_url] = self._create(base_url)
+        return client
+
+    @staticmethod
+    def _create(base_url: str) -> httpx.AsyncClient:
+        host = urlsplit(base_url).netloc
+
+        async def trace(event_name: str, info: dict):
+            if event_name == "connection.connect_tcp.complete":
+                m_http_connections.labels(host).inc()
+
+        async def on_request(request: httpx.Request):
+            m_http_requests.labels(host).inc()
+            request.extensions["trace"] = trace
+
+        return httpx.AsyncClient(
+            http2=settings.MODEL_HTTP2,
+            limits=httpx.Limits(
+                max_connections=settings.MODEL_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.MODEL_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.MODEL_HTTP_KEEPALIVE_EXPIRY,
+            ),
+            event_hooks={"request": [on_request]},
+        )
+
+    async def close(self):
+        """Close clients created on the running loop."""
+        clients = self._clients.pop(asyncio.get_running_loop(), {})
+        for client in clients.values():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning("Failed to close HTTP client", exc_info=e)
+
+
+http_client_pool = HttpClientPool()
+
+
+@subscribers_shutdown.append
+async def http_client_pool_close(_):
+    await http_client_pool.close()
+
+
+def get_http_client(url: str) -> httpx.AsyncClient:
+    return http_client_pool.get(url)
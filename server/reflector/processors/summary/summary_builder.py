@@ -15,6 +15,7 @@ import structlog
 from pydantic import BaseModel, Field
 
 from reflector.llm import LLM
+from reflector.llm_limiter import LLMCallLimiter
 from reflector.processors.summary.models import ActionItemsResponse
 from reflector.processors.summary.prompts import (
     DETAILED_SUBJECT_PROMPT_TEMPLATE,
@@ -150,7 +151,14 @@ class SubjectsResponse(BaseModel):
 
 
 class SummaryBuilder:
-    def __init__(self, llm: LLM, filename: str | None = None, logger=None) -> None:
+    def __init__(
+        self,
+        llm: LLM,
+        filename: str | None = None,
+        logger=None,
+        concurrency: int | None = None,
+        rate_limit: float | None = None,
+    ) -> None:
         self.transcript: str | None = None
         self.recap: str | None = None
         self.summaries: list[dict[str, str]] = []
@@ -162,6 +170,12 @@ class SummaryBuilder:
         self.participant_instructions: str | None = None
         self.action_items: ActionItemsResponse | None = None
         self.participant_name_to_id: dict[str, str] = {}
+        self.limiter = LLMCallLimiter(
+            concurrency=concurrency or settings.SUMMARY_LLM_CONCURRENCY,
+            rate_limit=(
+                settings.SUMMARY_LLM_RATE_LIMIT if rate_limit is None else rate_limit
+            ),
+        )
         if filename:
             self.read_transcript_from_file(filename)
 
@@ -193,20 +207,24 @@ class SummaryBuilder:
     ) -> T:
         """Generic function to get structured output from LLM for non-function-calling models."""
         enhanced_prompt = self._enhance_prompt_with_participants(prompt)
-        return await self.llm.get_structured_response(
-            enhanced_prompt,
-            [self.transcript],
-            output_cls,
-            tone_name=tone_name,
-            timeout=timeout,
-        )
+        async with self.limiter:
+            return await self.llm.get_structured_response(
+                enhanced_prompt,
+                [self.transcript],
+                output_cls,
+                tone_name=tone_name,
+                timeout=timeout,
+            )
 
     async def _get_response(
         self, prompt: str, texts: list[str], tone_name: str | None = None
     ) -> str:
         """Get text response with automatic participant instructions injection."""
         enhanced_prompt = self._enhance_prompt_with_participants(prompt)
-        return await self.llm.get_response(enhanced_prompt, texts, tone_name=tone_name)
+        async with self.limiter:
+            return await self.llm.get_response(
+                enhanced_prompt, texts, tone_name=tone_name
+            )
 
     def _enhance_prompt_with_participants(self, prompt: str) -> str:
         """Add participant instructions to any prompt if participants are known."""
@@ -365,28 +383,37 @@ class SummaryBuilder:
             self.logger.error(f"Error extracting subjects: {e}")
             self.subjects = []
 
-    async def generate_subject_summaries(self) -> None:
-        """Generate detailed summaries for each extracted subject."""
+    async def generate_subject_summary(self, subject: str) -> dict[str, str]:
+        """Generate the detailed summary of a single subject."""
         assert self.transcript is not None
-        summaries = []
+        detailed_prompt = DETAILED_SUBJECT_PROMPT_TEMPLATE.format(subject=subject)
 
-        for subject in self.subjects:
-            detailed_prompt = DETAILED_SUBJECT_PROMPT_TEMPLATE.format(subject=subject)
+        detailed_response = await self._get_response(
+            detailed_prompt, [self.transcript], tone_name="Topic assistant"
+        )
 
-            detailed_response = await self._get_response(
-                detailed_prompt, [self.transcript], tone_name="Topic assistant"
-            )
+        paragraph_prompt = PARAGRAPH_SUMMARY_PROMPT
 
-            paragraph_prompt = PARAGRAPH_SUMMARY_PROMPT
+        paragraph_response = await self._get_response(
+            paragraph_prompt, [str(detailed_response)], tone_name="Topic summarizer"
+        )
 
-            paragraph_response = await self._get_response(
-                paragraph_prompt, [str(detailed_response)], tone_name="Topic summarizer"
-            )
+        self.logger.debug(f"Summary for {subject}: {paragraph_response}")
+        return {"subject": subject, "summary": str(paragraph_response)}
 
-            summaries.append({"subject": subject, "summary": str(paragraph_response)})
-            self.logger.debug(f"Summary for {subject}: {paragraph_response}")
+    async def generate_subject_summaries(self) -> None:
+        """
+        Generate detailed summaries for each extracted subject.
 
-        self.summaries = summaries
+        Subjects are summarized concurrently within the limiter bounds;
+        summaries keep the order of the subjects.
+        """
+        assert self.transcript is not None
+        self.summaries = list(
+            await asyncio.gather(
+                *[self.generate_subject_summary(subject) for subject in self.subjects]
+            )
+        )
 
     async def generate_recap(self) -> None:
         """Generate a quick recap from the subject summaries."""
@@ -502,9 +529,16 @@ class SummaryBuilder:
         if only_subjects:
             return
 
+        # action items only depend on the transcript, run them alongside the
+        # subject summaries and recap
+        await asyncio.gather(
+            self._generate_summaries_and_recap(),
+            self.identify_action_items(),
+        )
+
+    async def _generate_summaries_and_recap(self) -> None:
         await self.generate_subject_summaries()
         await self.generate_recap()
-        await self.identify_action_items()
 
     # ----------------------------------------------------------------------------
     # Markdown
@@ -37,9 +37,8 @@ class TranscriptDiarizationAssemblerProcessor(Processor):
             return data.transcript
 
         # Reuse logic from AudioDiarizationProcessor
-        processor = AudioDiarizationProcessor()
         words = data.transcript.words
-        processor.assign_speaker(words, data.diarization)
+        AudioDiarizationProcessor.assign_speaker(words, data.diarization)
 
         self.logger.info(f"Applied diarization to {len(words)} words")
         return data.transcript
@@ -10,26 +10,16 @@ class TranscriptTranslatorProcessor(Processor):
     INPUT_TYPE = Transcript
     OUTPUT_TYPE = Transcript
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.transcript = None
-
     async def _push(self, data: Transcript):
-        self.transcript = data
-        await self.flush()
-
-    async def _translate(self, text: str) -> str | None:
-        raise NotImplementedError
-
-    async def _flush(self):
-        if not self.transcript:
-            return
-
+        # no state kept between pushes, so lines can be translated concurrently
         source_language = self.get_pref("audio:source_language", "en")
         target_language = self.get_pref("audio:target_language", "en")
         if source_language == target_language:
-            self.transcript.translation = None
+            data.translation = None
         else:
-            self.transcript.translation = await self._translate(self.transcript.text)
+            data.translation = await self._translate(data.text)
+
+        await self.emit(data)
 
-        await self.emit(self.transcript)
+    async def _translate(self, text: str) -> str | None:
+        raise NotImplementedError
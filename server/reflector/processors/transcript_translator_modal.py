@@ -1,17 +1,86 @@
-import httpx
+import asyncio
 
+from reflector.processors.http_client import get_http_client
 from reflector.processors.transcript_translator import TranscriptTranslatorProcessor
 from reflector.processors.transcript_translator_auto import (
     TranscriptTranslatorAutoProcessor,
 )
 from reflector.processors.types import TranslationLanguages
 from reflector.settings import settings
-from reflector.utils.retry import retry
+from reflector.utils.retry import RetryHTTPException, retry
+
+# batch endpoint errors answered by translating the batch line by line
+BATCH_ERRORS = (500, 501, 502, 503, 504)
+
+
+class TranslationBatcher:
+    """
+    Group texts translated around the same time into one batch request
+
+    A batch is sent when it reaches `max_size` texts, or `max_delay` seconds
+    after its first text, whichever comes first, so a lone line is delayed
+    by at most `max_delay`.
+    """
+
+    def __init__(self, send_batch, max_size: int, max_delay: float):
+        self.send_batch = send_batch
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self._pending: dict[tuple[str, str], list[tuple[str, asyncio.Future]]] = {}
+        self._timers: dict[tuple[str, str], asyncio.TimerHandle] = {}
+        # the loop only keeps weak references to tasks
+        self._tasks: set[asyncio.Task] = set()
+
+    async def translate(
+        self, text: str, source_language: str, target_language: str
+    ) -> str | None:
+        key = (source_language, target_language)
+        future = asyncio.get_running_loop().create_future()
+        batch = self._pending.setdefault(key, [])
+        batch.append((text, future))
+        if len(batch) >= self.max_size:
+            self._send(key)
+        elif key not in self._timers:
+            self._timers[key] = asyncio.get_running_loop().call_later(
+                self.max_delay, self._send, key
+            )
+        return await future
+
+    def _send(self, key: tuple[str, str]):
+        timer = self._timers.pop(key, None)
+        if timer:
+            timer.cancel()
+        batch = self._pending.pop(key, [])
+        if batch:
+            task = asyncio.create_task(self._run(key, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def close(self):
+        """Send the pending batches and wait for all of them"""
+        for key in list(self._pending):
+            self._send(key)
+        await asyncio.gather(*self._tasks)
+
+    async def _run(self, key: tuple[str, str], batch: list[tuple[str, asyncio.Future]]):
+        try:
+            translations = await self.send_batch([text for text, _ in batch], *key)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), translation in zip(batch, translations):
+            if not future.done():
+                future.set_result(translation)
 
 
 class TranscriptTranslatorModalProcessor(TranscriptTranslatorProcessor):
     """
     Translate the transcript into the target language using Modal.com
+
+    Lines are sent to the batch endpoint in micro-batches; servers without
+    it get one request per line.
     """
 
     def __init__(self, modal_api_key: str | None = None, **kwargs):
@@ -26,6 +95,12 @@ class TranscriptTranslatorModalProcessor(TranscriptTranslatorProcessor):
         self.headers = {}
         if self.modal_api_key:
             self.headers["Authorization"] = f"Bearer {self.modal_api_key}"
+        self.batcher = TranslationBatcher(
+            self._translate_batch,
+            max_size=settings.TRANSLATE_BATCH_MAX_SIZE,
+            max_delay=settings.TRANSLATE_BATCH_MAX_DELAY,
+        )
+        self.batch_supported = settings.TRANSLATE_BATCH_MAX_SIZE > 1
 
     async def _translate(self, text: str) -> str | None:
         source_language = self.get_pref("audio:source_language", "en")
@@ -36,31 +111,85 @@ class TranscriptTranslatorModalProcessor(TranscriptTranslatorProcessor):
         # Hence, this assert should never fail.
         assert languages.is_supported(target_language)
         self.logger.debug(f"Try to translate {text=}")
+
+        if self.batch_supported:
+            translation = await self.batcher.translate(
+                text, source_language, target_language
+            )
+        else:
+            translation = await self._translate_one(
+                text, source_language, target_language
+            )
+        self.logger.debug(f"Translation response: {text=}, {translation=}")
+        return translation
+
+    async def _flush(self):
+        await self.batcher.close()
+
+    async def _translate_batch(
+        self, texts: list[str], source_language: str, target_language: str
+    ) -> list[str | None]:
+        if self.batch_supported:
+            client = get_http_client(self.translate_url)
+            try:
+                response = await retry(client.post)(
+                    self.translate_url + "/translate/batch",
+                    headers=self.headers,
+                    json={
+                        "texts": texts,
+                        "source_language": source_language,
+                        "target_language": target_language,
+                    },
+                    timeout=self.timeout,
+                    follow_redirects=True,
+                    logger=self.logger,
+                    retry_httpx_status_stop=(401, 404, 405, 413, 418, *BATCH_ERRORS),
+                )
+                return response.json()["translations"]
+            except RetryHTTPException as e:
+                status_code = e.__cause__.response.status_code
+                if status_code in (404, 405):
+                    self.logger.warning("Translation server has no batch endpoint")
+                    self.batch_supported = False
+                elif status_code in BATCH_ERRORS:
+                    # the lines may still translate one by one
+                    self.logger.warning(
+                        f"Batch translation failed ({status_code}), "
+                        "translating line by line"
+                    )
+                else:
+                    raise
+
+        return [
+            await self._translate_one(text, source_language, target_language)
+            for text in texts
+        ]
+
+    async def _translate_one(
+        self, text: str, source_language: str, target_language: str
+    ) -> str | None:
         json_payload = {
             "text": text,
             "source_language": source_language,
             "target_language": target_language,
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await retry(client.post)(
-                self.translate_url + "/translate",
-                headers=self.headers,
-                params=json_payload,
-                timeout=self.timeout,
-                follow_redirects=True,
-                logger=self.logger,
-            )
-            response.raise_for_status()
-            result = response.json()["text"]
-
-            # Sanity check for translation status in the result
-            if target_language in result:
-                translation = result[target_language]
-            else:
-                translation = None
-            self.logger.debug(f"Translation response: {text=}, {translation=}")
-        return translation
+        client = get_http_client(self.translate_url)
+        response = await retry(client.post)(
+            self.translate_url + "/translate",
+            headers=self.headers,
+            params=json_payload,
+            timeout=self.timeout,
+            follow_redirects=True,
+            logger=self.logger,
+        )
+        response.raise_for_status()
+        result = response.json()["text"]
+
+        # Sanity check for translation status in the result
+        if target_language in result:
+            return result[target_language]
+        return None
 
 
 TranscriptTranslatorAutoProcessor.register("modal", TranscriptTranslatorModalProcessor)
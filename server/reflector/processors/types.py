@@ -1,10 +1,12 @@
 import io
 import re
 import tempfile
+import weakref
 from collections import defaultdict
 from pathlib import Path
 from typing import Annotated, TypedDict
 
+import numpy as np
 from pydantic import BaseModel, Field, PrivateAttr
 
 
@@ -30,22 +32,66 @@ MAX_SEGMENT_CHARS = 120
 MAX_SENTENCE_SEGMENT_CHARS = 1000
 
 
+def _remove_file(path: Path):
+    path.unlink(missing_ok=True)
+
+
+def _wav_data_range(header: bytes) -> tuple[int, int]:
+    """Return (offset, size) of the PCM samples of a RIFF/WAVE file"""
+    if header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+        raise ValueError("Not a WAV file")
+    offset = 12
+    while offset + 8 <= len(header):
+        chunk_id = header[offset : offset + 4]
+        chunk_size = int.from_bytes(header[offset + 4 : offset + 8], "little")
+        if chunk_id == b"data":
+            return offset + 8, chunk_size
+        offset += 8 + chunk_size + (chunk_size & 1)
+    raise ValueError("No data chunk in WAV header")
+
+
 class AudioFile(BaseModel):
+    """
+    A chunk of WAV audio, held either in memory (`fd`) or on disk (`path`)
+
+    Whatever the backend asks for is materialized once and cached: a memory
+    chunk is written to a temporary file on first `path` access, a file chunk
+    is only opened on first `fd` access. Temporary files are removed on
+    `release()`, or when the AudioFile is garbage collected.
+    """
+
     name: str
     sample_rate: int
     channels: int
     sample_width: int
     timestamp: float = 0.0
 
-    _fd: io.BytesIO = PrivateAttr(None)
-    _path: Path = PrivateAttr(None)
+    _fd: io.BufferedIOBase | None = PrivateAttr(None)
+    _path: Path | None = PrivateAttr(None)
+    _cleanup: weakref.finalize | None = PrivateAttr(None)
 
-    def __init__(self, fd, **kwargs):
+    def __init__(self, fd=None, path: Path | str | None = None, **kwargs):
         super().__init__(**kwargs)
+        if fd is None and path is None:
+            raise ValueError("AudioFile needs either fd or path")
         self._fd = fd
+        if path is not None:
+            self._path = Path(path)
+
+    @classmethod
+    def from_temporary_path(cls, path: Path | str, **kwargs) -> "AudioFile":
+        """File-backed AudioFile that owns, and eventually deletes, `path`"""
+        audiofile = cls(path=path, **kwargs)
+        audiofile._own_path()
+        return audiofile
+
+    def _own_path(self):
+        self._cleanup = weakref.finalize(self, _remove_file, self._path)
 
     @property
     def fd(self):
+        if self._fd is None:
+            self._fd = self._path.open("rb")
         self._fd.seek(0)
         return self._fd
 
@@ -55,13 +101,41 @@ class AudioFile(BaseModel):
             # write down to disk
             filename = tempfile.NamedTemporaryFile(suffix=".wav", delete=False).name
             self._path = Path(filename)
+            self._own_path()
             with self._path.open("wb") as f:
-                f.write(self._fd.getbuffer())
+                f.write(self.fd.getbuffer())
         return self._path
 
+    def samples(self) -> np.ndarray:
+        """
+        PCM samples as an array of shape (frames, channels), without copy:
+        a view on the in-memory buffer, or a read-only memory map of the file
+        """
+        dtype = np.dtype(f"<i{self.sample_width}")
+        if self._path is None:
+            buffer = self.fd.getbuffer()
+            offset, size = _wav_data_range(bytes(buffer[:4096]))
+            pcm = np.frombuffer(
+                buffer, dtype=dtype, count=size // dtype.itemsize, offset=offset
+            )
+        else:
+            with self._path.open("rb") as f:
+                offset, size = _wav_data_range(f.read(4096))
+            pcm = np.memmap(
+                self._path,
+                dtype=dtype,
+                mode="r",
+                offset=offset,
+                shape=(size // dtype.itemsize,),
+            )
+        return pcm.reshape(-1, self.channels)
+
     def release(self):
-        if self._path:
-            self._path.unlink()
+        if self._fd is not None and self._path is not None:
+            self._fd.close()
+            self._fd = None
+        if self._cleanup is not None:
+            self._cleanup()
 
 
 # non-negative seconds with float part
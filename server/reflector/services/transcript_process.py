@@ -15,7 +15,7 @@ from hatchet_sdk.clients.rest.exceptions import ApiException, NotFoundException
 from hatchet_sdk.clients.rest.models import V1TaskStatus
 
 from reflector.db.recordings import recordings_controller
-from reflector.db.transcripts import Transcript, transcripts_controller
+from reflector.db.transcripts import TranscriptHeader, transcripts_controller
 from reflector.hatchet.client import HatchetClientManager
 from reflector.logger import logger
 from reflector.pipelines.main_file_pipeline import task_pipeline_file_process
@@ -92,7 +92,7 @@ DispatchResult = Union[
 
 
 async def validate_transcript_for_processing(
-    transcript: Transcript,
+    transcript: TranscriptHeader,
 ) -> ValidationResult:
     if transcript.locked:
         return ValidationLocked(detail="Recording is locked")
@@ -182,7 +182,9 @@ async def dispatch_transcript_processing(
     if isinstance(config, MultitrackProcessingConfig):
         # Multitrack processing always uses Hatchet (no Celery fallback)
         # First check if we can replay (outside transaction since it's read-only)
-        transcript = await transcripts_controller.get_by_id(config.transcript_id)
+        transcript = await transcripts_controller.get_by_id(
+            config.transcript_id, fields=TranscriptHeader
+        )
         if transcript and transcript.workflow_run_id and not force:
             can_replay = await HatchetClientManager.can_replay(
                 transcript.workflow_run_id
@@ -231,7 +233,9 @@ async def dispatch_transcript_processing(
         # Re-fetch and check for concurrent dispatch (optimistic approach).
         # No database lock - worst case is duplicate dispatch, but Hatchet
         # workflows are idempotent so this is acceptable.
-        transcript = await transcripts_controller.get_by_id(config.transcript_id)
+        transcript = await transcripts_controller.get_by_id(
+            config.transcript_id, fields=TranscriptHeader
+        )
         if transcript and transcript.workflow_run_id:
             # Another process started a workflow between validation and now
             try:
@@ -37,7 +37,7 @@ class Settings(BaseSettings):
     DATA_DIR: str = "./data"
 
     # Audio Chunking
-    # backends: silero, frames
+    # backends: silero, silero_stream, frames
     AUDIO_CHUNKER_BACKEND: str = "frames"
 
     # Audio Transcription
@@ -48,6 +48,14 @@ class Settings(BaseSettings):
     TRANSCRIPT_URL: str | None = None
     TRANSCRIPT_TIMEOUT: int = 90
     TRANSCRIPT_FILE_TIMEOUT: int = 600
+    # Live pipeline: audio chunks transcribed concurrently
+    TRANSCRIPT_LIVE_WORKERS: PositiveInt = 2
+
+    # Model backends HTTP clients, shared per host (HTTP/2 needs `h2`)
+    MODEL_HTTP2: bool = False
+    MODEL_HTTP_MAX_CONNECTIONS: PositiveInt = 20
+    MODEL_HTTP_MAX_KEEPALIVE_CONNECTIONS: PositiveInt = 10
+    MODEL_HTTP_KEEPALIVE_EXPIRY: float = 30.0
 
     # Audio Transcription: modal backend
     TRANSCRIPT_MODAL_API_KEY: str | None = None
@@ -61,6 +69,14 @@ class Settings(BaseSettings):
     TRANSCRIPT_STORAGE_AWS_ACCESS_KEY_ID: str | None = None
     TRANSCRIPT_STORAGE_AWS_SECRET_ACCESS_KEY: str | None = None
     TRANSCRIPT_STORAGE_AWS_ENDPOINT_URL: str | None = None
+    # Connections kept open by the pooled S3 client
+    TRANSCRIPT_STORAGE_AWS_MAX_POOL_CONNECTIONS: int = 10
+    # Streaming transfers: part size in bytes and parts in flight
+    TRANSCRIPT_STORAGE_AWS_MULTIPART_PART_SIZE: int = 8 * 1024 * 1024
+    TRANSCRIPT_STORAGE_AWS_MULTIPART_CONCURRENCY: int = 4
+    # Send players straight to a presigned storage URL instead of proxying
+    # the audio through the API (the bucket must allow the UI origin in CORS)
+    TRANSCRIPT_AUDIO_REDIRECT: bool = False
 
     # Platform-specific recording storage (follows {PREFIX}_STORAGE_AWS_{CREDENTIAL} pattern)
     # Whereby storage configuration
@@ -78,6 +94,10 @@ class Settings(BaseSettings):
     TRANSLATION_BACKEND: str = "passthrough"
     TRANSLATE_URL: str | None = None
     TRANSLATE_TIMEOUT: int = 90
+    # Lines sent in one batch request, and max seconds a line waits for
+    # its batch to fill (1 disables batching)
+    TRANSLATE_BATCH_MAX_SIZE: PositiveInt = 16
+    TRANSLATE_BATCH_MAX_DELAY: float = 0.1
 
     # Translation: modal backend
     TRANSLATE_MODAL_API_KEY: str | None = None
@@ -95,6 +115,27 @@ class Settings(BaseSettings):
         300  # Timeout in seconds for structured responses (5 minutes)
     )
 
+    # Summary: max concurrent LLM calls and max LLM calls started per second
+    # (0 disables the rate limit)
+    SUMMARY_LLM_CONCURRENCY: int = 4
+    SUMMARY_LLM_RATE_LIMIT: float = 0
+
+    # Topic detection: max concurrent LLM calls over transcript chunks and
+    # max calls started per second (0 disables the rate limit)
+    TOPIC_DETECTION_CONCURRENCY: PositiveInt = 4
+    TOPIC_DETECTION_RATE_LIMIT: float = 0
+
+    # LLM response cache
+    # backends: redis, disk (unset to disable)
+    LLM_CACHE_BACKEND: str | None = None
+    LLM_CACHE_TTL: int = 7 * 24 * 3600
+    LLM_CACHE_DIR: str = "./data/llm_cache"
+
+    # Search snippets
+    # backends: python (from the pre-extracted transcript text),
+    # database (ts_headline, only the page of results leaves PostgreSQL)
+    SEARCH_SNIPPETS_BACKEND: str = "python"
+
     # Diarization
     # backend: modal — HTTP API client (works with Modal.com OR self-hosted gpu/self_hosted/)
     DIARIZATION_ENABLED: bool = True
@@ -105,6 +146,9 @@ class Settings(BaseSettings):
     # Diarization: modal backend
     DIARIZATION_MODAL_API_KEY: str | None = None
 
+    # Multitrack mixdown: number of threads decoding tracks in parallel
+    MIXDOWN_DECODE_WORKERS: int = 4
+
     # Audio Padding (Modal.com backend)
     PADDING_URL: str | None = None
     PADDING_MODAL_API_KEY: str | None = None
@@ -135,6 +179,11 @@ class Settings(BaseSettings):
     REDIS_PORT: int = 6379
     REDIS_CACHE_DB: int = 2
 
+    # Websocket fan-out: messages buffered per client, and what to do when
+    # a slow client fills its buffer (policies: drop, disconnect)
+    WEBSOCKET_SEND_QUEUE_SIZE: PositiveInt = 256
+    WEBSOCKET_SLOW_CONSUMER_POLICY: str = "drop"
+
     # Secret key
     SECRET_KEY: str = "changeme-f02f86fd8b3e4fd892c6043e5a298e21"
 
@@ -1,7 +1,13 @@
 from .base import Storage  # noqa
+from reflector.events import subscribers_shutdown
 from reflector.settings import settings
 
 
+@subscribers_shutdown.append
+async def storage_close_clients(_):
+    await Storage.close_clients()
+
+
 def get_transcripts_storage() -> Storage:
     """
     Get storage for processed transcript files (master credentials).
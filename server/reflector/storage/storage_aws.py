@@ -1,12 +1,84 @@
+import asyncio
+import os
+import weakref
+from contextlib import asynccontextmanager
 from functools import wraps
-from typing import BinaryIO, Union
+from typing import AsyncIterable, AsyncIterator, BinaryIO, Union
 
 import aioboto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from reflector.logger import logger
-from reflector.storage.base import FileResult, Storage, StoragePermissionError
+from reflector.storage.base import (
+    FileResult,
+    Storage,
+    StoragePermissionError,
+    StreamSource,
+)
+
+MiB = 1024 * 1024
+
+
+class S3ClientPool:
+    """Long-lived S3 clients shared by every AwsStorage instance.
+
+    aiobotocore clients hold an aiohttp connection pool bound to the event
+    loop that created them, so clients are kept per running loop and per
+    client configuration (credentials, region, endpoint, pool size).
+    """
+
+    def __init__(self):
+        self._clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._locks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    async def get(self, key: tuple, factory):
+        loop = asyncio.get_running_loop()
+        clients = self._clients.setdefault(loop, {})
+        if key in clients:
+            return clients[key][1]
+
+        lock = self._locks.setdefault(loop, asyncio.Lock())
+        async with lock:
+            if key not in clients:
+                context = factory()
+                client = await context.__aenter__()
+                clients[key] = (context, client)
+        return clients[key][1]
+
+    async def close(self):
+        """Close clients created on the running loop."""
+        clients = self._clients.pop(asyncio.get_running_loop(), {})
+        for context, _ in clients.values():
+            try:
+                await context.__aexit__(None, None, None)
+            except Exception as e:
+                logger.warning("Failed to close S3 client", exc_info=e)
+
+
+s3_client_pool = S3ClientPool()
+
+
+class AsyncIteratorReader:
+    """File-like adapter exposing an async iterator of bytes through `read(n)`."""
+
+    def __init__(self, iterable: AsyncIterable[bytes]):
+        self._iterator = aiter(iterable)
+        self._buffer = bytearray()
+        self._eof = False
+
+    async def read(self, size: int = -1) -> bytes:
+        while not self._eof and (size < 0 or len(self._buffer) < size):
+            try:
+                self._buffer += await anext(self._iterator)
+            except StopAsyncIteration:
+                self._eof = True
+        if size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
 
 
 def handle_s3_client_errors(operation_name: str):
@@ -54,6 +126,9 @@ class AwsStorage(Storage):
         aws_secret_access_key: str | None = None,
         aws_role_arn: str | None = None,
         aws_endpoint_url: str | None = None,
+        aws_max_pool_connections: int = 10,
+        aws_multipart_part_size: int = 8 * MiB,
+        aws_multipart_concurrency: int = 4,
     ):
         if not aws_bucket_name:
             raise ValueError("Storage `aws_storage` require `aws_bucket_name`")
@@ -80,7 +155,13 @@ class AwsStorage(Storage):
         if "/" in aws_bucket_name:
             self._bucket_name, self.aws_folder = aws_bucket_name.split("/", 1)
 
-        config_kwargs: dict = {"retries": {"max_attempts": 3, "mode": "adaptive"}}
+        self.multipart_part_size = aws_multipart_part_size
+        self.multipart_concurrency = aws_multipart_concurrency
+
+        config_kwargs: dict = {
+            "retries": {"max_attempts": 3, "mode": "adaptive"},
+            "max_pool_connections": aws_max_pool_connections,
+        }
         if aws_endpoint_url:
             config_kwargs["s3"] = {"addressing_style": "path"}
         self.boto_config = Config(**config_kwargs)
@@ -90,11 +171,42 @@ class AwsStorage(Storage):
             aws_secret_access_key=aws_secret_access_key,
             region_name=aws_region,
         )
+        self._client_key = (
+            aws_access_key_id,
+            aws_secret_access_key,
+            aws_region,
+            aws_endpoint_url,
+            aws_max_pool_connections,
+        )
         if aws_endpoint_url:
             self.base_url = f"{aws_endpoint_url}/{self._bucket_name}/"
         else:
             self.base_url = f"https://{self._bucket_name}.s3.amazonaws.com/"
 
+    @asynccontextmanager
+    async def _client(self):
+        """Pooled S3 client for the running loop, reused across operations."""
+        yield await s3_client_pool.get(
+            self._client_key,
+            lambda: self.session.client(
+                "s3", config=self.boto_config, endpoint_url=self._endpoint_url
+            ),
+        )
+
+    @classmethod
+    async def _close_clients(cls):
+        await s3_client_pool.close()
+
+    def _transfer_config(
+        self, part_size: int | None, concurrency: int | None
+    ) -> TransferConfig:
+        part_size = part_size or self.multipart_part_size
+        return TransferConfig(
+            multipart_threshold=part_size,
+            multipart_chunksize=part_size,
+            max_concurrency=concurrency or self.multipart_concurrency,
+        )
+
     # Implement credential properties
     @property
     def bucket_name(self) -> str:
@@ -149,9 +261,7 @@ class AwsStorage(Storage):
         s3filename = f"{folder}/{filename}" if folder else filename
         logger.info(f"Uploading {filename} to S3 {actual_bucket}/{folder}")
 
-        async with self.session.client(
-            "s3", config=self.boto_config, endpoint_url=self._endpoint_url
-        ) as client:
+        async with self._client() as client:
             if isinstance(data, bytes):
                 await client.put_object(Bucket=actual_bucket, Key=s3filename, Body=data)
             else:
@@ -174,9 +284,7 @@ class AwsStorage(Storage):
         actual_bucket = bucket or self._bucket_name
         folder = self.aws_folder
         s3filename = f"{folder}/{filename}" if folder else filename
-        async with self.session.client(
-            "s3", config=self.boto_config, endpoint_url=self._endpoint_url
-        ) as client:
+        async with self._client() as client:
             presigned_url = await client.generate_presigned_url(
                 operation,
                 Params={"Bucket": actual_bucket, "Key": s3filename},
@@ -191,9 +299,7 @@ class AwsStorage(Storage):
         folder = self.aws_folder
         logger.info(f"Deleting {filename} from S3 {actual_bucket}/{folder}")
         s3filename = f"{folder}/{filename}" if folder else filename
-        async with self.session.client(
-            "s3", config=self.boto_config, endpoint_url=self._endpoint_url
-        ) as client:
+        async with self._client() as client:
             await client.delete_object(Bucket=actual_bucket, Key=s3filename)
 
     @handle_s3_client_errors("download")
@@ -202,9 +308,7 @@ class AwsStorage(Storage):
         folder = self.aws_folder
         logger.info(f"Downloading {filename} from S3 {actual_bucket}/{folder}")
         s3filename = f"{folder}/{filename}" if folder else filename
-        async with self.session.client(
-            "s3", config=self.boto_config, endpoint_url=self._endpoint_url
-        ) as client:
+        async with self._client() as client:
             response = await client.get_object(Bucket=actual_bucket, Key=s3filename)
             return await response["Body"].read()
 
@@ -219,9 +323,7 @@ class AwsStorage(Storage):
         logger.info(f"Listing objects from S3 {actual_bucket} with prefix '{s3prefix}'")
 
         keys = []
-        async with self.session.client(
-            "s3", config=self.boto_config, endpoint_url=self._endpoint_url
-        ) as client:
+        async with self._client() as client:
             paginator = client.get_paginator("list_objects_v2")
             async for page in paginator.paginate(Bucket=actual_bucket, Prefix=s3prefix):
                 if "Contents" in page:
@@ -247,12 +349,91 @@ class AwsStorage(Storage):
         folder = self.aws_folder
         logger.info(f"Streaming {filename} from S3 {actual_bucket}/{folder}")
         s3filename = f"{folder}/{filename}" if folder else filename
-        async with self.session.client(
-            "s3", config=self.boto_config, endpoint_url=self._endpoint_url
-        ) as client:
+        async with self._client() as client:
             await client.download_fileobj(
                 Bucket=actual_bucket, Key=s3filename, Fileobj=fileobj
             )
 
+    @handle_s3_client_errors("upload")
+    async def _put_file_stream(
+        self,
+        filename: str,
+        source: StreamSource,
+        *,
+        bucket: str | None = None,
+        part_size: int | None = None,
+        concurrency: int | None = None,
+    ) -> FileResult:
+        actual_bucket = bucket or self._bucket_name
+        folder = self.aws_folder
+        s3filename = f"{folder}/{filename}" if folder else filename
+        logger.info(f"Streaming upload of {filename} to S3 {actual_bucket}/{folder}")
+        config = self._transfer_config(part_size, concurrency)
+
+        async with self._client() as client:
+            if isinstance(source, (str, os.PathLike)):
+                with open(source, "rb") as fileobj:
+                    await client.upload_fileobj(
+                        fileobj, Bucket=actual_bucket, Key=s3filename, Config=config
+                    )
+            else:
+                fileobj = (
+                    source if hasattr(source, "read") else AsyncIteratorReader(source)
+                )
+                await client.upload_fileobj(
+                    fileobj, Bucket=actual_bucket, Key=s3filename, Config=config
+                )
+
+        url = await self._get_file_url(filename, bucket=bucket)
+        return FileResult(filename=filename, url=url)
+
+    async def _get_file_stream(
+        self,
+        filename: str,
+        *,
+        bucket: str | None = None,
+        chunk_size: int = MiB,
+    ) -> AsyncIterator[bytes]:
+        actual_bucket = bucket or self._bucket_name
+        folder = self.aws_folder
+        s3filename = f"{folder}/{filename}" if folder else filename
+        async with self._client() as client:
+            try:
+                response = await client.get_object(Bucket=actual_bucket, Key=s3filename)
+            except ClientError as e:
+                error_code = e.response.get("Error", {}).get("Code")
+                if error_code in ("AccessDenied", "NoSuchBucket"):
+                    raise StoragePermissionError(
+                        f"S3 download failed for bucket '{actual_bucket}': {error_code}. "
+                        f"Check TRANSCRIPT_STORAGE_AWS_* credentials have permission."
+                    ) from e
+                raise
+            async with response["Body"] as body:
+                async for chunk in body.iter_chunks(chunk_size):
+                    yield chunk
+
+    @handle_s3_client_errors("download")
+    async def _download_to_path(
+        self,
+        filename: str,
+        path: Union[str, os.PathLike],
+        *,
+        bucket: str | None = None,
+        part_size: int | None = None,
+        concurrency: int | None = None,
+    ):
+        actual_bucket = bucket or self._bucket_name
+        folder = self.aws_folder
+        logger.info(
+            f"Downloading {filename} from S3 {actual_bucket}/{folder} to {path}"
+        )
+        s3filename = f"{folder}/{filename}" if folder else filename
+        config = self._transfer_config(part_size, concurrency)
+        async with self._client() as client:
+            with open(path, "wb") as fileobj:
+                await client.download_fileobj(
+                    Bucket=actual_bucket, Key=s3filename, Fileobj=fileobj, Config=config
+                )
+
 
 Storage.register("aws", AwsStorage)
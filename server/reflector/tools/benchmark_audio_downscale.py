@@ -0,0 +1,92 @@
+"""
+Benchmark audio downscaling on synthetic 48kHz stereo frames.
+
+Reports frames per second, frame copies (each one a numpy array and a new
+frame buffer) per second of audio, and the peak memory seen by tracemalloc
+(allocations done inside libav are not traced).
+
+Usage:
+    uv run -m reflector.tools.benchmark_audio_downscale --seconds 60
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from unittest import mock
+
+import av
+import numpy as np
+from av.audio.resampler import AudioResampler
+
+from reflector.processors import audio_downscale
+from reflector.processors.audio_downscale import AudioDownscaleProcessor
+
+# what WebRTC delivers: 20ms of 48kHz stereo s16
+SAMPLE_RATE = 48000
+FRAME_SAMPLES = 960
+
+
+def make_frames(seconds: float) -> list[av.AudioFrame]:
+    rng = np.random.default_rng(0)
+    frames = []
+    for i in range(int(seconds * SAMPLE_RATE / FRAME_SAMPLES)):
+        samples = rng.integers(-3000, 3000, size=(1, FRAME_SAMPLES * 2), dtype=np.int16)
+        frame = av.AudioFrame.from_ndarray(samples, format="s16", layout="stereo")
+        frame.sample_rate = SAMPLE_RATE
+        frame.pts = i * FRAME_SAMPLES
+        frames.append(frame)
+    return frames
+
+
+def resample_with_copy(frames: list[av.AudioFrame]):
+    resampler = AudioResampler(format="s16", layout="mono", rate=16000)
+    for frame in frames:
+        resampler.resample(audio_downscale.copy_frame(frame))
+    resampler.resample(None)
+
+
+def resample_in_place(frames: list[av.AudioFrame]):
+    resampler = AudioResampler(format="s16", layout="mono", rate=16000)
+    for frame in frames:
+        resampler.resample(frame)
+    resampler.resample(None)
+
+
+def downscale_processor(frames: list[av.AudioFrame]):
+    async def run():
+        processor = AudioDownscaleProcessor()
+        for frame in frames:
+            await processor.push(frame)
+        await processor.flush()
+
+    asyncio.run(run())
+
+
+def measure(func, frames: list[av.AudioFrame], seconds: float):
+    copies = mock.Mock(wraps=audio_downscale.copy_frame)
+    with mock.patch.object(audio_downscale, "copy_frame", copies):
+        tracemalloc.start()
+        started = time.perf_counter()
+        func(frames)
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    print(
+        f"{func.__name__:>22} {len(frames) / elapsed:>10.0f} "
+        f"{copies.call_count / seconds:>14.1f} {peak / 1024:>10.0f}"
+    )
+
+
+def run(seconds: float):
+    frames = make_frames(seconds)
+    print(f"{'mode':>22} {'frames/s':>10} {'copies/s audio':>14} {'peak KiB':>10}")
+    for func in (resample_with_copy, resample_in_place, downscale_processor):
+        measure(func, frames, seconds)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=60)
+    args = parser.parse_args()
+    run(args.seconds)
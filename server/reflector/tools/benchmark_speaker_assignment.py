@@ -0,0 +1,66 @@
+"""
+Benchmark speaker assignment on synthetic transcripts.
+
+Usage:
+    uv run -m reflector.tools.benchmark_speaker_assignment --hours 0.5 1 2 3
+"""
+
+import argparse
+import random
+import time
+
+from reflector.processors.audio_diarization import AudioDiarizationProcessor
+from reflector.processors.types import DiarizationSegment, Word
+
+
+def make_synthetic_transcript(
+    hours: float,
+    words_per_minute: int = 150,
+    speakers: int = 6,
+    seed: int = 0,
+) -> tuple[list[Word], list[DiarizationSegment]]:
+    """Words at a constant speech rate and speaker turns of 2 to 20 seconds,
+    with a few overlapping backchannel segments"""
+    rng = random.Random(seed)
+    duration = hours * 3600
+    word_duration = 60 / words_per_minute
+
+    words = []
+    t = 0.0
+    while t < duration:
+        text = rng.choice(["so", "we", "should", "ship", "it", "Okay.", "right?"])
+        words.append(Word(text=text, start=t, end=t + word_duration * 0.8))
+        t += word_duration
+
+    diarization = []
+    t = 0.0
+    while t < duration:
+        turn = rng.uniform(2, 20)
+        diarization.append(
+            {"start": t, "end": t + turn, "speaker": rng.randrange(speakers)}
+        )
+        if rng.random() < 0.1:
+            diarization.append(
+                {"start": t + turn / 2, "end": t + turn / 2 + 0.5, "speaker": 0}
+            )
+        t += turn
+
+    return words, diarization
+
+
+def run(hours: list[float]):
+    print(f"{'hours':>6} {'words':>8} {'segments':>9} {'seconds':>8}")
+    for h in hours:
+        words, diarization = make_synthetic_transcript(h)
+        segments = len(diarization)
+        started = time.perf_counter()
+        AudioDiarizationProcessor.assign_speaker(words, diarization)
+        elapsed = time.perf_counter() - started
+        print(f"{h:>6} {len(words):>8} {segments:>9} {elapsed:>8.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--hours", type=float, nargs="+", default=[0.5, 1, 2, 3])
+    args = parser.parse_args()
+    run(args.hours)
@@ -0,0 +1,123 @@
+"""
+Benchmark loading a transcript in full against loading its header.
+
+Creates a synthetic transcript with many topics and events in the
+configured database, loads it with both projections, reports the bytes
+fetched and the latency of each, then removes it.
+
+Usage:
+    uv run -m reflector.tools.benchmark_transcript_projection --hours 0.5 1 2
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from reflector.db import get_database
+from reflector.db.transcripts import (
+    SourceKind,
+    StrValue,
+    TranscriptHeader,
+    TranscriptTopic,
+    transcript_events,
+    transcript_topics,
+    transcripts,
+    transcripts_controller,
+)
+from reflector.processors.types import Word
+
+WORDS_PER_MINUTE = 150
+TOPIC_MINUTES = 3
+
+
+async def make_transcript(hours: float) -> str:
+    """One topic per few minutes of speech and a transcript event per topic"""
+    transcript = await transcripts_controller.add(
+        name="Projection benchmark", source_kind=SourceKind.FILE
+    )
+    word_duration = 60 / WORDS_PER_MINUTE
+    topic_words = WORDS_PER_MINUTE * TOPIC_MINUTES
+    t = 0.0
+    for i in range(int(hours * 60 / TOPIC_MINUTES)):
+        words = []
+        for j in range(topic_words):
+            words.append(Word(text=" word", start=t, end=t + word_duration * 0.8))
+            t += word_duration
+        await transcripts_controller.upsert_topic(
+            transcript,
+            TranscriptTopic(
+                title=f"Topic {i}",
+                summary="A summary of the topic. " * 10,
+                timestamp=words[0].start,
+                transcript="".join(word.text for word in words),
+                words=words,
+            ),
+        )
+        await transcripts_controller.append_event(
+            transcript, event="STATUS", data=StrValue(value="processing")
+        )
+    return transcript.id
+
+
+async def fetched_bytes(transcript_id: str, full: bool) -> int:
+    """Size of the rows the projection reads, serialized as JSON"""
+    if full:
+        rows = [
+            await get_database().fetch_one(
+                transcripts.select().where(transcripts.c.id == transcript_id)
+            )
+        ]
+        for table in (transcript_events, transcript_topics):
+            rows += await get_database().fetch_all(
+                table.select().where(table.c.transcript_id == transcript_id)
+            )
+    else:
+        rows = [
+            await get_database().fetch_one(
+                transcripts_controller._select(TranscriptHeader).where(
+                    transcripts.c.id == transcript_id
+                )
+            )
+        ]
+    return sum(len(json.dumps(dict(row), default=str)) for row in rows)
+
+
+async def measure(transcript_id: str, repeat: int, **kwargs) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        await transcripts_controller.get_by_id(transcript_id, **kwargs)
+    return (time.perf_counter() - started) / repeat
+
+
+async def run(hours: list[float], repeat: int):
+    database = get_database()
+    await database.connect()
+    try:
+        print(
+            f"{'hours':>6} {'full KB':>9} {'header KB':>10} "
+            f"{'full ms':>8} {'header ms':>10}"
+        )
+        for h in hours:
+            transcript_id = await make_transcript(h)
+            try:
+                full_size = await fetched_bytes(transcript_id, full=True)
+                header_size = await fetched_bytes(transcript_id, full=False)
+                full = await measure(transcript_id, repeat)
+                header = await measure(transcript_id, repeat, fields=TranscriptHeader)
+            finally:
+                await transcripts_controller.remove_by_id(transcript_id)
+            print(
+                f"{h:>6} {full_size / 1024:>9.0f} {header_size / 1024:>10.1f} "
+                f"{full * 1000:>8.1f} {header * 1000:>10.2f}"
+            )
+    finally:
+        await database.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--hours", type=float, nargs="+", default=[0.5, 1, 2])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.hours, args.repeat))
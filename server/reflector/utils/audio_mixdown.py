@@ -5,11 +5,23 @@ Shared PyAV-based functions for mixing multiple audio tracks into a single outpu
 Used by both Hatchet workflows and Celery pipelines.
 """
 
+import asyncio
+import queue
+import threading
 from fractions import Fraction
 
 import av
 from av.audio.resampler import AudioResampler
 
+# Default number of decoded frames buffered per track
+MIXDOWN_QUEUE_SIZE = 64
+
+# Interval at which blocked workers and readers check for cancellation
+_POLL_INTERVAL = 0.1
+
+# Marks the end of a track in its queue
+_END = object()
+
 
 def detect_sample_rate_from_tracks(track_urls: list[str], logger=None) -> int | None:
     """Detect sample rate from first decodable audio frame.
@@ -37,6 +49,129 @@ def detect_sample_rate_from_tracks(track_urls: list[str], logger=None) -> int |
     return None
 
 
+def build_mixdown_graph(
+    target_sample_rate: int, delays_ms: list[int]
+) -> tuple[av.filter.Graph, list, object]:
+    """Build the amix filter graph, one input per entry of `delays_ms`.
+
+    N abuffer (s32/stereo)
+      -> optional adelay per input (for alignment)
+      -> amix (s32)
+      -> aformat(s32)
+      -> sink
+
+    Returns:
+        (graph, inputs, sink)
+    """
+    graph = av.filter.Graph()
+    inputs = []
+
+    for idx in range(len(delays_ms)):
+        args = (
+            f"time_base=1/{target_sample_rate}:"
+            f"sample_rate={target_sample_rate}:"
+            f"sample_fmt=s32:"
+            f"channel_layout=stereo"
+        )
+        in_ctx = graph.add("abuffer", args=args, name=f"in{idx}")
+        inputs.append(in_ctx)
+
+    mixer = graph.add("amix", args=f"inputs={len(inputs)}:normalize=0", name="mix")
+
+    fmt = graph.add(
+        "aformat",
+        args=f"sample_fmts=s32:channel_layouts=stereo:sample_rates={target_sample_rate}",
+        name="fmt",
+    )
+
+    sink = graph.add("abuffersink", name="out")
+
+    for idx, in_ctx in enumerate(inputs):
+        delay_ms = delays_ms[idx]
+        if delay_ms > 0:
+            # adelay requires one value per channel; use same for stereo
+            adelay = graph.add(
+                "adelay",
+                args=f"delays={delay_ms}|{delay_ms}:all=1",
+                name=f"delay{idx}",
+            )
+            in_ctx.link_to(adelay)
+            adelay.link_to(mixer, 0, idx)
+        else:
+            in_ctx.link_to(mixer, 0, idx)
+
+    mixer.link_to(fmt)
+    fmt.link_to(sink)
+    graph.configure()
+    return graph, inputs, sink
+
+
+def _decode_tracks(
+    containers: list,
+    queues: list[queue.Queue],
+    target_sample_rate: int,
+    stop: threading.Event,
+):
+    """Decode and resample tracks round-robin into their queues.
+
+    Each queue item holds the resampled frames of one decoded frame, with
+    the decoded frame time, so the reader consumes one item per track per
+    round. An exception ends the track and is forwarded to the reader.
+    """
+
+    def put(q: queue.Queue, item) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    decoders = [c.decode(audio=0) for c in containers]
+    resamplers = [
+        AudioResampler(format="s32", layout="stereo", rate=target_sample_rate)
+        for _ in containers
+    ]
+    active = list(range(len(containers)))
+
+    while active and not stop.is_set():
+        for i in list(active):
+            try:
+                frame = next(decoders[i], None)
+                if frame is None:
+                    # flush samples buffered by the resampler
+                    item = (None, resamplers[i].resample(None) or [])
+                else:
+                    item = (frame.time, resamplers[i].resample(frame) or [])
+            except Exception as e:
+                frame, item = None, e
+
+            if not put(queues[i], item):
+                return
+            if frame is None:
+                active.remove(i)
+                if not isinstance(item, Exception) and not put(queues[i], _END):
+                    return
+
+
+async def _read_queue(q: queue.Queue, stop: threading.Event):
+    try:
+        return q.get_nowait()
+    except queue.Empty:
+        pass
+
+    def get():
+        while not stop.is_set():
+            try:
+                return q.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+        return _END
+
+    return await asyncio.to_thread(get)
+
+
 async def mixdown_tracks_pyav(
     track_urls: list[str],
     writer,
@@ -45,16 +180,22 @@ async def mixdown_tracks_pyav(
     logger=None,
     progress_callback=None,
     expected_duration_sec: float | None = None,
+    max_workers: int = 4,
+    queue_size: int = MIXDOWN_QUEUE_SIZE,
 ) -> None:
     """Multi-track mixdown using PyAV filter graph (amix).
 
-    Builds a filter graph: N abuffer -> optional adelay -> amix -> aformat -> sink
+    Tracks are decoded and resampled in up to `max_workers` threads, each
+    handling a share of the tracks round-robin, into bounded per-track
+    queues. The filter graph consumes one decoded frame per track in turn,
+    so the output does not depend on the number of workers.
     Reads from S3 presigned URLs or local files, pushes mixed frames to writer.
 
     Args:
         track_urls: List of URLs to audio tracks (S3 presigned or local)
         writer: AudioFileWriterProcessor instance with async push() method
-        target_sample_rate: Sample rate for output (Hz)
+        target_sample_rate: Sample rate for output (Hz). Tracks with another
+            sample rate are resampled.
         offsets_seconds: Optional per-track delays in seconds for alignment.
             If provided, must have same length as track_urls. Delays are relative
             to the minimum offset (earliest track has delay=0).
@@ -63,6 +204,8 @@ async def mixdown_tracks_pyav(
             called on progress updates. progress_pct is 0-100 if duration known, None otherwise.
             audio_position is current position in seconds.
         expected_duration_sec: Optional fallback duration if container metadata unavailable.
+        max_workers: Maximum number of decoding threads.
+        queue_size: Maximum number of decoded frames buffered per track.
 
     Raises:
         ValueError: If offsets_seconds length doesn't match track_urls,
@@ -79,76 +222,17 @@ async def mixdown_tracks_pyav(
             logger.error("Mixdown failed - no valid track URLs provided")
         raise ValueError("Mixdown failed: No valid track URLs")
 
-    # Calculate per-input delays if offsets provided
+    # Calculate per-input offsets if provided
     input_offsets_seconds = None
     if offsets_seconds is not None:
         input_offsets_seconds = [
             offsets_seconds[i] for i, url in enumerate(track_urls) if url
         ]
 
-    # Build PyAV filter graph:
-    # N abuffer (s32/stereo)
-    #   -> optional adelay per input (for alignment)
-    #   -> amix (s32)
-    #   -> aformat(s16)
-    #   -> sink
-    graph = av.filter.Graph()
-    inputs = []
-
-    for idx, url in enumerate(valid_track_urls):
-        args = (
-            f"time_base=1/{target_sample_rate}:"
-            f"sample_rate={target_sample_rate}:"
-            f"sample_fmt=s32:"
-            f"channel_layout=stereo"
-        )
-        in_ctx = graph.add("abuffer", args=args, name=f"in{idx}")
-        inputs.append(in_ctx)
-
-    if not inputs:
-        if logger:
-            logger.error("Mixdown failed - no valid inputs for graph")
-        raise ValueError("Mixdown failed: No valid inputs for filter graph")
-
-    mixer = graph.add("amix", args=f"inputs={len(inputs)}:normalize=0", name="mix")
-
-    fmt = graph.add(
-        "aformat",
-        args=f"sample_fmts=s32:channel_layouts=stereo:sample_rates={target_sample_rate}",
-        name="fmt",
-    )
-
-    sink = graph.add("abuffersink", name="out")
-
-    # Optional per-input delay before mixing
-    delays_ms: list[int] = []
-    if input_offsets_seconds is not None:
-        base = min(input_offsets_seconds) if input_offsets_seconds else 0.0
-        delays_ms = [
-            max(0, int(round((o - base) * 1000))) for o in input_offsets_seconds
-        ]
-    else:
-        delays_ms = [0 for _ in inputs]
-
-    for idx, in_ctx in enumerate(inputs):
-        delay_ms = delays_ms[idx] if idx < len(delays_ms) else 0
-        if delay_ms > 0:
-            # adelay requires one value per channel; use same for stereo
-            adelay = graph.add(
-                "adelay",
-                args=f"delays={delay_ms}|{delay_ms}:all=1",
-                name=f"delay{idx}",
-            )
-            in_ctx.link_to(adelay)
-            adelay.link_to(mixer, 0, idx)
-        else:
-            in_ctx.link_to(mixer, 0, idx)
-
-    mixer.link_to(fmt)
-    fmt.link_to(sink)
-    graph.configure()
-
     containers = []
+    opened_offsets_seconds = []
+    stop = threading.Event()
+    workers: list[threading.Thread] = []
     try:
         # Open all containers with cleanup guaranteed
         for i, url in enumerate(valid_track_urls):
@@ -163,6 +247,8 @@ async def mixdown_tracks_pyav(
                     },
                 )
                 containers.append(c)
+                if input_offsets_seconds is not None:
+                    opened_offsets_seconds.append(input_offsets_seconds[i])
             except Exception as e:
                 if logger:
                     logger.warning(
@@ -177,6 +263,17 @@ async def mixdown_tracks_pyav(
                 logger.error("Mixdown failed - no valid containers opened")
             raise ValueError("Mixdown failed: Could not open any track containers")
 
+        # Optional per-input delay before mixing
+        if input_offsets_seconds is not None:
+            base = min(opened_offsets_seconds)
+            delays_ms = [
+                max(0, int(round((o - base) * 1000))) for o in opened_offsets_seconds
+            ]
+        else:
+            delays_ms = [0 for _ in containers]
+
+        graph, inputs, sink = build_mixdown_graph(target_sample_rate, delays_ms)
+
         # Calculate total duration for progress reporting.
         # Try container metadata first, fall back to expected_duration_sec if provided.
         max_duration_sec = 0.0
@@ -188,31 +285,54 @@ async def mixdown_tracks_pyav(
             max_duration_sec = expected_duration_sec
         current_max_time = 0.0
 
-        decoders = [c.decode(audio=0) for c in containers]
-        active = [True] * len(decoders)
-        resamplers = [
-            AudioResampler(format="s32", layout="stereo", rate=target_sample_rate)
-            for _ in decoders
-        ]
+        queues = [queue.Queue(maxsize=max(1, queue_size)) for _ in containers]
+        num_workers = max(1, min(max_workers, len(containers)))
+        for w in range(num_workers):
+            indexes = list(range(w, len(containers), num_workers))
+            worker = threading.Thread(
+                target=_decode_tracks,
+                args=(
+                    [containers[i] for i in indexes],
+                    [queues[i] for i in indexes],
+                    target_sample_rate,
+                    stop,
+                ),
+                name=f"mixdown-decode-{w}",
+                daemon=True,
+            )
+            worker.start()
+            workers.append(worker)
+
+        async def pull_mixed():
+            while True:
+                try:
+                    mixed = sink.pull()
+                except Exception:
+                    break
+                mixed.sample_rate = target_sample_rate
+                mixed.time_base = Fraction(1, target_sample_rate)
+                await writer.push(mixed)
 
+        active = [True] * len(containers)
         while any(active):
-            for i, (dec, is_active) in enumerate(zip(decoders, active)):
+            for i, is_active in enumerate(active):
                 if not is_active:
                     continue
-                try:
-                    frame = next(dec)
-                except StopIteration:
+
+                item = await _read_queue(queues[i], stop)
+                if isinstance(item, Exception):
+                    raise item
+                if item is _END:
                     active[i] = False
                     # Signal end of stream to filter graph
                     inputs[i].push(None)
                     continue
 
-                if frame.sample_rate != target_sample_rate:
-                    continue
+                frame_time, out_frames = item
 
                 # Update progress based on frame timestamp
-                if progress_callback and frame.time is not None:
-                    current_max_time = max(current_max_time, frame.time)
+                if progress_callback and frame_time is not None:
+                    current_max_time = max(current_max_time, frame_time)
                     if max_duration_sec > 0:
                         progress_pct = min(
                             100.0, (current_max_time / max_duration_sec) * 100
@@ -221,32 +341,22 @@ async def mixdown_tracks_pyav(
                         progress_pct = None  # Duration unavailable
                     progress_callback(progress_pct, current_max_time)
 
-                out_frames = resamplers[i].resample(frame) or []
                 for rf in out_frames:
                     rf.sample_rate = target_sample_rate
                     rf.time_base = Fraction(1, target_sample_rate)
                     inputs[i].push(rf)
 
-                while True:
-                    try:
-                        mixed = sink.pull()
-                    except Exception:
-                        break
-                    mixed.sample_rate = target_sample_rate
-                    mixed.time_base = Fraction(1, target_sample_rate)
-                    await writer.push(mixed)
+                await pull_mixed()
 
         # Flush remaining frames from filter graph
-        while True:
-            try:
-                mixed = sink.pull()
-            except Exception:
-                break
-            mixed.sample_rate = target_sample_rate
-            mixed.time_base = Fraction(1, target_sample_rate)
-            await writer.push(mixed)
+        await pull_mixed()
 
     finally:
+        # Stop the decoders before closing their containers
+        stop.set()
+        for worker in workers:
+            await asyncio.to_thread(worker.join)
+
         # Cleanup all containers, even if processing failed
         for c in containers:
             if c is not None:
@@ -1,72 +1,190 @@
 from pathlib import Path
+from typing import Iterable
 
 import av
 import numpy as np
 
 from reflector.utils.audio_constants import WAVEFORM_SEGMENTS
 
+# number of samples gathered before running the reductions
+WAVEFORM_BLOCK_SIZE = 1 << 20
+
+
+class _SegmentAccumulator:
+    """Peak and sum of squares per segment of `chunk_size` samples"""
+
+    def __init__(self, chunk_size: int, max_segments: int):
+        self.chunk_size = chunk_size
+        self.max_segments = max_segments
+        self.peaks: list[np.ndarray] = []
+        self.sumsq: list[np.ndarray] = []
+        self.count = 0
+        # partially filled segment carried over to the next block
+        self.pending = 0
+        self.pending_peak = 0.0
+        self.pending_sumsq = 0.0
+
+    def reduce(self, absolute: np.ndarray, squares: np.ndarray):
+        if self.count >= self.max_segments:
+            return
+
+        offset = 0
+        if self.pending:
+            offset = min(self.chunk_size - self.pending, len(absolute))
+            self.pending_peak = max(self.pending_peak, float(absolute[:offset].max()))
+            self.pending_sumsq += float(squares[:offset].sum(dtype=np.float64))
+            self.pending += offset
+            if self.pending < self.chunk_size:
+                return
+            self._append(np.array([self.pending_peak]), np.array([self.pending_sumsq]))
+            self.pending = 0
+
+        size = self.chunk_size
+        n = (len(absolute) - offset) // size
+        if n:
+            end = offset + n * size
+            self._append(
+                absolute[offset:end].reshape(n, size).max(axis=1),
+                squares[offset:end].reshape(n, size).sum(axis=1, dtype=np.float64),
+            )
+            offset = end
+
+        if offset < len(absolute):
+            self.pending = len(absolute) - offset
+            self.pending_peak = float(absolute[offset:].max())
+            self.pending_sumsq = float(squares[offset:].sum(dtype=np.float64))
+
+    def _append(self, peaks: np.ndarray, sumsq: np.ndarray):
+        self.peaks.append(peaks)
+        self.sumsq.append(sumsq)
+        self.count += len(peaks)
+
+
+class WaveformReducer:
+    """
+    Streaming peak / RMS reduction of an audio stream into segments.
+
+    Samples are copied into a block buffer as they are pushed, and each full
+    block is reduced with reshapes, once for every requested resolution. A
+    reducer can be fed frames already decoded for another purpose, such as a
+    conversion, so the audio is decoded only once.
+
+    `total_samples` is the expected number of values (samples * channels) of
+    the stream, used to size the segments of each resolution. As with the
+    decoded duration, the last partial segment is dropped.
+    """
+
+    def __init__(
+        self,
+        total_samples: float,
+        resolutions: Iterable[int] = (WAVEFORM_SEGMENTS,),
+        block_size: int = WAVEFORM_BLOCK_SIZE,
+    ):
+        self.accumulators: dict[int, _SegmentAccumulator] = {}
+        for segments_count in resolutions:
+            # there may not be enough data to fill the segments,
+            # use a segment size of 1 in that case
+            chunk_size = max(1, int(total_samples / segments_count))
+            # 1.1 is a safety margin as pyav decode does not always return
+            # the exact number of samples that we expect
+            self.accumulators[segments_count] = _SegmentAccumulator(
+                chunk_size, int(segments_count * 1.1)
+            )
+        self._block = np.empty(block_size, dtype=np.float32)
+        self._fill = 0
+
+    def push_frame(self, frame: av.AudioFrame):
+        self.push(frame.to_ndarray())
+
+    def push(self, samples: np.ndarray):
+        data = np.asarray(samples).reshape(-1)
+        offset = 0
+        while offset < len(data):
+            take = min(len(self._block) - self._fill, len(data) - offset)
+            self._block[self._fill : self._fill + take] = data[offset : offset + take]
+            self._fill += take
+            offset += take
+            if self._fill == len(self._block):
+                self._reduce_block()
+
+    def peaks(self, segments_count: int = WAVEFORM_SEGMENTS) -> list[float]:
+        """Peak amplitude per segment, normalized to [0, 1]"""
+        accumulator = self._finish(segments_count)
+        return _normalize(_concatenate(accumulator.peaks, accumulator.max_segments))
+
+    def rms(self, segments_count: int = WAVEFORM_SEGMENTS) -> list[float]:
+        """RMS amplitude per segment, normalized to [0, 1]"""
+        accumulator = self._finish(segments_count)
+        sumsq = _concatenate(accumulator.sumsq, accumulator.max_segments)
+        return _normalize(np.sqrt(sumsq / accumulator.chunk_size))
+
+    def _finish(self, segments_count: int) -> _SegmentAccumulator:
+        if self._fill:
+            self._reduce_block()
+        return self.accumulators[segments_count]
+
+    def _reduce_block(self):
+        block = self._block[: self._fill]
+        absolute = np.abs(block)
+        squares = np.square(block)
+        for accumulator in self.accumulators.values():
+            accumulator.reduce(absolute, squares)
+        self._fill = 0
+
+
+def _concatenate(parts: list[np.ndarray], limit: int) -> np.ndarray:
+    if not parts:
+        return np.array([])
+    return np.concatenate(parts)[:limit]
+
+
+def _normalize(volumes: np.ndarray) -> list[float]:
+    # number of decimals to use when rounding the peak value
+    digits = 2
+    volumes = volumes.astype(np.float64)
+    if len(volumes) > 0 and volumes.max() > 0:
+        volumes = np.round(volumes / volumes.max(), digits)
+    else:
+        volumes = np.zeros(len(volumes))
+    return volumes.tolist()
 
-def get_audio_waveform(
-    path: Path | str, segments_count: int = WAVEFORM_SEGMENTS
-) -> list[int]:
-    if isinstance(path, Path):
-        path = path.as_posix()
 
-    container = av.open(path)
+def open_waveform_reducer(
+    container: av.container.InputContainer,
+    resolutions: Iterable[int] = (WAVEFORM_SEGMENTS,),
+) -> WaveformReducer:
+    """Create a reducer sized for the first audio stream of `container`"""
     stream = container.streams.audio[0]
     duration = container.duration / av.time_base
+    return WaveformReducer(
+        total_samples=duration * stream.rate * stream.channels,
+        resolutions=resolutions,
+    )
+
+
+def get_audio_waveforms(
+    path: Path | str,
+    resolutions: Iterable[int],
+    rms: bool = False,
+) -> dict[int, list[float]]:
+    """Compute the waveform of a file at several resolutions in one pass"""
+    if isinstance(path, Path):
+        path = path.as_posix()
 
-    chunk_size_secs = duration / segments_count
-    chunk_size = int(chunk_size_secs * stream.rate * stream.channels)
-
-    if chunk_size == 0:
-        # there is not enough data to fill the chunks
-        # so basically we use chunk_size of 1.
-        chunk_size = 1
-
-    # 1.1 is a safety margin as it seems that pyav decode
-    # does not always return the exact number of chunks
-    # that we expect.
-    volumes = np.zeros(int(segments_count * 1.1), dtype=float)
-    current_chunk_idx = 0
-    current_chunk_size = 0
-    current_chunk_volume = 0
-
-    count = 0
-    frames = 0
-    samples = 0
-    for frame in container.decode(stream):
-        data = frame.to_ndarray().flatten()
-        count += len(data)
-        frames += 1
-        samples += frame.samples
-        while len(data) > 0:
-            datalen = len(data)
-
-            # check how much we need to fill the chunk
-            chunk_remaining = chunk_size - current_chunk_size
-            if chunk_remaining > 0:
-                volume = np.absolute(data[:chunk_remaining]).max()
-                data = data[chunk_remaining:]
-                current_chunk_volume = max(current_chunk_volume, volume)
-                current_chunk_size += min(chunk_remaining, datalen)
-
-            if current_chunk_size == chunk_size:
-                # chunk is full, add it to the volumes
-                volumes[current_chunk_idx] = current_chunk_volume
-                current_chunk_idx += 1
-                current_chunk_size = 0
-                current_chunk_volume = 0
-    volumes = volumes[:current_chunk_idx]
+    resolutions = list(resolutions)
+    with av.open(path) as container:
+        reducer = open_waveform_reducer(container, resolutions)
+        for frame in container.decode(container.streams.audio[0]):
+            reducer.push_frame(frame)
 
-    # number of decimals to use when rounding the peak value
-    digits = 2
-    if len(volumes) > 0 and volumes.max() > 0:
-        volumes = np.round(volumes / volumes.max(), digits)
-    else:
-        volumes = np.zeros_like(volumes) if len(volumes) > 0 else np.array([])
+    reduce = reducer.rms if rms else reducer.peaks
+    return {segments_count: reduce(segments_count) for segments_count in resolutions}
 
-    return volumes.tolist()
+
+def get_audio_waveform(
+    path: Path | str, segments_count: int = WAVEFORM_SEGMENTS
+) -> list[float]:
+    return get_audio_waveforms(path, [segments_count])[segments_count]
 
 
 if __name__ == "__main__":
@@ -75,6 +193,7 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("path", type=Path)
     parser.add_argument("--segments-count", type=int, default=WAVEFORM_SEGMENTS)
+    parser.add_argument("--rms", action="store_true")
     args = parser.parse_args()
 
-    print(get_audio_waveform(args.path, args.segments_count))
+    print(get_audio_waveforms(args.path, [args.segments_count], rms=args.rms))
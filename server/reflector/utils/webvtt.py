@@ -61,3 +61,68 @@ def topics_to_webvtt(topics: list["TranscriptTopic"]) -> WebVTTStr:
         ), f"Words are not in sequence: {all_words[i].text} and {all_words[i + 1].text} are not consecutive: {all_words[i].start} > {all_words[i + 1].start}"
 
     return words_to_webvtt(all_words)
+
+
+def _last_cue_words(cue: str, topics: list["TranscriptTopic"]) -> list[Word] | None:
+    """Find the words rendered in `cue` at the end of the words of `topics`"""
+    timing, _, text = cue.partition("\n")
+    start = timing.split(" --> ")[0]
+    if text.startswith("<v "):
+        text = text[text.find(">") + 1 :]
+
+    suffix: list[Word] = []
+    suffix_length = 0
+    for topic in reversed(topics):
+        for word in reversed(topic.words):
+            suffix.append(word)
+            suffix_length += len(word.text.strip())
+            if suffix_length > len(text):
+                return None
+            if seconds_to_timestamp(word.start) != start:
+                continue
+            suffix.reverse()
+            if "".join(w.text for w in suffix).strip() == text:
+                return suffix
+            suffix.reverse()
+    return None
+
+
+def append_topic_webvtt(
+    content: WebVTTStr | None,
+    previous_topics: list["TranscriptTopic"],
+    topic: "TranscriptTopic",
+) -> WebVTTStr:
+    """
+    Render `topic` at the end of `content`, the WebVTT of `previous_topics`,
+    the same as topics_to_webvtt would render all of them.
+
+    Only the last cue is segmented again, as the new words may continue it;
+    the cues before it are kept as is. Falls back to a full render when
+    `content` does not match `previous_topics` or the words are not in
+    sequence.
+    """
+
+    def render_all() -> WebVTTStr:
+        return topics_to_webvtt([*previous_topics, topic])
+
+    if content is None or not topic.words:
+        return render_all()
+
+    blocks = content.rstrip("\n").split("\n\n")
+    if len(blocks) > 1:
+        tail = _last_cue_words(blocks.pop(), previous_topics)
+        if tail is None:
+            return render_all()
+    elif any(previous.words for previous in previous_topics):
+        return render_all()
+    else:
+        tail = []
+
+    words = tail + topic.words
+    if any(words[i].start > words[i + 1].start for i in range(len(words) - 1)):
+        return render_all()
+
+    rendered = words_to_webvtt(words)
+    trailing = rendered[len(rendered.rstrip("\n")) :]
+    cues = rendered.rstrip("\n").split("\n\n")[1:]
+    return "\n\n".join(blocks + cues) + trailing
@@ -0,0 +1,97 @@
+import httpx
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+
+from reflector.events import subscribers_shutdown
+from reflector.logger import logger
+from reflector.processors.http_client import HttpClientPool
+
+# forwarded so the upstream answers range and conditional requests itself
+REQUEST_HEADERS = [
+    "range",
+    "if-range",
+    "if-none-match",
+    "if-modified-since",
+    "accept-encoding",
+]
+
+RESPONSE_HEADERS = [
+    "content-type",
+    "content-length",
+    "content-range",
+    "content-encoding",
+    "accept-ranges",
+    "etag",
+    "last-modified",
+    "cache-control",
+]
+
+
+class ProxyClientPool(HttpClientPool):
+    """
+    Keep-alive clients for proxied downloads, per event loop and host
+
+    A streamed response holds its connection until the client is done with
+    it, so connections are not capped like the model backends ones.
+    """
+
+    @staticmethod
+    def _create(base_url: str) -> httpx.AsyncClient:
+        return httpx.AsyncClient(limits=httpx.Limits(max_connections=None))
+
+
+proxy_client_pool = ProxyClientPool()
+
+
+@subscribers_shutdown.append
+async def proxy_client_pool_close(_):
+    await proxy_client_pool.close()
+
+
+async def proxy_response(request: Request, url: str) -> Response:
+    """
+    Stream `url` back to the client as it arrives, so memory stays constant
+    whatever the file size, and let the upstream handle Range and If-* headers
+    """
+    headers = {
+        header: request.headers[header]
+        for header in REQUEST_HEADERS
+        if header in request.headers
+    }
+
+    client = proxy_client_pool.get(url)
+    try:
+        upstream = await client.send(
+            client.build_request(request.method, url, headers=headers),
+            stream=True,
+        )
+    except httpx.HTTPError as e:
+        logger.warning("Failed to reach upstream for proxying", exc_info=e)
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Upstream unavailable",
+        )
+
+    response_headers = {
+        header: upstream.headers[header]
+        for header in RESPONSE_HEADERS
+        if header in upstream.headers
+    }
+    response_headers["access-control-expose-headers"] = ", ".join(RESPONSE_HEADERS)
+
+    if request.method == "HEAD" or upstream.status_code == 304:
+        await upstream.aclose()
+        return Response(status_code=upstream.status_code, headers=response_headers)
+
+    async def body():
+        try:
+            # raw: the content-encoding is passed through, not decoded
+            async for chunk in upstream.aiter_raw():
+                yield chunk
+        finally:
+            # back to the pool, or dropped if the download was cut short
+            await upstream.aclose()
+
+    return StreamingResponse(
+        body(), status_code=upstream.status_code, headers=response_headers
+    )
@@ -38,6 +38,13 @@ def _get_range_header(range_header: str, file_size: int) -> tuple[int, int]:
     return start, end
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
 def range_requests_response(
     request: Request, file_path: str, content_type: str, content_disposition: str
 ):
@@ -46,7 +53,9 @@ def range_requests_response(
     if not os.path.exists(file_path):
         raise HTTPException(status_code=404, detail="File not found")
 
-    file_size = os.stat(file_path).st_size
+    stat = os.stat(file_path)
+    file_size = stat.st_size
+    etag = f'"{stat.st_mtime_ns:x}-{file_size:x}"'
     range_header = request.headers.get("range")
 
     headers = {
@@ -54,12 +63,23 @@ def range_requests_response(
         "accept-ranges": "bytes",
         "content-encoding": "identity",
         "content-length": str(file_size),
+        "etag": etag,
         "access-control-expose-headers": (
             "content-type, accept-ranges, content-length, "
-            "content-range, content-encoding"
+            "content-range, content-encoding, etag"
         ),
     }
 
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"etag": etag}
+        )
+
+    # the file changed since the client fetched the other ranges, send it all
+    if_range = request.headers.get("if-range")
+    if if_range is not None and if_range != etag:
+        range_header = None
+
     if request.method == "HEAD":
         return Response(headers=headers)
 
@@ -16,6 +16,7 @@ from pydantic import (
 
 import reflector.auth as auth
 from reflector.db import get_database
+from reflector.db.pagination import CountMode, InvalidCursor, KeysetCursor
 from reflector.db.recordings import recordings_controller
 from reflector.db.rooms import rooms_controller
 from reflector.db.search import (
@@ -33,6 +34,7 @@ from reflector.db.search import (
 )
 from reflector.db.transcripts import (
     SourceKind,
+    TranscriptHeader,
     TranscriptParticipant,
     TranscriptStatus,
     TranscriptTopic,
@@ -253,12 +255,51 @@ SearchToDatetimeParam = Annotated[
 ]
 
 
+CursorParam = Annotated[
+    str | None,
+    Query(
+        description="Cursor of the page to fetch, from next_cursor of the previous page"
+    ),
+]
+
+
+def parse_cursor_param(cursor: str | None) -> KeysetCursor | None:
+    if cursor is None:
+        return None
+    try:
+        return KeysetCursor.decode(cursor)
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
 class SearchResponse(BaseModel):
     results: list[SearchResult]
     total: SearchTotal
     query: SearchQuery | None = None
     limit: SearchLimit
     offset: SearchOffset
+    next_cursor: str | None = None
+
+
+class TranscriptsCursorPage(BaseModel):
+    items: list[GetTranscriptMinimal]
+    size: int
+    next_cursor: str | None = None
+    total: int | None = Field(
+        None, description="Number of transcripts, in the requested count mode"
+    )
+
+
+def transcripts_list_order_by(
+    sort_by: Literal["created_at", "change_seq"] | None,
+) -> str:
+    # Default behavior preserved: sort_by=None → "-created_at"
+    if sort_by == "change_seq":
+        return "change_seq"  # ASC (ascending for checkpoint-based polling)
+    elif sort_by == "created_at":
+        return "-created_at"  # DESC (newest first, same as current default)
+    else:
+        return "-created_at"  # default, backward compatible
 
 
 @router.get("/transcripts", response_model=Page[GetTranscriptMinimal])
@@ -275,14 +316,6 @@ async def transcripts_list(
 
     user_id = user["sub"] if user else None
 
-    # Default behavior preserved: sort_by=None → "-created_at"
-    if sort_by == "change_seq":
-        order_by = "change_seq"  # ASC (ascending for checkpoint-based polling)
-    elif sort_by == "created_at":
-        order_by = "-created_at"  # DESC (newest first, same as current default)
-    else:
-        order_by = "-created_at"  # default, backward compatible
-
     return await apaginate(
         get_database(),
         await transcripts_controller.get_all(
@@ -290,18 +323,69 @@ async def transcripts_list(
             source_kind=SourceKind(source_kind) if source_kind else None,
             room_id=room_id,
             search_term=search_term,
-            order_by=order_by,
+            order_by=transcripts_list_order_by(sort_by),
             change_seq_from=change_seq_from,
             return_query=True,
         ),
     )
 
 
+@router.get("/transcripts/cursor", response_model=TranscriptsCursorPage)
+async def transcripts_list_cursor(
+    user: Annotated[Optional[auth.UserInfo], Depends(auth.current_user_optional)],
+    cursor: CursorParam = None,
+    size: Annotated[int, Query(ge=1, le=100)] = 50,
+    count: Annotated[
+        CountMode,
+        Query(description="Total count: exact, approximate (planner estimate) or none"),
+    ] = "none",
+    source_kind: SourceKind | None = None,
+    room_id: str | None = None,
+    search_term: str | None = None,
+    change_seq_from: int | None = None,
+    sort_by: Literal["created_at", "change_seq"] | None = None,
+):
+    """
+    Same listing as /transcripts, with keyset pagination: the cost of a page
+    does not depend on how deep it is, and the total is only counted on
+    request.
+    """
+    if not user and not settings.PUBLIC_MODE:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+
+    user_id = user["sub"] if user else None
+    after = parse_cursor_param(cursor)
+
+    try:
+        rows, next_cursor, total = await transcripts_controller.get_page(
+            limit=size,
+            order_by=transcripts_list_order_by(sort_by),
+            after=after,
+            count=count,
+            user_id=user_id,
+            source_kind=SourceKind(source_kind) if source_kind else None,
+            room_id=room_id,
+            search_term=search_term,
+            change_seq_from=change_seq_from,
+        )
+    except InvalidCursor:
+        # a cursor from another sort order
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    return TranscriptsCursorPage(
+        items=[GetTranscriptMinimal.model_validate(dict(row)) for row in rows],
+        size=size,
+        next_cursor=next_cursor.encode() if next_cursor else None,
+        total=total,
+    )
+
+
 @router.get("/transcripts/search", response_model=SearchResponse)
 async def transcripts_search(
     q: SearchQueryParam,
     limit: SearchLimitParam = DEFAULT_SEARCH_LIMIT,
     offset: SearchOffsetParam = 0,
+    cursor: CursorParam = None,
     room_id: Optional[str] = None,
     source_kind: Optional[SourceKind] = None,
     from_datetime: SearchFromDatetimeParam = None,
@@ -321,10 +405,16 @@ async def transcripts_search(
             status_code=400, detail="'from' must be less than or equal to 'to'"
         )
 
+    if cursor is not None and offset:
+        raise HTTPException(
+            status_code=400, detail="'cursor' and 'offset' cannot be combined"
+        )
+
     search_params = SearchParameters(
         query_text=parse_search_query_param(q),
         limit=limit,
         offset=offset,
+        cursor=parse_cursor_param(cursor),
         user_id=user_id,
         room_id=room_id,
         source_kind=source_kind,
@@ -332,7 +422,13 @@ async def transcripts_search(
         to_datetime=to_datetime,
     )
 
-    results, total = await search_controller.search_transcripts(search_params)
+    try:
+        results, total, next_cursor = await search_controller.search_transcripts_page(
+            search_params
+        )
+    except InvalidCursor:
+        # a cursor from a search with or without query text
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
     return SearchResponse(
         results=results,
@@ -340,6 +436,7 @@ async def transcripts_search(
         query=search_params.query_text,
         limit=search_params.limit,
         offset=search_params.offset,
+        next_cursor=next_cursor.encode() if next_cursor else None,
     )
 
 
@@ -589,7 +686,9 @@ async def transcript_delete(
     user: Annotated[auth.UserInfo, Depends(auth.current_user)],
 ):
     user_id = user["sub"]
-    transcript = await transcripts_controller.get_by_id(transcript_id)
+    transcript = await transcripts_controller.get_by_id(
+        transcript_id, fields=TranscriptHeader
+    )
     if not transcript:
         raise HTTPException(status_code=404, detail="Transcript not found")
     if not transcripts_controller.user_can_mutate(transcript, user_id):
@@ -6,15 +6,20 @@ Transcripts audio related endpoints
 
 from typing import Annotated, Optional
 
-import httpx
-from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import RedirectResponse
 from jose import jwt
 
 import reflector.auth as auth
-from reflector.db.transcripts import AudioWaveform, transcripts_controller
+from reflector.db.transcripts import (
+    AudioWaveform,
+    TranscriptHeader,
+    transcripts_controller,
+)
 from reflector.settings import settings
 from reflector.views.transcripts import ALGORITHM
 
+from ._proxy_response import proxy_response
 from ._range_requests_response import range_requests_response
 
 router = APIRouter()
@@ -48,26 +53,16 @@ async def transcript_get_audio_mp3(
             raise unauthorized_exception
 
     transcript = await transcripts_controller.get_by_id_for_http(
-        transcript_id, user_id=user_id
+        transcript_id, user_id=user_id, fields=TranscriptHeader
     )
 
     if transcript.audio_location == "storage":
-        # proxy S3 file, to prevent issue with CORS
         url = await transcript.get_audio_url()
-        headers = {}
+        if settings.TRANSCRIPT_AUDIO_REDIRECT:
+            return RedirectResponse(url, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
 
-        copy_headers = ["range", "accept-encoding"]
-        for header in copy_headers:
-            if header in request.headers:
-                headers[header] = request.headers[header]
-
-        async with httpx.AsyncClient() as client:
-            resp = await client.request(request.method, url, headers=headers)
-            return Response(
-                content=resp.content,
-                status_code=resp.status_code,
-                headers=resp.headers,
-            )
+        # proxy S3 file, to prevent issue with CORS
+        return await proxy_response(request, url)
 
     if transcript.audio_deleted:
         raise HTTPException(
@@ -99,7 +94,7 @@ async def transcript_get_audio_waveform(
 ) -> AudioWaveform:
     user_id = user["sub"] if user else None
     transcript = await transcripts_controller.get_by_id_for_http(
-        transcript_id, user_id=user_id
+        transcript_id, user_id=user_id, fields=TranscriptHeader
     )
 
     if not transcript.audio_waveform_filename.exists():
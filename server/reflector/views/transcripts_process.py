@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
 import reflector.auth as auth
-from reflector.db.transcripts import transcripts_controller
+from reflector.db.transcripts import TranscriptHeader, transcripts_controller
 from reflector.services.transcript_process import (
     ProcessError,
     ValidationAlreadyScheduled,
@@ -30,7 +30,7 @@ async def transcript_process(
 ) -> ProcessStatus:
     user_id = user["sub"] if user else None
     transcript = await transcripts_controller.get_by_id_for_http(
-        transcript_id, user_id=user_id
+        transcript_id, user_id=user_id, fields=TranscriptHeader
     )
 
     validation = await validate_transcript_for_processing(transcript)
@@ -3,7 +3,7 @@ from typing import Annotated, Optional
 from fastapi import APIRouter, Depends, HTTPException, Request
 
 import reflector.auth as auth
-from reflector.db.transcripts import transcripts_controller
+from reflector.db.transcripts import TranscriptHeader, transcripts_controller
 
 from .rtc_offer import RtcOffer, rtc_offer_base
 
@@ -19,7 +19,7 @@ async def transcript_record_webrtc(
 ):
     user_id = user["sub"] if user else None
     transcript = await transcripts_controller.get_by_id_for_http(
-        transcript_id, user_id=user_id
+        transcript_id, user_id=user_id, fields=TranscriptHeader
     )
 
     if transcript.locked:
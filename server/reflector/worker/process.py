@@ -33,6 +33,7 @@ from reflector.processors.audio_waveform_processor import AudioWaveformProcessor
 from reflector.redis_cache import RedisAsyncLock
 from reflector.settings import settings
 from reflector.storage import get_transcripts_storage
+from reflector.utils.audio_waveform import open_waveform_reducer
 from reflector.utils.daily import (
     DailyRoomName,
     extract_base_room_name,
@@ -877,11 +878,17 @@ async def convert_audio_and_waveform(transcript) -> None:
         upload_path = transcript.data_path / "upload.webm"
         mp3_path = transcript.audio_mp3_filename
 
-        # Convert WebM to MP3
+        # Convert WebM to MP3, computing the waveform from the decoded frames
+        # when the duration is known upfront
         mp3_writer = AudioFileWriterProcessor(path=mp3_path)
 
         container = av.open(str(upload_path))
+        waveform_reducer = (
+            open_waveform_reducer(container) if container.duration else None
+        )
         for frame in container.decode(audio=0):
+            if waveform_reducer:
+                waveform_reducer.push_frame(frame)
             await mp3_writer.push(frame)
         await mp3_writer.flush()
         container.close()
@@ -892,12 +899,17 @@ async def convert_audio_and_waveform(transcript) -> None:
             mp3_size=mp3_path.stat().st_size,
         )
 
-        waveform_processor = AudioWaveformProcessor(
-            audio_path=mp3_path,
-            waveform_path=transcript.audio_waveform_filename,
-        )
-        waveform_processor.set_pipeline(EmptyPipeline(logger))
-        await waveform_processor.flush()
+        if waveform_reducer:
+            transcript.audio_waveform_filename.parent.mkdir(parents=True, exist_ok=True)
+            with open(transcript.audio_waveform_filename, "w") as fd:
+                json.dump(waveform_reducer.peaks(), fd)
+        else:
+            waveform_processor = AudioWaveformProcessor(
+                audio_path=mp3_path,
+                waveform_path=transcript.audio_waveform_filename,
+            )
+            waveform_processor.set_pipeline(EmptyPipeline(logger))
+            await waveform_processor.flush()
 
         logger.info(
             "Generated waveform",
@@ -6,17 +6,40 @@ This module contains the WebsocketManager class, which is responsible for
 managing websockets and handling websocket connections.
 
 It uses the RedisPubSubManager class to subscribe to Redis channels and
-broadcast messages to all connected websockets.
+broadcast messages to all connected websockets. Each message is decoded once
+and handed as text to a WebsocketSender per websocket, which sends it from
+its own bounded queue.
 """
 
 import asyncio
 import json
+import time
 
 import redis.asyncio as redis
 from fastapi import WebSocket
+from prometheus_client import Counter, Gauge, Histogram
 
 from reflector.settings import settings
 
+SLOW_CONSUMER_POLICIES = ("drop", "disconnect")
+
+# Close code sent to clients disconnected for not keeping up
+WS_CLOSE_SLOW_CONSUMER = 1008
+
+m_ws_queue_depth = Gauge(
+    "websocket_send_queue_depth",
+    "Number of messages waiting in websocket send queues",
+)
+m_ws_send_latency = Histogram(
+    "websocket_send_latency",
+    "Time between a message being queued and sent to a websocket",
+)
+m_ws_slow_consumer = Counter(
+    "websocket_slow_consumer",
+    "Number of messages a websocket could not keep up with",
+    ["policy"],
+)
+
 
 class RedisPubSubManager:
     def __init__(self, host="localhost", port=6379):
@@ -66,11 +89,82 @@ class RedisPubSubManager:
         await self.pubsub.unsubscribe(room_id)
 
 
+class WebsocketSender:
+    """
+    Deliver pre-serialized messages to one websocket.
+
+    Messages are buffered in a bounded queue drained by a dedicated task, so a
+    slow client never delays the others in the room. When the queue is full,
+    the message is dropped or the client disconnected, depending on `policy`.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        queue_size: int,
+        policy: str = "drop",
+    ):
+        if policy not in SLOW_CONSUMER_POLICIES:
+            raise ValueError(f"Unknown slow consumer policy: {policy}")
+        self.websocket = websocket
+        self.policy = policy
+        self.queue: asyncio.Queue[tuple[float, str]] = asyncio.Queue(queue_size)
+        self.task = asyncio.create_task(self._run())
+        self.close_task: asyncio.Task | None = None
+
+    def push(self, text: str) -> None:
+        # the cancelled task may not be done yet when disconnecting
+        if self.task.done() or self.close_task is not None:
+            return
+        try:
+            self.queue.put_nowait((time.monotonic(), text))
+        except asyncio.QueueFull:
+            m_ws_slow_consumer.labels(policy=self.policy).inc()
+            if self.policy == "disconnect":
+                self.close()
+                self.close_task = asyncio.create_task(self._close_websocket())
+            return
+        m_ws_queue_depth.inc()
+
+    def close(self) -> None:
+        self.task.cancel()
+        m_ws_queue_depth.dec(self.queue.qsize())
+        while not self.queue.empty():
+            self.queue.get_nowait()
+
+    async def _close_websocket(self) -> None:
+        try:
+            await self.websocket.close(code=WS_CLOSE_SLOW_CONSUMER)
+        except Exception:
+            pass
+
+    async def _run(self) -> None:
+        while True:
+            enqueued_at, text = await self.queue.get()
+            m_ws_queue_depth.dec()
+            try:
+                await self.websocket.send_text(text)
+            except Exception:
+                # the client is gone, the websocket route will remove it
+                self.close()
+                return
+            m_ws_send_latency.observe(time.monotonic() - enqueued_at)
+
+
 class WebsocketManager:
-    def __init__(self, pubsub_client: RedisPubSubManager = None):
-        self.rooms: dict = {}
-        self.tasks: dict = {}
+    def __init__(
+        self,
+        pubsub_client: RedisPubSubManager = None,
+        queue_size: int | None = None,
+        slow_consumer_policy: str | None = None,
+    ):
+        self.rooms: dict[str, dict[WebSocket, WebsocketSender]] = {}
+        self.tasks: dict[str, asyncio.Task] = {}
         self.pubsub_client = pubsub_client
+        self.queue_size = queue_size or settings.WEBSOCKET_SEND_QUEUE_SIZE
+        self.slow_consumer_policy = (
+            slow_consumer_policy or settings.WEBSOCKET_SLOW_CONSUMER_POLICY
+        )
 
     async def add_user_to_room(
         self, room_id: str, websocket: WebSocket, subprotocol: str | None = None
@@ -80,41 +174,50 @@ class WebsocketManager:
         else:
             await websocket.accept()
 
+        sender = WebsocketSender(
+            websocket, self.queue_size, policy=self.slow_consumer_policy
+        )
         if room_id in self.rooms:
-            self.rooms[room_id].append(websocket)
+            self.rooms[room_id][websocket] = sender
         else:
-            self.rooms[room_id] = [websocket]
+            self.rooms[room_id] = {websocket: sender}
 
             await self.pubsub_client.connect()
             pubsub_subscriber = await self.pubsub_client.subscribe(room_id)
             task = asyncio.create_task(self._pubsub_data_reader(pubsub_subscriber))
-            self.tasks[id(websocket)] = task
+            self.tasks[room_id] = task
 
     async def send_json(self, room_id: str, message: dict) -> None:
         await self.pubsub_client.send_json(room_id, message)
 
     async def remove_user_from_room(self, room_id: str, websocket: WebSocket) -> None:
-        self.rooms[room_id].remove(websocket)
-        task = self.tasks.pop(id(websocket), None)
-        if task:
-            task.cancel()
+        sender = self.rooms[room_id].pop(websocket, None)
+        if sender:
+            sender.close()
 
         if len(self.rooms[room_id]) == 0:
             del self.rooms[room_id]
+            task = self.tasks.pop(room_id, None)
+            if task:
+                task.cancel()
             await self.pubsub_client.unsubscribe(room_id)
 
     async def _pubsub_data_reader(self, pubsub_subscriber):
         while True:
             # timeout=1.0 prevents tight CPU loop when no messages available
             message = await pubsub_subscriber.get_message(
-                ignore_subscribe_messages=True
+                ignore_subscribe_messages=True, timeout=1.0
             )
             if message is not None:
-                room_id = message["channel"].decode("utf-8")
-                all_sockets = self.rooms[room_id]
-                for socket in all_sockets:
-                    data = json.loads(message["data"].decode("utf-8"))
-                    await socket.send_json(data)
+                self.broadcast(
+                    message["channel"].decode("utf-8"),
+                    message["data"].decode("utf-8"),
+                )
+
+    def broadcast(self, room_id: str, text: str) -> None:
+        """Queue an already serialized message for every websocket in the room"""
+        for sender in list(self.rooms.get(room_id, {}).values()):
+            sender.push(text)
 
 
 # Process-global singleton to ensure only one WebsocketManager instance exists.
@@ -0,0 +1,132 @@
+"""Tests for the LLM response cache"""
+
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from reflector.llm import LLM
+from reflector.llm_cache import DiskLLMCache, RedisLLMCache, make_cache_key
+
+
+class CachedResponse(BaseModel):
+    title: str
+
+
+def make_completion_response(text: str):
+    response = MagicMock()
+    response.text = text
+    return response
+
+
+@pytest.fixture
+def disk_cache_settings(test_settings, tmp_path):
+    test_settings.LLM_CACHE_BACKEND = "disk"
+    test_settings.LLM_CACHE_DIR = str(tmp_path / "llm_cache")
+    return test_settings
+
+
+def test_cache_key_depends_on_every_part():
+    base = dict(model="m", prompt="p", texts=["a"], temperature=0.4)
+    key = make_cache_key(**base)
+    assert key == make_cache_key(**dict(reversed(base.items())))
+    for name, value in [
+        ("model", "other"),
+        ("prompt", "other"),
+        ("texts", ["b"]),
+        ("temperature", 0.1),
+    ]:
+        assert make_cache_key(**{**base, name: value}) != key
+
+
+@pytest.mark.asyncio
+async def test_get_response_is_cached(disk_cache_settings):
+    llm = LLM(settings=disk_cache_settings)
+
+    with (
+        patch("reflector.llm.TreeSummarize") as mock_summarize,
+        patch("reflector.llm.Settings"),
+    ):
+        mock_summarize.return_value.aget_response = AsyncMock(return_value=" Hello ")
+
+        assert await llm.get_response("prompt", ["text"]) == "Hello"
+        assert await llm.get_response("prompt", ["text"]) == "Hello"
+        assert mock_summarize.return_value.aget_response.call_count == 1
+
+        # a different input misses the cache
+        await llm.get_response("prompt", ["other text"])
+        assert mock_summarize.return_value.aget_response.call_count == 2
+
+
+def test_cache_key_depends_on_backend_url(test_settings):
+    with patch("reflector.llm.Settings"):
+        test_settings.LLM_URL = "http://backend-a/v1"
+        key = LLM(settings=test_settings)._cache_key("response", prompt="p")
+        test_settings.LLM_URL = "http://backend-b/v1"
+        assert LLM(settings=test_settings)._cache_key("response", prompt="p") != key
+
+
+@pytest.mark.asyncio
+async def test_get_structured_response_is_cached(disk_cache_settings):
+    llm = LLM(settings=disk_cache_settings)
+
+    with (
+        patch("reflector.llm.TreeSummarize") as mock_summarize,
+        patch("reflector.llm.Settings") as mock_settings,
+    ):
+        mock_summarize.return_value.aget_response = AsyncMock(return_value="analysis")
+        mock_settings.llm.acomplete = AsyncMock(
+            return_value=make_completion_response('{"title": "Cached"}')
+        )
+
+        first = await llm.get_structured_response("prompt", ["text"], CachedResponse)
+        second = await llm.get_structured_response("prompt", ["text"], CachedResponse)
+
+        assert first == second == CachedResponse(title="Cached")
+        assert mock_settings.llm.acomplete.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_expires(tmp_path):
+    cache = DiskLLMCache(ttl=60, path=tmp_path)
+    await cache.set("abcdef", "value")
+    assert await cache.get("abcdef", kind="response") == "value"
+
+    entry_path = tmp_path / "ab" / "abcdef.json"
+    entry = json.loads(entry_path.read_text())
+    entry["expires_at"] = time.time() - 1
+    entry_path.write_text(json.dumps(entry))
+
+    assert await cache.get("abcdef", kind="response") is None
+    assert not entry_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_roundtrip():
+    cache = RedisLLMCache(ttl=60, db=2, prefix="test_llm_cache")
+    key = make_cache_key(test="redis_cache_roundtrip", at=time.time())
+    assert await cache.get(key, kind="response") is None
+    await cache.set(key, "value")
+    assert await cache.get(key, kind="response") == "value"
+    # one client serves every call made on the same loop
+    assert cache._client is not None
+    client = cache._client
+    await cache.get(key, kind="response")
+    assert cache._client is client
+
+
+@pytest.mark.asyncio
+async def test_cache_errors_fall_through(test_settings):
+    test_settings.LLM_CACHE_BACKEND = "disk"
+    llm = LLM(settings=test_settings)
+    llm.cache._get = AsyncMock(side_effect=OSError("disk full"))
+    llm.cache._set = AsyncMock(side_effect=OSError("disk full"))
+
+    with (
+        patch("reflector.llm.TreeSummarize") as mock_summarize,
+        patch("reflector.llm.Settings"),
+    ):
+        mock_summarize.return_value.aget_response = AsyncMock(return_value="Hello")
+        assert await llm.get_response("prompt", ["text"]) == "Hello"
@@ -54,3 +54,24 @@ class TestModelAPITranslation:
             assert isinstance(data["text"].get("fr", ""), str)
             assert len(data["text"]["fr"]) > 0
             assert data["text"]["fr"] == "La réunion commencera dans cinq minutes."
+
+    def test_translate_batch(self):
+        url = get_translation_url()
+        headers = get_auth_headers()
+        texts = ["Good morning.", "The meeting will start in five minutes."]
+
+        with httpx.Client(timeout=60.0) as client:
+            response = client.post(
+                f"{url}/translate/batch",
+                json={
+                    "texts": texts,
+                    "source_language": "en",
+                    "target_language": "fr",
+                },
+                headers=headers,
+            )
+
+            assert response.status_code == 200, f"Request failed: {response.text}"
+            translations = response.json()["translations"]
+            assert len(translations) == len(texts)
+            assert translations[1] == "La réunion commencera dans cinq minutes."
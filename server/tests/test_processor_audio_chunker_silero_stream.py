@@ -0,0 +1,80 @@
+import av
+import numpy as np
+import pytest
+
+pytest.importorskip("silero_vad")
+
+from reflector.processors.audio_chunker_silero_stream import (  # noqa: E402
+    AudioChunkerSileroStreamProcessor,
+    SileroVADStream,
+)
+
+
+class FakeVADIterator:
+    """Report a speech event for every window whose first sample is positive"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, chunk, return_seconds=False):
+        self.calls += 1
+        if chunk[0] > 0:
+            return {"start": 0}
+        return None
+
+    def reset_states(self):
+        pass
+
+
+def make_signal(pattern, window_size=512):
+    return np.concatenate(
+        [np.full(window_size, 0.5 if x else 0.0, dtype=np.float32) for x in pattern]
+    )
+
+
+@pytest.mark.parametrize("piece_size", [100, 320, 512, 1024, 4096])
+def test_vad_stream_matches_whole_buffer_regardless_of_piece_size(piece_size):
+    signal = make_signal([0, 1, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0])
+    vad = FakeVADIterator()
+    stream = SileroVADStream(vad)
+
+    ends = []
+    for i in range(0, len(signal), piece_size):
+        ends += stream.push(signal[i : i + piece_size])
+
+    # speech ends at the first silent window after each speech run
+    assert ends == [3 * 512, 8 * 512]
+    # every window is analysed exactly once
+    assert vad.calls == len(signal) // 512
+
+
+def make_frame(value: int, pts: int, samples=320):
+    frame = av.AudioFrame.from_ndarray(
+        np.full((1, samples), value, dtype=np.int16), format="s16", layout="mono"
+    )
+    frame.sample_rate = 16000
+    frame.pts = pts
+    return frame
+
+
+@pytest.mark.asyncio
+async def test_silero_stream_processor_emits_speech_chunk():
+    processor = AudioChunkerSileroStreamProcessor(min_frames=1)
+    processor.vad_stream = SileroVADStream(FakeVADIterator())
+
+    chunks = []
+
+    async def capture(data):
+        chunks.append(data)
+
+    processor.on(capture)
+
+    values = [16000] * 16 + [0] * 16
+    for i, value in enumerate(values):
+        await processor.push(make_frame(value, i * 320))
+
+    assert len(chunks) == 1
+    # speech covers 16 frames (10 windows), the chunk ends on the last frame
+    # finishing before the first silent window
+    assert len(chunks[0]) == 16
+    assert processor.frames_start == 16 * 320
@@ -139,3 +139,159 @@ async def test_processors_audio_diarization(name, diarization, expected):
         assert topics[0].transcript.words[1].speaker == expected[1]
         assert topics[1].transcript.words[0].speaker == expected[2]
         assert topics[1].transcript.words[1].speaker == expected[3]
+
+
+def test_remove_segment_without_words_matches_word_scan():
+    import random
+
+    from reflector.processors.audio_diarization import AudioDiarizationProcessor
+    from reflector.processors.types import Word
+
+    rng = random.Random(0)
+    words = []
+    for _ in range(200):
+        start = round(rng.uniform(0, 100), 1)
+        words.append(Word(text="w", start=start, end=start + rng.choice([0, 0.3])))
+    diarization = []
+    for _ in range(100):
+        start = round(rng.uniform(0, 100), 1)
+        diarization.append(
+            {"start": start, "end": start + rng.choice([0.1, 1, 5]), "speaker": 0}
+        )
+
+    expected = [
+        d
+        for d in diarization
+        if any(
+            d["start"] <= w.start < d["end"] or d["start"] < w.end <= d["end"]
+            for w in words
+        )
+    ]
+    AudioDiarizationProcessor._diarization_remove_segment_without_words(
+        words, diarization
+    )
+    assert diarization == expected
+
+
+def reference_assign_speaker(words, diarization):
+    """The words x segments scan that assign_speaker replaced"""
+    from reflector.processors.audio_diarization import AudioDiarizationProcessor
+
+    diarization = [dict(d) for d in diarization]
+
+    i = 0
+    while i < len(diarization) - 1:
+        d, dnext = diarization[i], diarization[i + 1]
+        if d["end"] > dnext["start"]:
+            if d["end"] - d["start"] > dnext["end"] - dnext["start"]:
+                diarization.pop(i + 1)
+            else:
+                diarization.pop(i)
+        else:
+            i += 1
+
+    diarization = [
+        d
+        for d in diarization
+        if any(
+            d["start"] <= w.start < d["end"] or d["start"] < w.end <= d["end"]
+            for w in words
+        )
+    ]
+
+    i = 0
+    while i < len(diarization) - 1:
+        if diarization[i]["speaker"] == diarization[i + 1]["speaker"]:
+            diarization[i]["end"] = diarization[i + 1]["end"]
+            diarization.pop(i + 1)
+        else:
+            i += 1
+
+    word_idx = 0
+    last_speaker = 0
+    for d in diarization:
+        for word in words[word_idx:]:
+            if word.start >= d["start"]:
+                break
+            is_continuation = False
+            if 0 < word_idx < len(words) - 1:
+                is_continuation = AudioDiarizationProcessor.is_word_continuation(
+                    words[word_idx - 1], word
+                )
+            if is_continuation:
+                word.speaker = last_speaker
+            else:
+                word.speaker = last_speaker = d["speaker"]
+            word_idx += 1
+        for word in words[word_idx:]:
+            if d["start"] <= word.start < d["end"]:
+                word.speaker = last_speaker = d["speaker"]
+                word_idx += 1
+            elif word.start > d["end"]:
+                break
+    for word in words[word_idx:]:
+        word.speaker = last_speaker
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_assign_speaker_matches_reference(seed):
+    import random
+
+    from reflector.processors.audio_diarization import AudioDiarizationProcessor
+    from reflector.processors.types import Word
+
+    rng = random.Random(seed)
+    starts = sorted(round(rng.uniform(0, 60), 1) for _ in range(80))
+    words = [
+        Word(
+            text=rng.choice(["so", "we", "Okay.", "right?", "ship"]),
+            start=start,
+            end=start + rng.choice([0.1, 0.3, 0.8]),
+        )
+        for start in starts
+    ]
+    diarization = sorted(
+        (
+            {"start": start, "end": start + rng.choice([0.5, 2, 8]), "speaker": s}
+            for start, s in (
+                (round(rng.uniform(0, 60), 1), rng.randrange(3)) for _ in range(25)
+            )
+        ),
+        key=lambda d: d["start"],
+    )
+
+    expected = [word.model_copy() for word in words]
+    reference_assign_speaker(expected, diarization)
+    AudioDiarizationProcessor.assign_speaker(words, diarization)
+
+    assert [word.speaker for word in words] == [word.speaker for word in expected]
+
+
+def test_assign_speaker_visits_words_linearly():
+    from reflector.processors.audio_diarization import AudioDiarizationProcessor
+    from reflector.tools.benchmark_speaker_assignment import (
+        make_synthetic_transcript,
+    )
+
+    class CountingList(list):
+        reads = 0
+
+        def __getitem__(self, key):
+            if isinstance(key, slice):
+                self.reads += len(range(*key.indices(len(self))))
+            else:
+                self.reads += 1
+            return super().__getitem__(key)
+
+        def __iter__(self):
+            for word in super().__iter__():
+                self.reads += 1
+                yield word
+
+    words, diarization = make_synthetic_transcript(hours=1)
+    words = CountingList(words)
+    AudioDiarizationProcessor.assign_speaker(words, diarization)
+
+    # the words x segments scan read every word once per segment
+    assert words.reads < 5 * len(words)
+    assert all(word.speaker is not None for word in words)
@@ -0,0 +1,60 @@
+from fractions import Fraction
+from unittest.mock import patch
+
+import av
+import numpy as np
+import pytest
+
+from reflector.processors.audio_downscale import AudioDownscaleProcessor
+
+
+def make_frame(sample_rate: int, layout: str, samples: int = 960) -> av.AudioFrame:
+    channels = 2 if layout == "stereo" else 1
+    data = np.zeros((1, samples * channels), dtype=np.int16)
+    frame = av.AudioFrame.from_ndarray(data, format="s16", layout=layout)
+    frame.sample_rate = sample_rate
+    frame.pts = 0
+    frame.time_base = Fraction(1, sample_rate)
+    return frame
+
+
+@pytest.mark.asyncio
+async def test_audio_downscale_passes_matching_frames_through():
+    outputs = []
+
+    async def on_output(frame):
+        outputs.append(frame)
+
+    processor = AudioDownscaleProcessor(callback=on_output)
+    frames = [make_frame(16000, "mono") for _ in range(3)]
+    with patch("reflector.processors.audio_downscale.AudioResampler") as resampler:
+        for frame in frames:
+            await processor.push(frame)
+        await processor.flush()
+
+    resampler.assert_not_called()
+    assert not processor.needs_resampling
+    assert len(outputs) == 3
+    assert all(output is frame for output, frame in zip(outputs, frames))
+
+
+@pytest.mark.asyncio
+async def test_audio_downscale_resamples_other_frames():
+    outputs = []
+
+    async def on_output(frame):
+        outputs.append(frame)
+
+    processor = AudioDownscaleProcessor(callback=on_output)
+    for _ in range(5):
+        await processor.push(make_frame(48000, "stereo"))
+    await processor.flush()
+
+    assert processor.needs_resampling
+    assert outputs
+    for frame in outputs:
+        assert frame.sample_rate == 16000
+        assert frame.layout.name == "mono"
+        assert frame.format.name == "s16"
+    # 5 frames of 960 samples at 48kHz are 1600 samples at 16kHz
+    assert sum(frame.samples for frame in outputs) == 1600
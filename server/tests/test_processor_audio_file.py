@@ -0,0 +1,125 @@
+import io
+import wave
+from fractions import Fraction
+
+import av
+import numpy as np
+import pytest
+
+from reflector.processors.audio_merge import AudioMergeProcessor
+from reflector.processors.types import AudioFile
+
+
+def make_wav(samples: np.ndarray, sample_rate: int = 16000) -> bytes:
+    fd = io.BytesIO()
+    with wave.open(fd, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(samples.astype("<i2").tobytes())
+    return fd.getvalue()
+
+
+def test_audio_file_memory_backed_path_is_cached_and_released():
+    samples = np.arange(100, dtype=np.int16)
+    audiofile = AudioFile(
+        fd=io.BytesIO(make_wav(samples)),
+        name="chunk.wav",
+        sample_rate=16000,
+        channels=1,
+        sample_width=2,
+    )
+
+    path = audiofile.path
+    assert audiofile.path == path
+    assert path.read_bytes() == make_wav(samples)
+    np.testing.assert_array_equal(audiofile.samples()[:, 0], samples)
+
+    audiofile.release()
+    assert not path.exists()
+
+
+def test_audio_file_temporary_path_is_removed_when_collected(tmp_path):
+    samples = np.arange(100, dtype=np.int16)
+    path = tmp_path / "chunk.wav"
+    path.write_bytes(make_wav(samples))
+
+    audiofile = AudioFile.from_temporary_path(
+        path, name="chunk.wav", sample_rate=16000, channels=1, sample_width=2
+    )
+    assert audiofile.path == path
+    assert audiofile.fd.read() == make_wav(samples)
+    np.testing.assert_array_equal(audiofile.samples()[:, 0], samples)
+
+    audiofile.release()
+    del audiofile
+    assert not path.exists()
+
+
+def test_audio_file_requires_a_source():
+    with pytest.raises(ValueError):
+        AudioFile(name="chunk.wav", sample_rate=16000, channels=1, sample_width=2)
+
+
+@pytest.mark.asyncio
+async def test_audio_merge_writes_frames_to_file():
+    frames = []
+    for i in range(3):
+        samples = np.full((1, 160), i, dtype=np.int16)
+        frame = av.AudioFrame.from_ndarray(samples, format="s16", layout="mono")
+        frame.sample_rate = 16000
+        frame.pts = i * 160
+        frame.time_base = Fraction(1, 16000)
+        frames.append(frame)
+
+    outputs = []
+
+    async def on_output(audiofile):
+        outputs.append(audiofile)
+
+    await AudioMergeProcessor(callback=on_output).push(frames)
+
+    assert len(outputs) == 1
+    audiofile = outputs[0]
+    assert audiofile.sample_rate == 16000
+    np.testing.assert_array_equal(
+        audiofile.samples()[:, 0], np.repeat(np.arange(3, dtype=np.int16), 160)
+    )
+    path = audiofile.path
+    audiofile.release()
+    assert not path.exists()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("layout", ["mono", "stereo"])
+async def test_audio_merge_converts_planar_float_frames(layout):
+    channels = 2 if layout == "stereo" else 1
+    frames = []
+    for i in range(3):
+        samples = np.full((channels, 160), 0.25 * (i + 1), dtype=np.float32)
+        frame = av.AudioFrame.from_ndarray(samples, format="fltp", layout=layout)
+        frame.sample_rate = 16000
+        frame.pts = i * 160
+        frame.time_base = Fraction(1, 16000)
+        frames.append(frame)
+
+    outputs = []
+
+    async def on_output(audiofile):
+        outputs.append(audiofile)
+
+    await AudioMergeProcessor(callback=on_output).push(frames)
+
+    audiofile = outputs[0]
+    assert audiofile.sample_width == 2
+    assert audiofile.channels == channels
+    with wave.open(str(audiofile.path), "rb") as wav:
+        assert wav.getsampwidth() == 2
+        assert wav.getnchannels() == channels
+        assert wav.getnframes() == 480
+    samples = audiofile.samples()
+    assert samples.shape == (480, channels)
+    expected = np.repeat(np.array([8192, 16384, 24576], dtype=np.int16), 160)
+    for channel in range(channels):
+        np.testing.assert_allclose(samples[:, channel], expected, atol=1)
+    audiofile.release()
@@ -0,0 +1,40 @@
+import pytest
+from prometheus_client import REGISTRY
+
+from reflector.processors.http_client import HttpClientPool
+
+
+@pytest.mark.asyncio
+async def test_http_client_pool_shares_clients_per_host():
+    pool = HttpClientPool()
+
+    client = pool.get("https://model.example.com/v1")
+    assert pool.get("https://model.example.com/translate") is client
+    assert pool.get("https://other.example.com/v1") is not client
+
+    await pool.close()
+    assert client.is_closed
+    assert pool.get("https://model.example.com/v1") is not client
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_http_client_pool_counts_requests(httpx_mock):
+    httpx_mock.add_response(json={"text": {}}, is_reusable=True)
+    pool = HttpClientPool()
+
+    def requests_sent():
+        return (
+            REGISTRY.get_sample_value(
+                "model_http_requests_total", {"host": "pool.example.com"}
+            )
+            or 0
+        )
+
+    before = requests_sent()
+    client = pool.get("https://pool.example.com")
+    await client.post("https://pool.example.com/translate")
+    await client.post("https://pool.example.com/translate")
+    assert requests_sent() - before == 2
+
+    await pool.close()
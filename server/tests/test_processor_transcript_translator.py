@@ -0,0 +1,109 @@
+import asyncio
+import json
+
+import pytest
+
+from reflector.processors.base import Pipeline
+from reflector.processors.transcript_translator_modal import (
+    TranscriptTranslatorModalProcessor,
+    TranslationBatcher,
+)
+from reflector.settings import settings
+
+
+@pytest.mark.asyncio
+async def test_translation_batcher_flushes_on_size_and_delay():
+    batches = []
+
+    async def send_batch(texts, source_language, target_language):
+        batches.append(texts)
+        return [f"{target_language}:{text}" for text in texts]
+
+    batcher = TranslationBatcher(send_batch, max_size=2, max_delay=0.01)
+    results = await asyncio.gather(
+        *(batcher.translate(text, "en", "fr") for text in ("a", "b", "c"))
+    )
+
+    assert results == ["fr:a", "fr:b", "fr:c"]
+    assert batches == [["a", "b"], ["c"]]
+
+
+@pytest.mark.asyncio
+async def test_translation_batcher_propagates_errors():
+    async def send_batch(texts, source_language, target_language):
+        raise RuntimeError("boom")
+
+    batcher = TranslationBatcher(send_batch, max_size=4, max_delay=0.01)
+    with pytest.raises(RuntimeError):
+        await batcher.translate("a", "en", "fr")
+
+
+@pytest.mark.asyncio
+async def test_translation_batcher_keeps_and_drains_batch_tasks():
+    release = asyncio.Event()
+
+    async def send_batch(texts, source_language, target_language):
+        await release.wait()
+        return [text.upper() for text in texts]
+
+    batcher = TranslationBatcher(send_batch, max_size=1, max_delay=10)
+    pending = asyncio.ensure_future(batcher.translate("a", "en", "fr"))
+    await asyncio.sleep(0)
+    assert len(batcher._tasks) == 1
+
+    release.set()
+    await batcher.close()
+    assert not batcher._tasks
+    assert await pending == "A"
+
+
+@pytest.mark.asyncio
+async def test_modal_translator_falls_back_without_batch_endpoint(
+    httpx_mock, monkeypatch
+):
+    monkeypatch.setattr(settings, "TRANSLATE_URL", "https://translate.example.com")
+    httpx_mock.add_response(
+        url="https://translate.example.com/translate/batch", status_code=404
+    )
+    httpx_mock.add_response(
+        json={"text": {"en": "hello", "fr": "bonjour"}}, is_reusable=True
+    )
+
+    processor = TranscriptTranslatorModalProcessor()
+    Pipeline(processor).set_pref("audio:target_language", "fr")
+    assert await processor._translate("hello") == "bonjour"
+    assert not processor.batch_supported
+    assert await processor._translate("hello") == "bonjour"
+
+    requests = httpx_mock.get_requests()
+    assert [request.url.path for request in requests] == [
+        "/translate/batch",
+        "/translate",
+        "/translate",
+    ]
+    assert json.loads(requests[0].content)["texts"] == ["hello"]
+
+
+@pytest.mark.asyncio
+async def test_modal_translator_falls_back_on_batch_server_error(
+    httpx_mock, monkeypatch
+):
+    monkeypatch.setattr(settings, "TRANSLATE_URL", "https://translate.example.com")
+    httpx_mock.add_response(
+        url="https://translate.example.com/translate/batch", status_code=500
+    )
+    httpx_mock.add_response(
+        json={"text": {"en": "hello", "fr": "bonjour"}}, is_reusable=True
+    )
+
+    processor = TranscriptTranslatorModalProcessor()
+    Pipeline(processor).set_pref("audio:target_language", "fr")
+    assert await processor._translate("hello") == "bonjour"
+    # a server error is not taken as a missing endpoint
+    assert processor.batch_supported
+
+    requests = httpx_mock.get_requests()
+    assert [request.url.path for request in requests] == [
+        "/translate/batch",
+        "/translate",
+    ]
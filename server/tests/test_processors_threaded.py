@@ -0,0 +1,90 @@
+import asyncio
+import random
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_processor_pool_emits_in_push_order():
+    from reflector.processors.base import Pipeline, Processor
+
+    class SlowProcessor(Processor):
+        INPUT_TYPE = int
+        OUTPUT_TYPE = int
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.running = 0
+            self.max_running = 0
+
+        async def _push(self, data):
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            await asyncio.sleep(random.uniform(0, 0.01))
+            self.running -= 1
+            if data % 3:
+                await self.emit(data)
+
+    outputs = []
+
+    async def on_output(data):
+        outputs.append(data)
+
+    pool = SlowProcessor.as_pool(max_workers=4, callback=on_output)
+    pipeline = Pipeline(pool)
+    for i in range(30):
+        await pipeline.push(i)
+    await pipeline.flush()
+
+    assert outputs == [i for i in range(30) if i % 3]
+    assert pool.processor.max_running > 1
+
+
+@pytest.mark.asyncio
+async def test_processor_pool_continues_after_error():
+    from reflector.processors.base import Pipeline, Processor
+
+    class FailingProcessor(Processor):
+        INPUT_TYPE = int
+        OUTPUT_TYPE = int
+
+        async def _push(self, data):
+            await asyncio.sleep(0.01 if data == 0 else 0)
+            if data == 1:
+                raise ValueError("boom")
+            await self.emit(data)
+
+    outputs = []
+
+    async def on_output(data):
+        outputs.append(data)
+
+    pipeline = Pipeline(FailingProcessor.as_pool(max_workers=2, callback=on_output))
+    for i in range(4):
+        await pipeline.push(i)
+    await pipeline.flush()
+
+    assert outputs == [0, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_processor_run_in_executor():
+    from reflector.processors.base import Processor
+
+    class BlockingProcessor(Processor):
+        INPUT_TYPE = int
+        OUTPUT_TYPE = int
+
+        async def _push(self, data):
+            await self.emit(await self.run_in_executor(pow, data, 2))
+
+    outputs = []
+
+    async def on_output(data):
+        outputs.append(data)
+
+    processor = BlockingProcessor.as_threaded(callback=on_output)
+    await processor.push(3)
+    await processor.flush()
+
+    assert outputs == [9]
@@ -14,6 +14,7 @@ from reflector.db.search import (
     search_controller,
 )
 from reflector.db.transcripts import SourceKind, transcripts
+from reflector.settings import settings
 
 
 @pytest.mark.asyncio
@@ -152,6 +153,137 @@ Basic meeting content without special keywords.""",
         await get_database().disconnect()
 
 
+@pytest.mark.asyncio
+async def test_transcript_queries_leave_out_search_text():
+    from reflector.db.transcripts import (
+        Transcript,
+        TranscriptController,
+        transcripts_controller,
+    )
+
+    query = await transcripts_controller.get_all(return_query=True)
+    assert "search_text" not in query.selected_columns.keys()
+    assert "webvtt" in query.selected_columns.keys()
+
+    query = TranscriptController._select(Transcript)
+    assert "search_text" not in query.selected_columns.keys()
+    assert "webvtt" in query.selected_columns.keys()
+
+
+@pytest.mark.asyncio
+async def test_search_with_database_snippets():
+    """Test snippets and match counts computed by PostgreSQL."""
+    test_id = "test-db-snippets-5c7e1f0a"
+
+    try:
+        await get_database().execute(
+            transcripts.delete().where(transcripts.c.id == test_id)
+        )
+
+        test_data = {
+            "id": test_id,
+            "name": "Test Database Snippets",
+            "title": "Regular Meeting",
+            "status": "ended",
+            "locked": False,
+            "duration": 1800.0,
+            "created_at": datetime.now(timezone.utc),
+            "short_summary": "Brief overview",
+            "long_summary": "Detailed discussion about telescope calibration",
+            "topics": json.dumps([]),
+            "events": json.dumps([]),
+            "participants": json.dumps([]),
+            "source_language": "en",
+            "target_language": "en",
+            "reviewed": False,
+            "audio_location": "local",
+            "share_mode": "private",
+            "source_kind": "room",
+            "webvtt": """WEBVTT
+
+00:00:00.000 --> 00:00:10.000
+<v Speaker0>The telescope arrived yesterday.
+
+00:00:10.000 --> 00:00:20.000
+<v Speaker1>Who ordered a second telescope?""",
+            "user_id": "test-user-db-snippets",
+        }
+
+        await get_database().execute(transcripts.insert().values(**test_data))
+
+        with patch.object(settings, "SEARCH_SNIPPETS_BACKEND", "database"):
+            params = SearchParameters(
+                query_text="telescope", user_id="test-user-db-snippets"
+            )
+            results, total = await search_controller.search_transcripts(params)
+
+        assert total >= 1
+        test_result = next((r for r in results if r.id == test_id), None)
+        assert test_result
+        assert test_result.total_match_count == 3
+        assert "telescope calibration" in test_result.search_snippets[0]
+        assert all("telescope" in s.lower() for s in test_result.search_snippets)
+        assert not any("-->" in s or "<v" in s for s in test_result.search_snippets)
+
+    finally:
+        await get_database().execute(
+            transcripts.delete().where(transcripts.c.id == test_id)
+        )
+        await get_database().disconnect()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", ["python", "database"])
+async def test_search_keyset_pages(backend):
+    """Cursor pages cover the offset results, in the same order."""
+    user_id = "test-user-keyset"
+    created_at = datetime.now(timezone.utc)
+    for i in range(5):
+        await get_database().execute(
+            transcripts.insert().values(
+                id=f"test-keyset-{i}",
+                name=f"Keyset {i}",
+                # two ranks, and transcripts sharing created_at in each
+                title="Budget" if i % 2 else "Budget budget review",
+                status="ended",
+                locked=False,
+                duration=60.0,
+                created_at=created_at.replace(microsecond=i // 2),
+                topics=json.dumps([]),
+                events=json.dumps([]),
+                participants=json.dumps([]),
+                source_language="en",
+                target_language="en",
+                reviewed=False,
+                audio_location="local",
+                share_mode="private",
+                source_kind="room",
+                user_id=user_id,
+            )
+        )
+
+    with patch.object(settings, "SEARCH_SNIPPETS_BACKEND", backend):
+        for query_text in ("budget", None):
+            params = SearchParameters(query_text=query_text, user_id=user_id, limit=5)
+            expected, _ = await search_controller.search_transcripts(params)
+
+            ids = []
+            cursor = None
+            while True:
+                params = SearchParameters(
+                    query_text=query_text, user_id=user_id, limit=2, cursor=cursor
+                )
+                page = await search_controller.search_transcripts_page(params)
+                results, total, cursor = page
+                assert total == 5
+                ids += [r.id for r in results]
+                if cursor is None:
+                    break
+
+            assert ids == [r.id for r in expected]
+            assert len(set(ids)) == 5
+
+
 @pytest.mark.asyncio
 async def test_postgresql_search_with_data():
     test_id = "test-search-e2e-7f3a9b2c"
@@ -272,8 +404,9 @@ def mock_db_result():
         "user_id": "test-user",
         "room_id": "room1",
         "source_kind": SourceKind.LIVE,
-        "webvtt": "WEBVTT\n\n00:00:00.000 --> 00:00:05.000\nThis is a test transcript",
+        "search_text": "This is a test transcript",
         "rank": 0.95,
+        "total": 1,
     }
 
 
@@ -3,6 +3,8 @@
 import pytest
 
 from reflector.db.search import (
+    HEADLINE_FRAGMENT_DELIMITER,
+    DatabaseSnippets,
     SnippetCandidate,
     SnippetGenerator,
     WebVTTProcessor,
@@ -532,3 +534,37 @@ data visualization and data storage"""
         snippets = SnippetGenerator.generate(text, "café")
         assert len(snippets) > 0
         assert "café" in snippets[0]
+
+    def test_combine_texts_matches_combine_sources(self):
+        """Test that the extracted-text path gives the same result as WebVTT."""
+        summary = "data science uses data analysis and data mining techniques"
+        webvtt = """WEBVTT
+
+00:00:00.000 --> 00:00:02.000
+<v Speaker0>Big data processing
+
+00:00:02.000 --> 00:00:04.000
+<v Speaker1>data visualization and data storage"""
+
+        assert SnippetGenerator.combine_texts(
+            summary, WebVTTProcessor.extract_text(webvtt), "data", max_total=3
+        ) == SnippetGenerator.combine_sources(summary, webvtt, "data", max_total=3)
+
+
+class TestDatabaseSnippets:
+    """Test assembling snippets from ts_headline output."""
+
+    def test_split_headline(self):
+        headline = HEADLINE_FRAGMENT_DELIMITER.join(["first match", " second match "])
+        assert DatabaseSnippets.split(headline) == ["first match", "second match"]
+        assert DatabaseSnippets.split(None) == []
+        assert DatabaseSnippets.split("") == []
+
+    def test_combine_prioritizes_summary(self):
+        summary = HEADLINE_FRAGMENT_DELIMITER.join(["s1", "s2"])
+        transcript = HEADLINE_FRAGMENT_DELIMITER.join(["t1", "t2", "t3"])
+
+        assert DatabaseSnippets.combine(summary, transcript, 3) == ["s1", "s2", "t1"]
+        assert DatabaseSnippets.combine(summary, transcript, 2) == ["s1", "s2"]
+        assert DatabaseSnippets.combine(None, transcript, 3) == ["t1", "t2", "t3"]
+        assert DatabaseSnippets.combine(None, None, 3) == []
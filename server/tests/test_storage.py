@@ -367,3 +367,118 @@ async def test_aws_storage_none_endpoint_url():
     assert storage.base_url == "https://reflector-bucket.s3.amazonaws.com/"
     # No s3 addressing_style override — boto_config should only have retries
     assert not hasattr(storage.boto_config, "s3") or storage.boto_config.s3 is None
+
+
+def make_mock_client():
+    mock_client = AsyncMock()
+    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+    mock_client.__aexit__ = AsyncMock(return_value=None)
+    mock_client.generate_presigned_url = AsyncMock(return_value="http://url")
+    return mock_client
+
+
+@pytest.mark.asyncio
+async def test_aws_storage_reuses_pooled_client():
+    """Test that consecutive operations share one long-lived client."""
+    storage = AwsStorage(
+        aws_bucket_name="test-bucket",
+        aws_region="us-east-1",
+        aws_access_key_id="pool-key",
+        aws_secret_access_key="pool-secret",
+    )
+    mock_client = make_mock_client()
+
+    with patch.object(
+        storage.session, "client", return_value=mock_client
+    ) as mock_session_client:
+        await storage.put_file("a.txt", b"data")
+        await storage.delete_file("a.txt")
+        await storage.get_file_url("b.txt")
+
+        assert mock_session_client.call_count == 1
+        mock_client.__aenter__.assert_called_once()
+        mock_client.__aexit__.assert_not_called()
+
+        await AwsStorage.close_clients()
+        mock_client.__aexit__.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_aws_storage_put_file_stream_from_async_iterator():
+    """Test that async iterators are uploaded through a file-like adapter."""
+    storage = AwsStorage(
+        aws_bucket_name="test-bucket/folder",
+        aws_region="us-east-1",
+        aws_access_key_id="stream-key",
+        aws_secret_access_key="stream-secret",
+        aws_multipart_part_size=5 * 1024 * 1024,
+    )
+    uploaded = {}
+
+    async def mock_upload(fileobj, Bucket, Key, Config):
+        uploaded["data"] = await fileobj.read(3) + await fileobj.read()
+        uploaded["key"] = Key
+        uploaded["part_size"] = Config.multipart_chunksize
+        uploaded["concurrency"] = Config.max_request_concurrency
+
+    mock_client = make_mock_client()
+    mock_client.upload_fileobj = AsyncMock(side_effect=mock_upload)
+
+    async def chunks():
+        for chunk in (b"ab", b"cd", b"ef"):
+            yield chunk
+
+    with patch.object(storage.session, "client", return_value=mock_client):
+        result = await storage.put_file_stream("file.bin", chunks(), concurrency=8)
+
+    assert result.filename == "file.bin"
+    assert uploaded == {
+        "data": b"abcdef",
+        "key": "folder/file.bin",
+        "part_size": 5 * 1024 * 1024,
+        "concurrency": 8,
+    }
+
+
+@pytest.mark.asyncio
+async def test_aws_storage_put_file_stream_from_path(tmp_path):
+    """Test that paths are opened and streamed, not read into memory first."""
+    storage = AwsStorage(
+        aws_bucket_name="test-bucket",
+        aws_region="us-east-1",
+        aws_access_key_id="path-key",
+        aws_secret_access_key="path-secret",
+    )
+    path = tmp_path / "audio.mp3"
+    path.write_bytes(b"mp3data")
+    uploaded = {}
+
+    async def mock_upload(fileobj, Bucket, Key, Config):
+        uploaded["data"] = fileobj.read()
+
+    mock_client = make_mock_client()
+    mock_client.upload_fileobj = AsyncMock(side_effect=mock_upload)
+
+    with patch.object(storage.session, "client", return_value=mock_client):
+        await storage.put_file_stream("audio.mp3", path)
+
+    assert uploaded["data"] == b"mp3data"
+
+
+@pytest.mark.asyncio
+async def test_storage_base_class_put_file_stream_fallback():
+    """Test that backends without streaming support receive a file object."""
+    from reflector.storage.base import Storage
+
+    received = {}
+
+    class MemoryStorage(Storage):
+        async def _put_file(self, filename, data, *, bucket=None):
+            received[filename] = data.read()
+
+    async def chunks():
+        yield b"hello "
+        yield b"world"
+
+    await MemoryStorage().put_file_stream("f.txt", chunks())
+    assert received["f.txt"] == b"hello world"
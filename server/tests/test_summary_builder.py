@@ -0,0 +1,78 @@
+"""Tests for SummaryBuilder concurrent scheduling"""
+
+import asyncio
+import random
+import time
+
+import pytest
+
+from reflector.llm_limiter import LLMCallLimiter
+from reflector.processors.summary.models import ActionItemsResponse
+from reflector.processors.summary.summary_builder import (
+    SubjectsResponse,
+    SummaryBuilder,
+)
+
+
+class FakeLLM:
+    model_name = "fake"
+
+    def __init__(self, subjects):
+        self.subjects = subjects
+        self.running = 0
+        self.max_running = 0
+
+    async def _call(self):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        # random latency so completion order differs from subject order
+        await asyncio.sleep(random.uniform(0.001, 0.02))
+        self.running -= 1
+
+    async def get_response(self, prompt, texts, tone_name=None):
+        await self._call()
+        if tone_name == "Topic assistant":
+            return f"details: {prompt.split(chr(10))[0]}"
+        if tone_name == "Topic summarizer":
+            return f"summary of {texts[0]}"
+        return "recap"
+
+    async def get_structured_response(
+        self, prompt, texts, output_cls, tone_name=None, timeout=None
+    ):
+        await self._call()
+        if output_cls is SubjectsResponse:
+            return SubjectsResponse(subjects=self.subjects)
+        return ActionItemsResponse(decisions=[], next_steps=[])
+
+
+@pytest.mark.asyncio
+async def test_subject_summaries_run_concurrently_in_subject_order():
+    subjects = [f"subject {i}" for i in range(6)]
+    llm = FakeLLM(subjects)
+    builder = SummaryBuilder(llm, concurrency=3)
+    builder.set_transcript("speaker: hello")
+
+    await builder.generate_summary()
+
+    assert [s["subject"] for s in builder.summaries] == subjects
+    for summary in builder.summaries:
+        assert summary["subject"] in summary["summary"]
+    assert builder.recap == "recap"
+    assert builder.action_items is not None
+    assert 1 < llm.max_running <= 3
+
+
+@pytest.mark.asyncio
+async def test_limiter_spaces_call_starts():
+    limiter = LLMCallLimiter(concurrency=10, rate_limit=50)
+    starts = []
+
+    async def call():
+        async with limiter:
+            starts.append(time.monotonic())
+
+    await asyncio.gather(*[call() for _ in range(5)])
+
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert all(gap >= 0.015 for gap in gaps)
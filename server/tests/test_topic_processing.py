@@ -0,0 +1,90 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+import structlog
+
+from reflector.pipelines.topic_processing import (
+    EmptyPipeline,
+    detect_topics,
+    group_topic_chunks,
+)
+from reflector.processors.types import TitleSummary, Transcript, Word
+from reflector.utils.transcript_constants import TOPIC_CHUNK_WORD_COUNT
+
+
+def make_transcript(chunks: int) -> Transcript:
+    words = [
+        Word(text=" word", start=i * 0.5, end=i * 0.5 + 0.4, speaker=0)
+        for i in range(chunks * TOPIC_CHUNK_WORD_COUNT)
+    ]
+    return Transcript(words=words)
+
+
+def test_group_topic_chunks_joins_short_chunks():
+    transcript = make_transcript(5)
+    chunk_length = TOPIC_CHUNK_WORD_COUNT * len(" word")
+
+    groups = group_topic_chunks(transcript, min_transcript_length=chunk_length)
+    assert [len(group.words) for group in groups] == [
+        2 * TOPIC_CHUNK_WORD_COUNT,
+        2 * TOPIC_CHUNK_WORD_COUNT,
+        TOPIC_CHUNK_WORD_COUNT,
+    ]
+    assert groups[1].timestamp == transcript.words[2 * TOPIC_CHUNK_WORD_COUNT].start
+
+
+@pytest.mark.asyncio
+async def test_detect_topics_concurrently_in_order():
+    running = 0
+    max_running = 0
+
+    class FakeTopicDetector:
+        def __init__(self, callback=None):
+            self.callback = callback
+            self.transcript = None
+
+        def set_pipeline(self, pipeline):
+            pass
+
+        async def push(self, data):
+            self.transcript = data
+
+        async def flush(self):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            # later chunks finish first
+            await asyncio.sleep(0.05 / (1 + self.transcript.timestamp))
+            running -= 1
+            await self.callback(
+                TitleSummary(
+                    title=f"topic at {self.transcript.timestamp}",
+                    summary="summary",
+                    timestamp=self.transcript.timestamp,
+                    duration=self.transcript.duration,
+                    transcript=self.transcript,
+                )
+            )
+
+    reported = []
+
+    async def on_topic(topic):
+        reported.append(topic.timestamp)
+
+    with patch(
+        "reflector.pipelines.topic_processing.TranscriptTopicDetectorProcessor",
+        FakeTopicDetector,
+    ):
+        topics = await detect_topics(
+            make_transcript(6),
+            "en",
+            on_topic_callback=on_topic,
+            empty_pipeline=EmptyPipeline(structlog.get_logger()),
+            concurrency=3,
+        )
+
+    timestamps = [topic.timestamp for topic in topics]
+    assert timestamps == sorted(timestamps)
+    assert reported == timestamps
+    assert max_running == 3
@@ -0,0 +1,53 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from reflector.db.transcripts import (
+    TranscriptEvent,
+    TranscriptOwnerCache,
+    transcripts_controller,
+)
+from reflector.hatchet.broadcast import broadcast_event
+
+
+def test_owner_cache_expires_and_evicts():
+    cache = TranscriptOwnerCache(maxsize=2, ttl=60)
+    assert cache.get("a") == (False, None)
+
+    cache.set("a", "alice")
+    cache.set("b", None)
+    assert cache.get("b") == (True, None)
+    assert cache.get("a") == (True, "alice")
+
+    # "a" was used last, so "b" goes first
+    cache.set("c", "carol")
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, "alice")
+
+    cache.invalidate("a")
+    assert cache.get("a") == (False, None)
+
+    expired = TranscriptOwnerCache(ttl=-1)
+    expired.set("a", "alice")
+    assert expired.get("a") == (False, None)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_routes_user_room_without_database():
+    ws_manager = MagicMock(send_json=AsyncMock())
+    event = TranscriptEvent(event="STATUS", data={"value": "ended"})
+    transcripts_controller.owners.set("transcript-1", "user-1")
+
+    with (
+        patch("reflector.hatchet.broadcast.get_ws_manager", return_value=ws_manager),
+        patch("reflector.db.transcripts.get_database") as get_database,
+    ):
+        await broadcast_event("transcript-1", event, logger=MagicMock())
+        await broadcast_event(
+            "transcript-2", event, logger=MagicMock(), user_id="user-2"
+        )
+
+    get_database.assert_not_called()
+    rooms = [call.kwargs["room_id"] for call in ws_manager.send_json.await_args_list]
+    assert rooms == ["ts:transcript-1", "user:user-1", "ts:transcript-2", "user:user-2"]
+    transcripts_controller.owners.invalidate("transcript-1")
@@ -149,6 +149,37 @@ async def test_transcripts_list_authenticated(authenticated_client, client):
     assert "testxx2" in names
 
 
+@pytest.mark.asyncio
+async def test_transcripts_list_cursor(authenticated_client, client):
+    for i in range(5):
+        response = await client.post("/transcripts", json={"name": f"cursor{i}"})
+        assert response.status_code == 200
+
+    response = await client.get("/transcripts", params={"size": 100})
+    expected = [t["id"] for t in response.json()["items"]]
+
+    ids = []
+    cursor = None
+    while True:
+        params = {"size": 2, "count": "exact"}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("/transcripts/cursor", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        assert page["total"] == len(expected)
+        ids += [t["id"] for t in page["items"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    # same order as the offset listing, without duplicates or gaps
+    assert ids == expected
+
+    response = await client.get("/transcripts/cursor", params={"cursor": "nope"})
+    assert response.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_transcript_delete(authenticated_client, client):
     response = await client.post("/transcripts", json={"name": "testdel1"})
@@ -120,3 +120,99 @@ async def test_transcript_delete_with_audio(
 
     response = await client.get(f"/transcripts/{fake_transcript.id}")
     assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_transcript_audio_download_not_modified(fake_transcript, client):
+    url = f"/transcripts/{fake_transcript.id}/audio/mp3"
+    response = await client.get(url)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = await client.get(url, headers={"if-none-match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    # a stale if-range ignores the range and sends the whole file
+    response = await client.get(
+        url, headers={"range": "bytes=0-100", "if-range": '"stale"'}
+    )
+    assert response.status_code == 200
+
+
+@pytest.fixture
+async def storage_transcript(fake_transcript, dummy_storage, monkeypatch):
+    from reflector.settings import settings
+    from reflector.views.transcripts import transcripts_controller
+
+    monkeypatch.setattr(settings, "TRANSCRIPT_STORAGE_BACKEND", "aws")
+    await transcripts_controller.update(fake_transcript, {"audio_location": "storage"})
+    yield fake_transcript
+
+
+@pytest.mark.asyncio
+async def test_transcript_audio_download_storage_proxy(
+    storage_transcript, client, httpx_mock
+):
+    httpx_mock.add_response(
+        url="http://fake_server/audio.mp3",
+        match_headers={"range": "bytes=100-199", "if-range": '"abc"'},
+        status_code=206,
+        headers={
+            "content-type": "audio/mpeg",
+            "content-range": "bytes 100-199/1000",
+            "etag": '"abc"',
+            "x-amz-request-id": "internal",
+        },
+        content=b"x" * 100,
+    )
+
+    from reflector.views._proxy_response import proxy_client_pool
+
+    proxy_client = proxy_client_pool.get("http://fake_server/audio.mp3")
+
+    response = await client.get(
+        f"/transcripts/{storage_transcript.id}/audio/mp3",
+        headers={"range": "bytes=100-199", "if-range": '"abc"'},
+    )
+    assert response.status_code == 206
+    assert response.content == b"x" * 100
+    assert response.headers["content-range"] == "bytes 100-199/1000"
+    assert response.headers["etag"] == '"abc"'
+    assert "x-amz-request-id" not in response.headers
+
+    # the download went through the pooled client, which stays open
+    assert proxy_client_pool.get("http://fake_server/audio.mp3") is proxy_client
+    assert not proxy_client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_transcript_audio_download_storage_not_modified(
+    storage_transcript, client, httpx_mock
+):
+    httpx_mock.add_response(
+        url="http://fake_server/audio.mp3",
+        match_headers={"if-none-match": '"abc"'},
+        status_code=304,
+        headers={"etag": '"abc"'},
+    )
+
+    response = await client.get(
+        f"/transcripts/{storage_transcript.id}/audio/mp3",
+        headers={"if-none-match": '"abc"'},
+    )
+    assert response.status_code == 304
+    assert response.headers["etag"] == '"abc"'
+
+
+@pytest.mark.asyncio
+async def test_transcript_audio_download_storage_redirect(
+    storage_transcript, client, monkeypatch
+):
+    from reflector.settings import settings
+
+    monkeypatch.setattr(settings, "TRANSCRIPT_AUDIO_REDIRECT", True)
+
+    response = await client.get(f"/transcripts/{storage_transcript.id}/audio/mp3")
+    assert response.status_code == 307
+    assert response.headers["location"] == "http://fake_server/audio.mp3"
@@ -0,0 +1,198 @@
+"""Tests for row-per-item storage of transcript events and topics."""
+
+import pytest
+
+from reflector.db import get_database
+from reflector.db.transcripts import (
+    SourceKind,
+    StrValue,
+    Transcript,
+    TranscriptHeader,
+    TranscriptTopic,
+    transcript_events,
+    transcript_topics,
+    transcripts,
+    transcripts_controller,
+)
+
+
+@pytest.mark.asyncio
+async def test_append_event_inserts_single_row():
+    transcript = await transcripts_controller.add(
+        name="Test", source_kind=SourceKind.LIVE
+    )
+
+    await transcripts_controller.append_event(
+        transcript, event="STATUS", data=StrValue(value="recording")
+    )
+    await transcripts_controller.append_event(
+        transcript, event="STATUS", data=StrValue(value="processing")
+    )
+
+    rows = await get_database().fetch_all(
+        transcript_events.select().where(
+            transcript_events.c.transcript_id == transcript.id
+        )
+    )
+    assert len(rows) == 2
+
+    # the events column itself is not rewritten
+    row = await get_database().fetch_one(
+        transcripts.select().where(transcripts.c.id == transcript.id)
+    )
+    assert row["events"] == []
+
+    loaded = await transcripts_controller.get_by_id(transcript.id)
+    assert [e.data["value"] for e in loaded.events] == ["recording", "processing"]
+
+
+@pytest.mark.asyncio
+async def test_append_event_and_upsert_topic_advance_change_seq():
+    transcript = await transcripts_controller.add(
+        name="Test", source_kind=SourceKind.LIVE, user_id="user-1"
+    )
+
+    await transcripts_controller.append_event(
+        transcript, event="STATUS", data=StrValue(value="recording")
+    )
+    change_seq = transcript.change_seq
+    assert change_seq is not None
+
+    await transcripts_controller.upsert_topic(
+        transcript,
+        TranscriptTopic(id="t0", title="Topic", summary="", timestamp=0),
+        update_webvtt=False,
+    )
+    assert transcript.change_seq > change_seq
+    change_seq = transcript.change_seq
+
+    await transcripts_controller.append_event(
+        transcript, event="STATUS", data=StrValue(value="processing")
+    )
+    assert transcript.change_seq > change_seq
+
+    # pollers following change_seq see the transcript again
+    changed = await transcripts_controller.get_all(
+        user_id="user-1", change_seq_from=change_seq
+    )
+    assert [row["id"] for row in changed] == [transcript.id]
+    assert changed[0]["change_seq"] == transcript.change_seq
+
+
+@pytest.mark.asyncio
+async def test_upsert_topic_keeps_order_and_updates_in_place():
+    transcript = await transcripts_controller.add(
+        name="Test", source_kind=SourceKind.LIVE
+    )
+
+    for i in range(3):
+        await transcripts_controller.upsert_topic(
+            transcript,
+            TranscriptTopic(id=f"t{i}", title=f"Topic {i}", summary="", timestamp=i),
+        )
+    await transcripts_controller.upsert_topic(
+        transcript,
+        TranscriptTopic(id="t1", title="Updated", summary="", timestamp=1),
+    )
+
+    loaded = await transcripts_controller.get_by_id(transcript.id)
+    assert [t.id for t in loaded.topics] == ["t0", "t1", "t2"]
+    assert loaded.topics[1].title == "Updated"
+
+
+@pytest.mark.asyncio
+async def test_update_replaces_events_and_topics():
+    transcript = await transcripts_controller.add(
+        name="Test", source_kind=SourceKind.LIVE
+    )
+    await transcripts_controller.upsert_topic(
+        transcript, TranscriptTopic(id="old", title="Old", summary="", timestamp=0)
+    )
+    await transcripts_controller.append_event(
+        transcript, event="STATUS", data=StrValue(value="recording")
+    )
+
+    await transcripts_controller.update(transcript, {"events": [], "topics": []})
+
+    loaded = await transcripts_controller.get_by_id(transcript.id)
+    assert loaded.events == []
+    assert loaded.topics == []
+
+
+@pytest.mark.asyncio
+async def test_legacy_json_columns_are_merged_on_read():
+    transcript = await transcripts_controller.add(
+        name="Test", source_kind=SourceKind.LIVE
+    )
+    legacy_topic = TranscriptTopic(id="legacy", title="Legacy", summary="", timestamp=0)
+    await get_database().execute(
+        transcripts.update()
+        .where(transcripts.c.id == transcript.id)
+        .values(
+            topics=[legacy_topic.model_dump(mode="json")],
+            events=[{"event": "STATUS", "data": {"value": "idle"}}],
+        )
+    )
+
+    transcript = await transcripts_controller.get_by_id(transcript.id)
+    await transcripts_controller.upsert_topic(
+        transcript, TranscriptTopic(id="new", title="New", summary="", timestamp=1)
+    )
+    await transcripts_controller.append_event(
+        transcript, event="STATUS", data=StrValue(value="recording")
+    )
+
+    loaded = await transcripts_controller.get_by_id(transcript.id)
+    assert [t.id for t in loaded.topics] == ["legacy", "new"]
+    assert [e.data["value"] for e in loaded.events] == ["idle", "recording"]
+
+
+@pytest.mark.asyncio
+async def test_remove_by_id_deletes_events_and_topics():
+    transcript = await transcripts_controller.add(
+        name="Test", source_kind=SourceKind.LIVE
+    )
+    await transcripts_controller.upsert_topic(
+        transcript, TranscriptTopic(id="t0", title="T", summary="", timestamp=0)
+    )
+    await transcripts_controller.append_event(
+        transcript, event="STATUS", data=StrValue(value="recording")
+    )
+
+    await transcripts_controller.remove_by_id(transcript.id)
+
+    for table in (transcript_events, transcript_topics):
+        rows = await get_database().fetch_all(
+            table.select().where(table.c.transcript_id == transcript.id)
+        )
+        assert rows == []
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_header_fields():
+    transcript = await transcripts_controller.add(
+        name="Test", source_kind=SourceKind.LIVE, user_id="user-1"
+    )
+    await transcripts_controller.upsert_topic(
+        transcript, TranscriptTopic(id="t0", title="T", summary="", timestamp=0)
+    )
+
+    header = await transcripts_controller.get_by_id(
+        transcript.id, fields=TranscriptHeader
+    )
+    assert type(header) is TranscriptHeader
+    assert header.user_id == "user-1"
+    assert not hasattr(header, "topics")
+
+    # events can still be appended and statuses changed without the topics
+    await transcripts_controller.set_status(transcript.id, "processing")
+    loaded = await transcripts_controller.get_by_id(transcript.id)
+    assert isinstance(loaded, Transcript)
+    assert loaded.status == "processing"
+    assert [e.data["value"] for e in loaded.events] == ["processing"]
+    assert [t.id for t in loaded.topics] == ["t0"]
+
+    http_header = await transcripts_controller.get_by_id_for_http(
+        transcript.id, user_id="user-1", fields=TranscriptHeader
+    )
+    assert http_header.id == transcript.id
@@ -0,0 +1,119 @@
+from fractions import Fraction
+
+import av
+import numpy as np
+import pytest
+from av.audio.resampler import AudioResampler
+
+from reflector.utils.audio_mixdown import build_mixdown_graph, mixdown_tracks_pyav
+
+
+def make_track(path, seconds: float, freq: float, rate: int = 48000):
+    container = av.open(str(path), "w")
+    stream = container.add_stream("pcm_s16le", rate=rate)
+    stream.layout = "mono"
+    t = np.arange(int(seconds * rate))
+    data = (np.sin(2 * np.pi * freq * t / rate) * 8000).astype(np.int16)
+    for i in range(0, len(data), 1024):
+        frame = av.AudioFrame.from_ndarray(
+            data[None, i : i + 1024], format="s16", layout="mono"
+        )
+        frame.sample_rate = rate
+        for packet in stream.encode(frame):
+            container.mux(packet)
+    for packet in stream.encode(None):
+        container.mux(packet)
+    container.close()
+    return str(path)
+
+
+class CollectWriter:
+    def __init__(self):
+        self.parts = []
+
+    async def push(self, frame):
+        self.parts.append(frame.to_ndarray().copy())
+
+    def samples(self) -> np.ndarray:
+        return np.concatenate(self.parts, axis=1)
+
+
+async def sequential_mixdown(track_urls, writer, target_sample_rate, delays_ms):
+    """Single-threaded round-robin decode, as done before parallel decoding"""
+    _, inputs, sink = build_mixdown_graph(target_sample_rate, delays_ms)
+    containers = [av.open(url) for url in track_urls]
+    decoders = [c.decode(audio=0) for c in containers]
+    resamplers = [
+        AudioResampler(format="s32", layout="stereo", rate=target_sample_rate)
+        for _ in decoders
+    ]
+    active = [True] * len(decoders)
+
+    async def pull():
+        while True:
+            try:
+                mixed = sink.pull()
+            except Exception:
+                break
+            await writer.push(mixed)
+
+    while any(active):
+        for i, dec in enumerate(decoders):
+            if not active[i]:
+                continue
+            frame = next(dec, None)
+            if frame is None:
+                active[i] = False
+                inputs[i].push(None)
+                continue
+            for rf in resamplers[i].resample(frame) or []:
+                rf.sample_rate = target_sample_rate
+                rf.time_base = Fraction(1, target_sample_rate)
+                inputs[i].push(rf)
+            await pull()
+    await pull()
+    for c in containers:
+        c.close()
+
+
+@pytest.fixture
+def tracks(tmp_path):
+    return [
+        make_track(tmp_path / f"track{i}.wav", seconds, freq)
+        for i, (seconds, freq) in enumerate([(2.0, 440), (3.3, 660), (1.1, 220)])
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_workers", [1, 2, 4])
+@pytest.mark.parametrize("offsets", [None, [0.0, 0.5, 1.25]])
+async def test_parallel_mixdown_matches_sequential(tracks, max_workers, offsets):
+    delays_ms = [0, 0, 0] if offsets is None else [0, 500, 1250]
+    expected = CollectWriter()
+    await sequential_mixdown(tracks, expected, 48000, delays_ms)
+
+    writer = CollectWriter()
+    await mixdown_tracks_pyav(
+        tracks,
+        writer,
+        48000,
+        offsets_seconds=offsets,
+        max_workers=max_workers,
+        queue_size=2,
+    )
+
+    np.testing.assert_array_equal(writer.samples(), expected.samples())
+
+
+@pytest.mark.asyncio
+async def test_mixdown_resamples_mismatched_sample_rate(tmp_path):
+    tracks = [
+        make_track(tmp_path / "a.wav", 1.0, 440, rate=48000),
+        make_track(tmp_path / "b.wav", 2.0, 440, rate=16000),
+    ]
+
+    writer = CollectWriter()
+    await mixdown_tracks_pyav(tracks, writer, 48000)
+
+    # the 16kHz track is resampled instead of being dropped
+    assert writer.samples().shape[1] == pytest.approx(2 * 2 * 48000, rel=0.01)
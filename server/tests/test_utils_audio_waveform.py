@@ -0,0 +1,53 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from reflector.utils.audio_waveform import (
+    WaveformReducer,
+    get_audio_waveform,
+    get_audio_waveforms,
+)
+
+
+def reference_peaks(data: np.ndarray, chunk_size: int) -> list[float]:
+    """Per-segment loop the reducer replaces"""
+    volumes = [
+        np.abs(data[i : i + chunk_size]).max()
+        for i in range(0, len(data) - chunk_size + 1, chunk_size)
+    ]
+    volumes = np.array(volumes, dtype=np.float64)
+    return np.round(volumes / volumes.max(), 2).tolist()
+
+
+@pytest.mark.parametrize("block_size", [7, 100, 4096])
+@pytest.mark.parametrize("piece_size", [1, 33, 1000])
+def test_reducer_matches_reference_across_blocks(block_size, piece_size):
+    rng = np.random.default_rng(0)
+    data = rng.integers(-32768, 32767, size=10_000, dtype=np.int16)
+
+    reducer = WaveformReducer(
+        total_samples=len(data), resolutions=[10, 255], block_size=block_size
+    )
+    for i in range(0, len(data), piece_size):
+        reducer.push(data[i : i + piece_size])
+
+    assert reducer.peaks(10) == reference_peaks(data, 1000)
+    assert reducer.peaks(255) == reference_peaks(data, 10_000 // 255)
+
+
+def test_reducer_rms():
+    data = np.concatenate([np.full(100, 0.5), np.full(100, -1.0)]).astype(np.float32)
+    reducer = WaveformReducer(total_samples=len(data), resolutions=[2])
+    reducer.push(data)
+    assert reducer.rms(2) == [0.5, 1.0]
+
+
+def test_get_audio_waveforms_multi_resolution():
+    path = Path(__file__).parent / "records" / "test_mathieu_hello.wav"
+
+    waveforms = get_audio_waveforms(path, [10, 255])
+
+    assert len(waveforms[10]) == 10
+    assert waveforms[255] == get_audio_waveform(path, 255)
+    assert max(waveforms[255]) == 1.0
@@ -3,7 +3,11 @@
 import pytest
 
 from reflector.processors.types import Transcript, Word, words_to_segments
-from reflector.utils.webvtt import topics_to_webvtt, words_to_webvtt
+from reflector.utils.webvtt import (
+    append_topic_webvtt,
+    topics_to_webvtt,
+    words_to_webvtt,
+)
 
 
 class TestWordsToWebVTT:
@@ -127,6 +131,66 @@ class TestTopicsToWebVTT:
         assert "Second and First" in str(exc_info.value)
 
 
+class TestAppendTopicWebVTT:
+    """Test append_topic_webvtt function."""
+
+    class MockTopic:
+        def __init__(self, words):
+            self.words = words
+
+    def test_matches_full_render(self):
+        """Should render appended topics the same as all topics at once."""
+
+        topics = [
+            self.MockTopic(
+                [
+                    Word(text="Hello", start=0.0, end=0.5, speaker=0),
+                    Word(text=" there.", start=0.5, end=1.0, speaker=0),
+                    Word(text=" How", start=1.2, end=1.5, speaker=1),
+                ]
+            ),
+            # continues the last segment of the previous topic
+            self.MockTopic(
+                [
+                    Word(text=" are", start=1.5, end=1.8, speaker=1),
+                    Word(text=" you?", start=1.8, end=2.2, speaker=1),
+                ]
+            ),
+            self.MockTopic([]),
+            self.MockTopic(
+                [
+                    Word(text=" Fine", start=3.0, end=3.4, speaker=0),
+                    Word(text=" thanks", start=3.4, end=3.9, speaker=0),
+                ]
+            ),
+        ]
+
+        content = topics_to_webvtt([])
+        for i, topic in enumerate(topics):
+            content = append_topic_webvtt(content, topics[:i], topic)
+            assert content == topics_to_webvtt(topics[: i + 1])
+
+    def test_mismatching_content_renders_all(self):
+        """Should render all topics when the content is not theirs."""
+
+        previous = self.MockTopic([Word(text="Hello", start=0.0, end=0.5, speaker=0)])
+        topic = self.MockTopic([Word(text=" world", start=0.5, end=1.0, speaker=0)])
+        stale = words_to_webvtt([Word(text="Bye", start=0.0, end=0.5, speaker=0)])
+
+        assert append_topic_webvtt(stale, [previous], topic) == topics_to_webvtt(
+            [previous, topic]
+        )
+
+    def test_non_sequential_topic_raises_assertion(self):
+        """Should raise like topics_to_webvtt when words go back in time."""
+
+        previous = self.MockTopic([Word(text="Second", start=1.0, end=1.5, speaker=0)])
+        topic = self.MockTopic([Word(text="First", start=0.0, end=0.5, speaker=1)])
+
+        with pytest.raises(AssertionError):
+            append_topic_webvtt(topics_to_webvtt([previous]), [previous], topic)
+
+
 class TestTranscriptWordsToSegments:
     """Test static words_to_segments method (TDD for making it static)."""
 
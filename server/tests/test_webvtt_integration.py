@@ -232,3 +232,48 @@ class TestWebVTTAutoUpdate:
 
         finally:
             await controller.remove_by_id(transcript.id)
+
+    async def test_webvtt_rebuilt_when_diarization_fails(self):
+        """A failed diarization still leaves the WebVTT of the stored topics."""
+        from reflector.pipelines.main_live_pipeline import PipelineMainDiarization
+
+        controller = TranscriptController()
+        transcript = await controller.add(
+            name="Test Transcript",
+            source_kind=SourceKind.FILE,
+        )
+
+        class FailingDiarization(PipelineMainDiarization):
+            async def create(self):
+                raise RuntimeError("diarization failed")
+
+        try:
+            topic = TranscriptTopic(
+                title="Topic",
+                summary="Summary",
+                timestamp=0.0,
+                transcript="Hello world",
+                words=[
+                    Word(text="Hello", start=0.0, end=0.5, speaker=0),
+                    Word(text=" world", start=0.5, end=1.0, speaker=0),
+                ],
+            )
+            await controller.upsert_topic(transcript, topic)
+
+            # diarized before the failure, WebVTT deferred to the pipeline end
+            topic.words = [
+                Word(text="Hello", start=0.0, end=0.5, speaker=1),
+                Word(text=" world", start=0.5, end=1.0, speaker=1),
+            ]
+            await controller.upsert_topic(transcript, topic, update_webvtt=False)
+
+            with pytest.raises(RuntimeError):
+                await FailingDiarization(transcript.id).run()
+
+            result = await get_database().fetch_one(
+                transcripts.select().where(transcripts.c.id == transcript.id)
+            )
+            assert "<v Speaker1>" in result["webvtt"]
+            assert "<v Speaker0>" not in result["webvtt"]
+        finally:
+            await controller.remove_by_id(transcript.id)
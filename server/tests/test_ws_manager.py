@@ -0,0 +1,99 @@
+import asyncio
+
+from reflector.ws_manager import (
+    WS_CLOSE_SLOW_CONSUMER,
+    WebsocketManager,
+    WebsocketSender,
+)
+
+
+class FakeWebsocket:
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+        self.received: list[str] = []
+        self.close_code: int | None = None
+        self.close_calls = 0
+
+    async def accept(self, subprotocol=None):
+        pass
+
+    async def send_text(self, text: str):
+        await asyncio.sleep(self.delay)
+        self.received.append(text)
+
+    async def close(self, code: int = 1000):
+        self.close_calls += 1
+        self.close_code = code
+
+
+class FakeSubscriber:
+    async def get_message(self, ignore_subscribe_messages=True, timeout=None):
+        await asyncio.sleep(timeout or 0)
+        return None
+
+
+class FakePubSub:
+    async def connect(self):
+        pass
+
+    async def subscribe(self, room_id):
+        return FakeSubscriber()
+
+    async def unsubscribe(self, room_id):
+        pass
+
+
+async def test_slow_websocket_does_not_delay_others():
+    manager = WebsocketManager(pubsub_client=FakePubSub(), queue_size=10)
+    fast, slow = FakeWebsocket(), FakeWebsocket(delay=10)
+    await manager.add_user_to_room("room", fast)
+    await manager.add_user_to_room("room", slow)
+
+    for i in range(3):
+        manager.broadcast("room", f'{{"n": {i}}}')
+    await asyncio.sleep(0.05)
+
+    assert fast.received == ['{"n": 0}', '{"n": 1}', '{"n": 2}']
+    assert slow.received == []
+
+    await manager.remove_user_from_room("room", fast)
+    await manager.remove_user_from_room("room", slow)
+    assert manager.rooms == {}
+    assert manager.tasks == {}
+
+
+async def test_slow_consumer_policies():
+    manager = WebsocketManager(
+        pubsub_client=FakePubSub(), queue_size=1, slow_consumer_policy="drop"
+    )
+    dropping = FakeWebsocket(delay=10)
+    await manager.add_user_to_room("room", dropping)
+    manager.slow_consumer_policy = "disconnect"
+    disconnected = FakeWebsocket(delay=10)
+    await manager.add_user_to_room("room", disconnected)
+
+    # the first message is being sent, the second is queued
+    for i in range(3):
+        manager.broadcast("room", str(i))
+        await asyncio.sleep(0)
+    await asyncio.sleep(0.01)
+
+    assert dropping.close_code is None
+    assert disconnected.close_code == WS_CLOSE_SLOW_CONSUMER
+
+    await manager.remove_user_from_room("room", dropping)
+    await manager.remove_user_from_room("room", disconnected)
+
+
+async def test_disconnect_policy_closes_websocket_once():
+    websocket = FakeWebsocket(delay=10)
+    sender = WebsocketSender(websocket, queue_size=1, policy="disconnect")
+    await asyncio.sleep(0)
+
+    # the sender task has not seen its cancellation yet
+    for i in range(4):
+        sender.push(str(i))
+    await sender.close_task
+
+    assert websocket.close_code == WS_CLOSE_SLOW_CONSUMER
+    assert websocket.close_calls == 1